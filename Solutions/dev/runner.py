@@ -18,6 +18,12 @@ from util.subparsers import test as testSubparser
 from util.subparsers import package as packageSubparser
 from util.subparsers import validate as validateSubparser
 from util.subparsers import template as templateSubparser
+from util.subparsers import calibrate as calibrateSubparser
+from util.subparsers import history as historySubparser
+from util.subparsers import bench as benchSubparser
+from util.subparsers import matrix as matrixSubparser
+from util.subparsers import stress as stressSubparser
+from util.subparsers import generate as generateSubparser
 
 def parse_arguments(arguments, output=sys.stdout):
     argParser = PCArgParseFactory.get_argument_parser(output)
@@ -39,6 +45,12 @@ def parse_arguments(arguments, output=sys.stdout):
     packageSubparser.add_to_subparser_object(subparsers, baseParser)
     validateSubparser.add_to_subparser_object(subparsers, baseParser)
     templateSubparser.add_to_subparser_object(subparsers, baseParser)
+    calibrateSubparser.add_to_subparser_object(subparsers, baseParser)
+    historySubparser.add_to_subparser_object(subparsers, baseParser)
+    benchSubparser.add_to_subparser_object(subparsers, baseParser)
+    matrixSubparser.add_to_subparser_object(subparsers, baseParser)
+    stressSubparser.add_to_subparser_object(subparsers, baseParser)
+    generateSubparser.add_to_subparser_object(subparsers, baseParser)
 
     if len(arguments) == 0:
         argParser.print_help()
@@ -52,7 +64,7 @@ def parse_arguments(arguments, output=sys.stdout):
                 return None
 
             if args.func:
-                args.func(args)
+                args.exitCode = args.func(args)
 
         except Exception as e:
             print(str(e))
@@ -71,5 +83,9 @@ def main(arguments, out=sys.stdout):
         out.write(e.message)
         return 1
 
+    # Subparsers may return an exit code, such as test when cases regress
+    if not parsedArgs is None:
+        return parsedArgs.exitCode
+
 if __name__ == '__main__':
     sys.exit(main(sys.argv[1:]))
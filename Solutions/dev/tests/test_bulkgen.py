@@ -0,0 +1,154 @@
+################################################################################
+# Filename: tests/test_bulkgen.py
+# Date:     16 October 2026
+#
+# Contains tests for util/bulkgen.py
+################################################################################
+import io
+import json
+import os
+import tempfile
+import unittest
+from util import bulkgen, fileops
+from util.perror import PyCException
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+def _get_json(jsonData, chunkLength: int=3):
+    openFile = io.StringIO()
+    fileops.write_json(openFile, jsonData, chunkLength)
+    return json.loads(openFile.getvalue())
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestBulkGen(unittest.TestCase):
+
+    def test_write_json_chunks(self):
+        """
+        Ensure arrays are written chunk by chunk as the JSON of their lists
+        """
+        values = numpy.arange(10)
+        self.assertEqual(_get_json(values), list(range(10)))
+        self.assertEqual(_get_json(values.reshape(5, 2)), values.reshape(5,
+            2).tolist())
+        self.assertEqual(_get_json([1, values, {'a' : values[:2]}] * 2),
+                [1, list(range(10)), {'a' : [0, 1]}] * 2)
+        self.assertEqual(_get_json(list(range(7))), list(range(7)))
+
+    def test_generate_is_seeded(self):
+        """
+        Ensure the same seed and parameters build the same input
+        """
+        for name, params in bulkgen.BENCHMARK_PARAMS.items():
+            self.assertEqual(_get_json(bulkgen.generate(name, 3, params(100))),
+                    _get_json(bulkgen.generate(name, 3, params(100))))
+        self.assertNotEqual(_get_json(bulkgen.generate('array', 1,
+            {'n' : 100})), _get_json(bulkgen.generate('array', 2,
+                {'n' : 100})))
+
+    def test_array(self):
+        """
+        Ensure arrays respect their bounds, distinctness and order
+        """
+        inputJson = bulkgen.generate('array', 1, {'n' : 1000, 'low' : -5,
+            'high' : 5})
+        self.assertEqual(inputJson['n'], 1000)
+        self.assertEqual(len(inputJson['values']), 1000)
+        self.assertTrue(-5 <= inputJson['values'].min() <=
+                inputJson['values'].max() <= 5)
+
+        values = bulkgen.generate('array', 1, {'n' : 50, 'high' : 49,
+            'distinct' : True, 'sort' : True})['values']
+        self.assertEqual(values.tolist(), list(range(50)))
+
+        with self.assertRaises(PyCException):
+            bulkgen.generate('array', 1, {'n' : 51, 'high' : 49,
+                'distinct' : True})
+
+        values = bulkgen.generate('array', 1, {'n' : 10 ** 5, 'low' : 1,
+            'high' : 3 * 10 ** 5, 'distinct' : True})['values']
+        self.assertEqual(len(numpy.unique(values)), 10 ** 5)
+        self.assertTrue(1 <= values.min() <= values.max() <= 3 * 10 ** 5)
+        self.assertFalse((numpy.diff(values) > 0).all())
+
+    def test_permutation(self):
+        """
+        Ensure permutations hold every number of 1 to n once
+        """
+        values = bulkgen.generate('permutation', 1, {'n' : 100})['values']
+        self.assertEqual(sorted(values.tolist()), list(range(1, 101)))
+
+    def test_tree(self):
+        """
+        Ensure trees have n - 1 edges that join every vertex
+        """
+        n = 200
+        edges = bulkgen.generate('tree', 4, {'n' : n, 'weights' : [1, 9]})[
+                'edges']
+        self.assertEqual(edges.shape, (n - 1, 3))
+        self.assertTrue(1 <= edges[:, 2].min() <= edges[:, 2].max() <= 9)
+        self.assertEqual(_get_component_count(n, edges), 1)
+
+    def test_graph(self):
+        """
+        Ensure graphs have m edges without self loops, repeats when simple or
+        separate components when connected
+        """
+        n = 30
+        edges = bulkgen.generate('graph', 2, {'n' : n, 'm' : 400,
+            'simple' : True, 'connected' : True})['edges']
+        self.assertEqual(len(edges), 400)
+        self.assertTrue((edges[:, 0] != edges[:, 1]).all())
+        self.assertTrue(1 <= edges.min() <= edges.max() <= n)
+        self.assertEqual(len({tuple(sorted(edge)) for edge in
+            edges.tolist()}), 400)
+        self.assertEqual(_get_component_count(n, edges), 1)
+
+        with self.assertRaises(PyCException):
+            bulkgen.generate('graph', 2, {'n' : n, 'm' : n * n,
+                'simple' : True})
+        with self.assertRaises(PyCException):
+            bulkgen.generate('graph', 2, {'n' : n, 'm' : 5,
+                'connected' : True})
+
+    def test_string(self):
+        """
+        Ensure strings only use their alphabet
+        """
+        text = bulkgen.generate('string', 1, {'n' : 500, 'alphabet' : 'ab'})[
+                'text']
+        self.assertEqual(len(text), 500)
+        self.assertEqual(set(text), {'a', 'b'})
+
+    def test_generate_errors(self):
+        """
+        Ensure unknown generators and parameters raise PyCExceptions
+        """
+        with self.assertRaises(PyCException):
+            bulkgen.generate('unknown', 1, {})
+        with self.assertRaises(PyCException):
+            bulkgen.generate('array', 1, {'size' : 5})
+
+    def test_benchmark(self):
+        """
+        Ensure the benchmark times every library generator and the Python
+        array at every size
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            rows = bulkgen.benchmark([10, 100], os.path.join(directory,
+                'benchmark.json'))
+        self.assertEqual([row[:2] for row in rows], [(name, size) for size in
+            [10, 100] for name in sorted(bulkgen.LIBRARY) + ['python array']])
+        self.assertTrue(all(row[2] >= 0 and row[3] >= 0 for row in rows))
+
+def _get_component_count(n: int, edges) -> int:
+    parents = list(range(n + 1))
+    def find(vertex):
+        while parents[vertex] != vertex:
+            parents[vertex] = parents[parents[vertex]]
+            vertex = parents[vertex]
+        return vertex
+    for u, v in edges[:, :2].tolist():
+        parents[find(u)] = find(v)
+    return len({find(vertex) for vertex in range(1, n + 1)})
@@ -0,0 +1,103 @@
+################################################################################
+# Filename: tests/test_calibrate.py
+# Date:     16 October 2026
+#
+# Contains tests for util/subparsers/calibrate.py
+################################################################################
+import os
+import sys
+import unittest
+from unittest import mock
+from util.language import AppliedLanguage, ExecutionResult, Language
+from util.limits import Limits
+from util.subparsers import calibrate
+from util.subparsers.calibrate import SolutionMeasurement, \
+        MAX_MEMORY_DOUBLINGS, MINIMUM_MEMORY_BYTES, _get_proposed_limits, \
+        _get_verified_memory_limit, _is_memory_limited
+
+class TestCalibrate(unittest.TestCase):
+
+    def _get_measurement(self, cpuTime, peakMemory):
+        measurement = SolutionMeasurement(None)
+        measurement.add(ExecutionResult('', cpuTime=cpuTime, wallTime=cpuTime,
+            peakMemory=peakMemory))
+        return measurement
+
+    def test_measurement_add(self):
+        """
+        Ensure SolutionMeasurement.add keeps the worst measurements
+        """
+        measurement = self._get_measurement(0.5, 100)
+        measurement.add(ExecutionResult('', cpuTime=0.2, peakMemory=300))
+        self.assertEqual(measurement.cpuTime, 0.5)
+        self.assertEqual(measurement.peakMemory, 300)
+
+    def test_get_proposed_limits(self):
+        """
+        Ensure _get_proposed_limits multiplies the fastest and largest
+        solutions, rounding up
+        """
+        measurements = [self._get_measurement(0.42, 100 << 20),
+                        self._get_measurement(1.5, (50 << 20) + 1)]
+        self.assertEqual(_get_proposed_limits(measurements, True, 3, 2),
+                {'cpuSeconds' : 1.3, 'memoryBytes' : 200 << 20})
+
+    def test_get_proposed_limits_minimum(self):
+        """
+        Ensure _get_proposed_limits never proposes limits below the minimums
+        and only proposes memory limits when asked to
+        """
+        self.assertEqual(_get_proposed_limits([self._get_measurement(0, 0)],
+            False, 3, 2), {'cpuSeconds' : 0.1})
+        self.assertEqual(_get_proposed_limits([self._get_measurement(0, 0)],
+            True, 3, 2)['memoryBytes'], MINIMUM_MEMORY_BYTES)
+
+    @unittest.skipIf(not os.path.isfile('/proc/self/status'),
+            'Peak memory is only sampled from /proc')
+    def test_get_proposed_limits_large_runner(self):
+        """
+        Ensure the proposed memory limit follows the memory of the solutions
+        rather than that of the process calibrating them
+        """
+        language = AppliedLanguage('Python', runCommand=sys.executable,
+                runArguments=['-c', 'print(1)'], path='Problem1.py')
+        runnerData = b'x' * (300 << 20)
+        measurement = SolutionMeasurement(None)
+        measurement.add(language.run_code(''))
+        del runnerData
+        self.assertGreater(measurement.peakMemory, 0)
+        self.assertLess(_get_proposed_limits([measurement], True, 3, 2)[
+            Limits.MEMORY_BYTES_KEY], 100 << 20)
+
+    def test_is_memory_limited(self):
+        """
+        Ensure only languages that leave their memory unlimited keep it so
+        """
+        self.assertTrue(_is_memory_limited(Language('Python')))
+        self.assertTrue(_is_memory_limited(Language('Python',
+            limits={'cpuSeconds' : 1})))
+        self.assertFalse(_is_memory_limited(Language('Java',
+            limits={'memoryBytes' : None})))
+
+    def test_get_verified_memory_limit(self):
+        """
+        Ensure memory limits are doubled until every accepted solution runs
+        within them, or dropped if none of them is enough
+        """
+        measurements = [self._get_measurement(0.1, 1 << 20) for _ in
+                range(2)]
+        def measure(solution, cases, runCount, verbose, memoryBytes):
+            measurement = SolutionMeasurement(solution)
+            measurement.accepted = memoryBytes >= requiredBytes
+            return measurement
+
+        with mock.patch.object(calibrate, '_measure_solution', measure):
+            requiredBytes = 300
+            self.assertEqual(_get_verified_memory_limit(measurements, [],
+                100), 400)
+            requiredBytes = 100 << MAX_MEMORY_DOUBLINGS
+            self.assertEqual(_get_verified_memory_limit(measurements, [],
+                100), requiredBytes)
+            requiredBytes += 1
+            self.assertIsNone(_get_verified_memory_limit(measurements, [],
+                100))
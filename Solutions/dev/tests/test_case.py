@@ -5,10 +5,19 @@
 #
 # Contains tests for util/case.py
 ################################################################################
+import json
+import os
+import tempfile
 import unittest
+try:
+    import numpy
+except ImportError:
+    numpy = None
 from util.case import CaseType, Case, KnownCase
 from util.pathmapper import PathMapper
 from util.definitions import Definitions
+from util.perror import PyCException
+from util.process import InputFile, IOMode
 from util import case
 from unittest import mock
 
@@ -58,6 +67,53 @@ class TestCase(unittest.TestCase):
         self.assertEqual(testCase.caseNumber, 'caseNumber')
         self.assertEqual(testCase.inputContents, 'input')
 
+    def test_input_file(self):
+        """
+        Ensure cases naming an input file keep only its path and size, and
+        that their hash follows the contents of the file
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            os.mkdir(os.path.join(directory, 'problem1_data'))
+            path = os.path.join(directory, 'problem1_data', 'big.txt')
+            with open(path, 'w') as inputFile:
+                inputFile.write('1 2 3\n')
+            caseJson = {'cases' : {'1' : {'input_file' :
+                os.path.join('problem1_data', 'big.txt'), 'output' : '6'}}}
+
+            testCase = case.get_cases_from_json(caseJson, 1,
+                    CaseType.GENERATED, directory)[0]
+            self.assertIsInstance(testCase, KnownCase)
+            self.assertIsInstance(testCase.inputContents, InputFile)
+            self.assertEqual(testCase.inputContents.path, path)
+            self.assertEqual(testCase.get_input_size(), 6)
+            contentHash = testCase.get_content_hash()
+
+            with open(path, 'w') as inputFile:
+                inputFile.write('1 2 4\n')
+            self.assertNotEqual(case.get_cases_from_json(caseJson, 1,
+                CaseType.GENERATED, directory)[0].get_content_hash(),
+                contentHash)
+
+            with self.assertRaises(PyCException):
+                case.get_cases_from_json({'cases' : {'1' : {'input_file' :
+                    'missing.txt'}}}, 1, CaseType.GENERATED, directory)
+
+    def test_get_process_input(self):
+        """
+        Ensure string inputs are written to a file once per case in file mode
+        """
+        testCase = Case('caseType', 1, 1, 'input')
+        self.assertEqual(testCase.get_process_input(), 'input')
+        IOMode.set_mode(IOMode.FILE)
+        try:
+            processInput = testCase.get_process_input()
+            self.assertIs(testCase.get_process_input(), processInput)
+        finally:
+            IOMode.set_mode(IOMode.PIPE)
+        self.assertIsInstance(processInput, InputFile)
+        with open(processInput.path) as inputFile:
+            self.assertEqual(inputFile.read(), 'input')
+
 class TestKnownCase(unittest.TestCase):
 
     def test_init(self):
@@ -86,3 +142,62 @@ class TestKnownCase(unittest.TestCase):
         self.assertEqual(testKnownCase.inputContents, 'input')
         self.assertEqual(testKnownCase.outputContents, 'output')
 
+class TestCaseFileWriter(unittest.TestCase):
+
+    def test_write(self):
+        """
+        Ensure CaseFileWriter writes case files that load as cases, only
+        replacing the case file once closed
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'problem1_generated.json')
+            writer = case.CaseFileWriter(path)
+            writer.add(1, [1, 2], '3')
+            writer.add(2, 'text')
+            self.assertFalse(os.path.exists(path))
+            writer.close()
+
+            with open(path) as caseFile:
+                cases = case.get_cases_from_json(json.load(caseFile), 1,
+                        CaseType.GENERATED)
+            self.assertEqual([(testCase.caseNumber, testCase.inputContents)
+                for testCase in cases], [(1, '[[1,2]]'), (2, '["text"]')])
+            self.assertIsInstance(cases[0], KnownCase)
+            self.assertEqual(cases[0].outputContents, '3')
+            self.assertNotIsInstance(cases[1], KnownCase)
+
+            writer = case.CaseFileWriter(path)
+            writer.add(1, [5])
+            writer.discard()
+            self.assertEqual(os.listdir(directory),
+                    ['problem1_generated.json'])
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_write_arrays(self):
+        """
+        Ensure NumPy arrays and long lists are written in chunks as the same
+        JSON as their lists
+        """
+        inputJson = {'n' : numpy.int64(5), 'values' : numpy.arange(5),
+                'matrix' : numpy.arange(6).reshape(3, 2), 'rows' : [[1, 2],
+                    numpy.array([3, 4])], 'list' : list(range(5))}
+        expectedJson = {'n' : 5, 'values' : [0, 1, 2, 3, 4], 'matrix' : [[0,
+            1], [2, 3], [4, 5]], 'rows' : [[1, 2], [3, 4]], 'list' : [0, 1, 2,
+                3, 4]}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'problem1_generated.json')
+            writer = case.CaseFileWriter(path)
+            writer.add(1, inputJson)
+            writer._file.flush()
+            with open(writer._temporaryPath) as caseFile:
+                self.assertEqual(caseFile.read(), '{"cases":{"1":{"input":' +
+                    case.fileops.get_json_string(expectedJson) + '}')
+            writer.add(2, numpy.arange(0))
+            writer.close()
+
+            with open(path) as caseFile:
+                cases = case.get_cases_from_json(json.load(caseFile), 1,
+                        CaseType.GENERATED)
+            self.assertEqual(cases[0].inputContents, case._parse_input_json(
+                expectedJson))
+            self.assertEqual(cases[1].inputContents, '[[]]')
@@ -0,0 +1,153 @@
+################################################################################
+# Filename: tests/test_comparator.py
+# Date:     16 October 2026
+#
+# Contains tests for util/comparator.py
+################################################################################
+import unittest
+from unittest import mock
+from util.comparator import Comparators, ExactComparator, TokenComparator, \
+        NumericComparator
+from util.definitions import Definitions
+from util.perror import PyCException
+
+def _compare(comparator, chunks):
+    for chunk in chunks:
+        if not comparator.feed(chunk):
+            break
+    return comparator.finish()
+
+class TestExactComparator(unittest.TestCase):
+
+    def test_matches(self):
+        """
+        Ensure ExactComparator matches output split across chunks, ignoring
+        carriage returns and the trailing character
+        """
+        self.assertTrue(_compare(ExactComparator('ab\ncd'),
+            [b'a', b'b\r\nc', b'd\r\n']))
+        self.assertTrue(_compare(ExactComparator('café'),
+            ['caféé'.encode('utf-8')]))
+        self.assertTrue(_compare(ExactComparator(''), []))
+        self.assertTrue(_compare(ExactComparator(''), [b'\n']))
+
+    def test_mismatch(self):
+        """
+        Ensure ExactComparator stops at the first wrong byte
+        """
+        comparator = ExactComparator('abcdef')
+        self.assertTrue(comparator.feed(b'abc'))
+        self.assertFalse(comparator.feed(b'dXf\n'))
+        self.assertFalse(comparator.feed(b'more'))
+        self.assertFalse(comparator.finish())
+        self.assertEqual(comparator.get_divergence(), 4)
+        self.assertEqual(comparator.get_output(), 'abcdXf\n')
+        self.assertEqual(comparator.get_expected_output(), 'abcdef')
+
+    def test_length(self):
+        """
+        Ensure ExactComparator rejects output that is too short or too long
+        """
+        for output in [b'', b'abc', b'ab\n', b'abc\n\n', b'abc\nxxxxxx']:
+            self.assertFalse(_compare(ExactComparator('abc'), [output]),
+                    output)
+        self.assertFalse(_compare(ExactComparator(''), [b'\n\n']))
+
+    def test_window(self):
+        """
+        Ensure ExactComparator only keeps a window of wrong output, starting
+        at a line
+        """
+        expectedOutput = '\n'.join(str(number) for number in range(1000))
+        comparator = ExactComparator(expectedOutput, windowBytes=16)
+        self.assertFalse(_compare(comparator, [expectedOutput.replace('500',
+            '5x0').encode('utf-8') + b'y' * 10000]))
+        self.assertEqual(comparator.get_output(),
+                '497\n498\n499\n5x0\n501\n502\n503\n5')
+        self.assertEqual(comparator.get_expected_output(),
+                '497\n498\n499\n500\n501\n502\n503\n5')
+
+class TestTokenComparator(unittest.TestCase):
+
+    def test_matches(self):
+        """
+        Ensure TokenComparator ignores whitespace, even across chunks
+        """
+        self.assertTrue(_compare(TokenComparator('12 345\n6'),
+            [b'  1', b'2\t', b'34', b'5   ', b'\r\n', b'6']))
+        self.assertTrue(_compare(TokenComparator(''), [b' \n ']))
+
+    def test_mismatch(self):
+        """
+        Ensure TokenComparator rejects wrong, missing and extra tokens
+        """
+        self.assertFalse(_compare(TokenComparator('1 2 3'), [b'1 2', b'4']))
+        self.assertFalse(_compare(TokenComparator('1 2 3'), [b'1 2', b' 3 4']))
+        self.assertFalse(_compare(TokenComparator('1 2 3'), [b'1 2 ']))
+        self.assertFalse(_compare(TokenComparator('1 23'), [b'1 2 3']))
+
+        comparator = TokenComparator('a b c')
+        self.assertFalse(_compare(comparator, [b'a  b  d  e']))
+        self.assertEqual(comparator.get_divergence(), 4)
+        self.assertEqual(comparator.get_output(), 'a b d  e')
+
+    def test_long_token(self):
+        """
+        Ensure TokenComparator stops keeping tokens too long to match
+        """
+        comparator = TokenComparator('1')
+        for _ in range(10):
+            if not comparator.feed(b'1' * 64):
+                break
+        self.assertFalse(comparator.finish())
+        self.assertEqual(len(comparator._partialToken), 0)
+
+class TestNumericComparator(unittest.TestCase):
+
+    def test_tolerance(self):
+        """
+        Ensure NumericComparator matches numbers within the tolerance
+        """
+        self.assertTrue(_compare(NumericComparator('0.333333 1000000 x'),
+            [b'0.3333333333 1000000.5 x']))
+        self.assertFalse(_compare(NumericComparator('0.333333'), [b'0.3334']))
+        self.assertFalse(_compare(NumericComparator('x'), [b'1']))
+        self.assertTrue(_compare(NumericComparator('1.5', tolerance=0.5),
+            [b'1.9']))
+
+class TestComparators(unittest.TestCase):
+
+    def tearDown(self):
+        Definitions._definitionsDict = None
+
+    def test_get_comparator(self):
+        """
+        Ensure Comparators.get_comparator lets problems override the
+        comparator shared by every problem
+        """
+        Definitions._definitionsDict = {'comparator' : 'tokens',
+                'problem_3_comparator' : 'numeric',
+                'problem_3_comparator_tolerance' : 0.5}
+        self.assertIsInstance(Comparators.get_comparator(1, ''),
+                TokenComparator)
+        comparator = Comparators.get_comparator('3', '')
+        self.assertIsInstance(comparator, NumericComparator)
+        self.assertEqual(comparator._tolerance, 0.5)
+
+        Definitions._definitionsDict = {}
+        self.assertIsInstance(Comparators.get_comparator(1, ''),
+                ExactComparator)
+
+        Definitions._definitionsDict = {'comparator' : 'fuzzy'}
+        with self.assertRaises(PyCException):
+            Comparators.get_comparator(1, '')
+
+    def test_outputs_match(self):
+        """
+        Ensure Comparators.outputs_match compares with the problem's comparator
+        """
+        Definitions._definitionsDict = {'problem_3_comparator' : 'numeric'}
+        self.assertTrue(Comparators.outputs_match(1, '1 2', '1 2'))
+        self.assertFalse(Comparators.outputs_match(1, '1 2', '1  2'))
+        self.assertTrue(Comparators.outputs_match(3, '0.5', '0.5000001'))
+        self.assertFalse(Comparators.outputs_match(3, '0.5', '0.6'))
@@ -0,0 +1,86 @@
+################################################################################
+# Filename: tests/test_compilecache.py
+# Date:     16 October 2026
+#
+# Contains tests for util/compilecache.py
+################################################################################
+import unittest
+import tempfile
+import shutil
+import os
+from unittest import mock
+from util.compilecache import (CompileCache, get_directory_snapshot,
+        get_changed_files)
+
+class TestCompileCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cacheDir = tempfile.mkdtemp()
+        self.workDir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cacheDir)
+        shutil.rmtree(self.workDir)
+
+    def _write(self, name, contents):
+        with open(os.path.join(self.workDir, name), 'w') as openFile:
+            openFile.write(contents)
+
+    def test_get_changed_files(self):
+        """
+        Ensure get_changed_files reports new and modified files only
+        """
+        self._write('source.cpp', 'int main(){}')
+        self._write('stale.o', 'old')
+        before = get_directory_snapshot(self.workDir)
+        self._write('source.o', 'binary')
+        os.utime(os.path.join(self.workDir, 'stale.o'), ns=(1, 1))
+        after = get_directory_snapshot(self.workDir)
+        self.assertEqual(get_changed_files(before, after), ['source.o', 
+            'stale.o'])
+
+    def test_store_and_restore_entry(self):
+        """
+        Ensure a stored entry restores its artifacts into a directory
+        """
+        self._write('source.o', 'binary')
+        with mock.patch.object(CompileCache, 'get_cache_path',
+                return_value=self.cacheDir):
+            CompileCache.store_entry('abcdef', True, self.workDir, 
+                    ['source.o'], 'warning')
+            os.remove(os.path.join(self.workDir, 'source.o'))
+            entry = CompileCache.get_entry('abcdef')
+
+        self.assertTrue(entry.succeeded)
+        self.assertEqual(entry.log, 'warning')
+        entry.restore(self.workDir)
+        with open(os.path.join(self.workDir, 'source.o')) as openFile:
+            self.assertEqual(openFile.read(), 'binary')
+
+    def test_get_entry_missing(self):
+        """
+        Ensure CompileCache.get_entry returns None for unknown keys
+        """
+        with mock.patch.object(CompileCache, 'get_cache_path',
+                return_value=self.cacheDir):
+            self.assertEqual(CompileCache.get_entry('abcdef'), None)
+
+    @mock.patch.object(CompileCache, 'get_compiler_fingerprint')
+    def test_get_key(self, mocked_get_compiler_fingerprint):
+        """
+        Ensure CompileCache.get_key changes with the source and the compiler
+        """
+        self._write('source.cpp', 'int main(){}')
+        sourcePath = os.path.join(self.workDir, 'source.cpp')
+        mocked_get_compiler_fingerprint.return_value = 'g++ 1'
+        firstKey = CompileCache.get_key(sourcePath, ['g++', sourcePath])
+        self.assertEqual(firstKey, CompileCache.get_key(sourcePath, 
+            ['g++', sourcePath]))
+
+        mocked_get_compiler_fingerprint.return_value = 'g++ 2'
+        self.assertNotEqual(firstKey, CompileCache.get_key(sourcePath,
+            ['g++', sourcePath]))
+
+        self._write('source.cpp', 'int main(){return 0;}')
+        self.assertNotEqual(firstKey, CompileCache.get_key(sourcePath,
+            ['g++', sourcePath]))
@@ -0,0 +1,81 @@
+################################################################################
+# Filename: tests/test_diff.py
+# Date:     16 October 2026
+#
+# Contains tests for util/diff.py
+################################################################################
+import difflib
+import random
+import unittest
+from util.diff import DiffBudgetExceeded, DiffMode, BUDGET_EXCEEDED_MESSAGE, \
+        get_diff, get_opcodes, unified_diff, first_difference_diff
+
+class TestDiff(unittest.TestCase):
+
+    def test_get_opcodes(self):
+        """
+        Ensure get_opcodes finds a shortest edit script
+        """
+        randomGenerator = random.Random(0)
+        for _ in range(500):
+            a = [randomGenerator.choice('abc') for _ in
+                 range(randomGenerator.randint(0, 12))]
+            b = [randomGenerator.choice('abc') for _ in
+                 range(randomGenerator.randint(0, 12))]
+            output = []
+            for tag, aLo, aHi, bLo, bHi in get_opcodes(a, b):
+                if tag == 'equal':
+                    self.assertEqual(a[aLo:aHi], b[bLo:bHi])
+                    output.extend(a[aLo:aHi])
+                if tag == 'insert':
+                    output.extend(b[bLo:bHi])
+            self.assertEqual(output, b)
+
+            equalCount = sum(aHi - aLo for tag, aLo, aHi, _, _ in
+                    get_opcodes(a, b) if tag == 'equal')
+            matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+            self.assertGreaterEqual(equalCount, sum(block.size for block in
+                matcher.get_matching_blocks()))
+
+    def test_unified_diff(self):
+        """
+        Ensure unified_diff matches difflib on large outputs with few changes
+        """
+        a = [str(number) for number in range(50000)]
+        b = list(a)
+        b[30000] = 'x'
+        b.insert(40000, 'y')
+        del b[5]
+        self.assertEqual(unified_diff(a, b, 'a', 'b'), list(
+            difflib.unified_diff(a, b, 'a', 'b', lineterm='')))
+        self.assertEqual(unified_diff(a, a), [])
+
+    def test_unified_diff_budget(self):
+        """
+        Ensure unified_diff gives up on diffs too large for its budget
+        """
+        with self.assertRaises(DiffBudgetExceeded):
+            unified_diff(['a'] * 10, ['b'] * 10, maxLines=15)
+        with self.assertRaises(DiffBudgetExceeded):
+            unified_diff([str(number) for number in range(5000)],
+                    [str(-number) for number in range(5000)], timeout=0)
+
+    def test_first_difference_diff(self):
+        """
+        Ensure first_difference_diff shows the lines around the first
+        difference only
+        """
+        self.assertEqual(first_difference_diff(list('abcdefgh'),
+            list('abcdXfgY'), context=1), ['--- ', '+++ ',
+                '@@ -4,3 +4,3 @@', ' d', '-e', '-f', '+X', '+f'])
+        self.assertEqual(first_difference_diff(['a'], ['a']), [])
+
+    def test_get_diff(self):
+        """
+        Ensure get_diff falls back to the first difference when over budget
+        """
+        a = '\n'.join(str(number) for number in range(150000))
+        b = '\n'.join(str(-number) for number in range(150000))
+        diff = get_diff(a, b, DiffMode.FULL)
+        self.assertEqual(diff[0], BUDGET_EXCEEDED_MESSAGE)
+        self.assertEqual(diff[1:], get_diff(a, b, DiffMode.FIRST))
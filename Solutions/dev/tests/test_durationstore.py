@@ -0,0 +1,73 @@
+################################################################################
+# Filename: tests/test_durationstore.py
+# Date:     16 October 2026
+#
+# Contains tests for util/durationstore.py
+################################################################################
+import unittest
+import tempfile
+import shutil
+import os
+from unittest import mock
+from util.case import Case
+from util.durationstore import DurationStore
+from util.result import CaseResult, Status
+
+class TestDurationStore(unittest.TestCase):
+
+    def setUp(self):
+        self.storeDir = tempfile.mkdtemp()
+        self.storePath = os.path.join(self.storeDir, 'durations.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.storeDir)
+
+    def _get_result(self, case, wallTime, status=Status.PASS):
+        return CaseResult('solution', case, status, '', wallTime=wallTime)
+
+    @mock.patch.object(DurationStore, 'get_key')
+    def test_record_result(self, mocked_get_key):
+        """
+        Ensure durations are smoothed over runs and unmeasured results ignored
+        """
+        mocked_get_key.side_effect = lambda solution, case: case
+        durationStore = DurationStore.load(self.storePath)
+        durationStore.record_result(self._get_result('a', 2.0))
+        durationStore.record_result(self._get_result('a', 4.0))
+        durationStore.record_result(self._get_result('b', None, Status.SKIP))
+        durationStore.record_result(self._get_result(None, 1.0))
+        durationStore.record_result(None)
+
+        self.assertEqual(durationStore.get_duration('solution', 'a'), 3.0)
+        self.assertEqual(durationStore.get_duration('solution', 'b'), None)
+
+    @mock.patch.object(DurationStore, 'get_key')
+    def test_save_and_load(self, mocked_get_key):
+        """
+        Ensure durations survive saving and reloading the store
+        """
+        mocked_get_key.side_effect = lambda solution, case: case
+        durationStore = DurationStore.load(self.storePath)
+        durationStore.record_result(self._get_result('a', 2.0))
+        durationStore.save()
+
+        reloadedStore = DurationStore.load(self.storePath)
+        self.assertEqual(reloadedStore.get_duration('solution', 'a'), 2.0)
+
+    @mock.patch.object(DurationStore, 'get_key')
+    def test_predict_durations(self, mocked_get_key):
+        """
+        Ensure cases without history are predicted from their input size, at
+        the rate of the cases with history
+        """
+        mocked_get_key.side_effect = lambda solution, case: case.caseNumber
+        cases = [Case(1, 1, number, 'x' * size) for number, size in
+                 enumerate([100, 300, 1000])]
+        durationStore = DurationStore.load(self.storePath)
+        self.assertEqual(durationStore.predict_durations([('solution',
+            cases[2])]), [1000 * DurationStore.DEFAULT_SECONDS_PER_BYTE])
+
+        durationStore.record_result(self._get_result(cases[0], 1.0))
+        durationStore.record_result(self._get_result(cases[1], 3.0))
+        self.assertEqual(durationStore.predict_durations([('solution', case)
+            for case in cases]), [1.0, 3.0, 10.0])
@@ -0,0 +1,85 @@
+################################################################################
+# Filename: tests/test_generate.py
+# Date:     16 October 2026
+#
+# Contains tests for util/subparsers/generate.py
+################################################################################
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from util.generator import GeneratorBlock
+from util.perror import PyCException
+from util.subparsers import generate
+
+class TestGenerate(unittest.TestCase):
+
+    def test_group_by_case_type(self):
+        """
+        Ensure blocks are grouped by case type, keeping their order
+        """
+        blocks = [GeneratorBlock('a', [1]), GeneratorBlock('b', [1], caseType=
+            'large'), GeneratorBlock('c', [1])]
+        self.assertEqual({caseType : [block.generatorPath for block in
+            group] for caseType, group in generate._group_by_case_type(
+                blocks).items()}, {'generated' : ['a', 'c'],
+                    'large' : ['b']})
+
+    def test_get_jobs(self):
+        """
+        Ensure every seed of every block is a job, in order
+        """
+        self.assertEqual(generate._get_jobs([GeneratorBlock('a', [1, 2],
+            {'n' : 5}), GeneratorBlock('b', [3], referencePath='r')]), [
+                ('a', None, 1, {'n' : 5}, None), ('a', None, 2, {'n' : 5},
+                    None), ('b', 'r', 3, {}, None)])
+
+    @mock.patch.object(generate, '_generate_case')
+    def test_write_case_file(self, mocked_generate_case):
+        """
+        Ensure cases are written in order, and that the previous case file is
+        kept if a case fails
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'problem1_generated.json')
+            mocked_generate_case.side_effect = lambda job: ([job[2]], None if
+                    job[2] % 2 else str(job[2]), None)
+            jobs = [('a', None, seed, {}, None) for seed in [1, 2, 3]]
+            self.assertEqual(generate._write_case_file(path, jobs, None), 3)
+            with open(path) as caseFile:
+                self.assertEqual(json.load(caseFile), {'cases' : {
+                    '1' : {'input' : [1]}, '2' : {'input' : [2],
+                        'output' : '2'}, '3' : {'input' : [3]}}})
+
+            mocked_generate_case.side_effect = lambda job: (None, None,
+                    'Error: failed')
+            with self.assertRaises(PyCException):
+                generate._write_case_file(path, jobs, None)
+            self.assertEqual(os.listdir(directory),
+                    ['problem1_generated.json'])
+            with open(path) as caseFile:
+                self.assertEqual(len(json.load(caseFile)['cases']), 3)
+
+    def test_generate_cases_is_bounded(self):
+        """
+        Ensure cases are yielded in order with at most the pending count of
+        them made but not yet yielded
+        """
+        class ImmediateResult:
+            def __init__(self, value):
+                self.value = value
+            def get(self):
+                return self.value
+
+        pending = []
+        class ImmediatePool:
+            def apply_async(self, function, arguments):
+                pending.append(arguments[0])
+                return ImmediateResult(arguments[0])
+
+        results = []
+        for result in generate._generate_cases(range(10), ImmediatePool(), 3):
+            self.assertLessEqual(len(pending) - len(results), 3)
+            results.append(result)
+        self.assertEqual(results, list(range(10)))
@@ -0,0 +1,111 @@
+################################################################################
+# Filename: tests/test_generator.py
+# Date:     16 October 2026
+#
+# Contains tests for util/generator.py
+################################################################################
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from util.generator import GeneratorBlock, Generators
+from util.pathmapper import PathMapper
+from util.perror import PyCException
+
+class TestGeneratorBlock(unittest.TestCase):
+
+    def setUp(self):
+        self.rootPath = PathMapper._rootPath
+        PathMapper.set_root_path('/root')
+
+    def tearDown(self):
+        PathMapper.set_root_path(self.rootPath)
+
+    def test_load_from_dict(self):
+        """
+        Ensure GeneratorBlock.load_from_dict maps paths to the root directory
+        and expands seed counts
+        """
+        block = GeneratorBlock.load_from_dict({'generator' : 'gen/p1.py',
+            'seeds' : 3, 'params' : {'n' : 10}, 'reference' : 'ref.py'})
+        self.assertEqual(block.generatorPath, os.path.join('/root', 'gen',
+            'p1.py'))
+        self.assertEqual(block.seeds, [1, 2, 3])
+        self.assertEqual(block.params, {'n' : 10})
+        self.assertEqual(block.caseType, GeneratorBlock.DEFAULT_CASE_TYPE)
+        self.assertEqual(block.referencePath, os.path.join('/root', 'ref.py'))
+
+        block = GeneratorBlock.load_from_dict({'generator' : 'p1.py',
+            'seeds' : [7, 9], 'caseType' : 'large'})
+        self.assertEqual(block.seeds, [7, 9])
+        self.assertEqual(block.params, {})
+        self.assertEqual(block.caseType, 'large')
+        self.assertIsNone(block.referencePath)
+
+        with self.assertRaises(PyCException):
+            GeneratorBlock.load_from_dict({'seeds' : 1})
+
+    def test_load_library_from_dict(self):
+        """
+        Ensure blocks may name a library generator instead of a program, but
+        not both
+        """
+        block = GeneratorBlock.load_from_dict({'library' : 'array',
+            'params' : {'n' : 10}})
+        self.assertIsNone(block.generatorPath)
+        self.assertEqual(block.libraryName, 'array')
+        self.assertEqual(block.seeds, [1])
+
+        with self.assertRaises(PyCException):
+            GeneratorBlock.load_from_dict({'library' : 'unknown'})
+        with self.assertRaises(PyCException):
+            GeneratorBlock.load_from_dict({'library' : 'array',
+                'generator' : 'p1.py'})
+
+    def test_get_fingerprint(self):
+        """
+        Ensure fingerprints change with the generator source and parameters
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'gen.py')
+            with open(path, 'w') as generatorFile:
+                generatorFile.write('print(1)')
+            block = GeneratorBlock(path, [1], {'n' : 1})
+            fingerprint = block.get_fingerprint()
+            self.assertEqual(GeneratorBlock(path, [1], {'n' : 1}
+                ).get_fingerprint(), fingerprint)
+            self.assertNotEqual(GeneratorBlock(path, [1], {'n' : 2}
+                ).get_fingerprint(), fingerprint)
+
+            with open(path, 'w') as generatorFile:
+                generatorFile.write('print(2)')
+            self.assertNotEqual(block.get_fingerprint(), fingerprint)
+
+class TestGenerators(unittest.TestCase):
+
+    def setUp(self):
+        self.rootPath = PathMapper._rootPath
+        PathMapper.set_root_path('/root')
+
+    def tearDown(self):
+        PathMapper.set_root_path(self.rootPath)
+
+    @mock.patch.object(Generators, 'get_generators_filepath')
+    def test_get_problem_generators(self, mocked_get_generators_filepath):
+        """
+        Ensure Generators.get_problem_generators reads the blocks of every
+        problem, and none without a generators file
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, 'generators.json')
+            mocked_get_generators_filepath.return_value = filepath
+            self.assertEqual(Generators.get_problem_generators(), {})
+
+            with open(filepath, 'w') as generatorsFile:
+                json.dump({'problems' : {'2' : [{'generator' : 'a.py'},
+                    {'generator' : 'b.py', 'seeds' : 2}]}}, generatorsFile)
+            problemGenerators = Generators.get_problem_generators()
+            self.assertEqual(list(problemGenerators), [2])
+            self.assertEqual([block.seeds for block in problemGenerators[2]],
+                    [[1], [1, 2]])
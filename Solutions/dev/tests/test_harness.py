@@ -0,0 +1,191 @@
+################################################################################
+# Filename: tests/test_harness.py
+# Date:     16 October 2026
+#
+# Contains tests for util/harness
+################################################################################
+import unittest
+import tempfile
+import shutil
+import os
+import subprocess
+import sys
+from unittest import mock
+from util.harness.base import HarnessUnsupportedError
+from util.harness.java import JavaHarness
+from util.harness.python import PythonHarness
+from util.language import ExecutionError
+from util.limits import Limits
+from util.result import Status
+
+SOLUTION = '''
+class Problem1:
+    def solve(self, number):
+        if number < 0:
+            raise ValueError(number)
+        if number == 0:
+            import os
+            os._exit(1)
+        if number > 100:
+            import time
+            time.sleep(number)
+        print('ignored')
+        return [number, number * 2]
+'''
+
+JAVA_SOLUTION = '''
+import java.util.Scanner;
+
+public class Problem1 {
+    static {
+        System.out.println("static");
+    }
+
+    public static void main(String[] args) {
+        int number = new Scanner(System.in).nextInt();
+        System.out.println(number * 2);
+        if (number <= 0) {
+            System.exit(-number);
+        }
+        System.out.println(number * 3);
+    }
+}
+'''
+
+class TestPythonHarness(unittest.TestCase):
+
+    def setUp(self):
+        self.workDir = tempfile.mkdtemp()
+        self.solutionPath = os.path.join(self.workDir, 'Problem1.py')
+        with open(self.solutionPath, 'w') as openFile:
+            openFile.write(SOLUTION)
+
+    def tearDown(self):
+        shutil.rmtree(self.workDir)
+
+    def _get_harness(self, methodName='solve', limits=None):
+        return PythonHarness([sys.executable, PythonHarness.WORKER_SCRIPT,
+            self.solutionPath, 'Problem1', methodName], limits)
+
+    def test_follows_template(self):
+        """
+        Ensure PythonHarness.follows_template looks for the class and method
+        """
+        self.assertTrue(PythonHarness.follows_template(self.solutionPath,
+            'Problem1', 'solve'))
+        self.assertFalse(PythonHarness.follows_template(self.solutionPath,
+            'Problem2', 'solve'))
+        self.assertFalse(PythonHarness.follows_template(self.solutionPath,
+            'Problem1', 'other'))
+
+    def test_execute(self):
+        """
+        Ensure the harness calls the method and formats its result with str()
+        """
+        harness = self._get_harness()
+        try:
+            self.assertEqual(harness.execute('[3]'), '[3, 6]')
+            self.assertEqual(harness.execute('[4]'), '[4, 8]')
+        finally:
+            harness.close()
+
+    def test_execute_error(self):
+        """
+        Ensure exceptions raised by the method are runtime errors that do not
+        stop later cases from running
+        """
+        harness = self._get_harness()
+        try:
+            with self.assertRaises(ExecutionError) as context:
+                harness.execute('[-1]')
+            self.assertEqual(context.exception.message, 'Runtime Error')
+            self.assertEqual(harness.execute('[1]'), '[1, 2]')
+        finally:
+            harness.close()
+
+    def test_execute_crash(self):
+        """
+        Ensure a crashed worker is a runtime error and is restarted
+        """
+        harness = self._get_harness()
+        try:
+            with self.assertRaises(ExecutionError) as context:
+                harness.execute('[0]')
+            self.assertEqual(context.exception.message, 'Runtime Error')
+            self.assertEqual(harness.execute('[2]'), '[2, 4]')
+        finally:
+            harness.close()
+
+    def test_execute_limits(self):
+        """
+        Ensure the harness enforces wall time and output limits per case
+        """
+        harness = self._get_harness(limits=Limits(wallSeconds=0.5,
+            outputBytes=8))
+        try:
+            with self.assertRaises(ExecutionError) as context:
+                harness.execute('[1000]')
+            self.assertEqual(context.exception.verdict, Status.TLE)
+            with self.assertRaises(ExecutionError) as context:
+                harness.execute('[50]')
+            self.assertEqual(context.exception.verdict, Status.OLE)
+            self.assertEqual(harness.execute('[1]'), '[1, 2]')
+        finally:
+            harness.close()
+
+    def test_execute_unsupported(self):
+        """
+        Ensure a solution without the method is reported as unsupported
+        """
+        harness = self._get_harness(methodName='other')
+        with self.assertRaises(HarnessUnsupportedError):
+            harness.execute('[1]')
+
+class TestJavaHarness(unittest.TestCase):
+
+    def test_get_java_version(self):
+        """
+        Ensure JavaHarness reads the major version of old and new JVMs
+        """
+        for versionOutput, version in [
+                (b'java version "1.8.0_292"\n', 8),
+                (b'openjdk version "21.0.1" 2023-10-17\n', 21),
+                (b'openjdk version "24" 2025-03-18\n', 24),
+                (b'unknown\n', None)]:
+            with mock.patch.object(subprocess, 'run', return_value=
+                    mock.MagicMock(stdout=versionOutput)):
+                self.assertEqual(JavaHarness._get_java_version('java'),
+                        version)
+
+    @unittest.skipIf(shutil.which('javac') is None, 'javac is not installed')
+    def test_execute(self):
+        """
+        Ensure the Java harness keeps static initializers out of the protocol,
+        traps System.exit and runs every case with fresh static state, or is
+        unsupported by JVMs without a security manager
+        """
+        workDir = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(workDir, 'Problem1.java'), 'w') as openFile:
+                openFile.write(JAVA_SOLUTION)
+            subprocess.run(['javac', '-d', workDir, JavaHarness.HARNESS_SOURCE,
+                os.path.join(workDir, 'Problem1.java')], check=True)
+            jvmOptions = JavaHarness.get_jvm_options('java')
+            harness = JavaHarness(['java'] + (jvmOptions or []) + ['-cp',
+                workDir, JavaHarness.HARNESS_CLASS, workDir, 'Problem1'])
+            try:
+                if jvmOptions is None:
+                    with self.assertRaises(HarnessUnsupportedError):
+                        harness.execute('1')
+                    return
+
+                self.assertEqual(harness.execute('1'), 'static\n2\n3')
+                self.assertEqual(harness.execute('0'), 'static\n0')
+                with self.assertRaises(ExecutionError) as context:
+                    harness.execute('-1')
+                self.assertEqual(context.exception.message, 'Runtime Error')
+                self.assertEqual(harness.execute('2'), 'static\n4\n6')
+            finally:
+                harness.close()
+        finally:
+            shutil.rmtree(workDir)
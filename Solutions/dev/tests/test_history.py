@@ -0,0 +1,134 @@
+################################################################################
+# Filename: tests/test_history.py
+# Date:     16 October 2026
+#
+# Contains tests for util/history.py
+################################################################################
+import unittest
+import tempfile
+import shutil
+import os
+from unittest import mock
+from util.history import ResultHistory
+from util.result import CaseResult, Status
+
+class TestResultHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.historyDir = tempfile.mkdtemp()
+        self.historyPath = os.path.join(self.historyDir, 'history.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.historyDir)
+
+    def _get_result(self, writer, caseNumber, cpuTime, status=Status.PASS,
+            cached=False):
+        solution = mock.MagicMock(solutionWriter=writer, problemNumber='2')
+        solution.solutionLanguage.name = 'Python'
+        solution.get_source_hash.return_value = writer + 'hash'
+        case = mock.MagicMock(caseNumber=caseNumber)
+        case.get_case_string.return_value = 'general'
+        case.get_content_hash.return_value = 'case{}'.format(caseNumber)
+        return CaseResult(solution, case, status, '', cached=cached,
+                cpuTime=cpuTime, wallTime=cpuTime, peakMemory=1024)
+
+    def _record_run(self, results):
+        resultHistory = ResultHistory.open(self.historyPath)
+        resultHistory.start_run(jobCount=1, engine='blocking')
+        for result in results:
+            resultHistory.add(result)
+        resultHistory.close()
+
+    def test_add_batches_executions(self):
+        """
+        Ensure executions are inserted once a batch is full or on close, and
+        that results which are not executions are ignored
+        """
+        resultHistory = ResultHistory.open(self.historyPath)
+        resultHistory.start_run()
+        resultHistory.add(None)
+        resultHistory.add(self._get_result('a', 1, 1.0, cached=True))
+        resultHistory.add(self._get_result('a', 1, None, Status.SKIP))
+        for caseNumber in range(ResultHistory.BATCH_SIZE + 1):
+            resultHistory.add(self._get_result('a', caseNumber, 1.0))
+        count = resultHistory._connection.execute(
+                'SELECT COUNT(*) FROM executions').fetchone()[0]
+        self.assertEqual(count, ResultHistory.BATCH_SIZE)
+        resultHistory.close()
+
+        resultHistory = ResultHistory.open(self.historyPath)
+        count = resultHistory._connection.execute(
+                'SELECT COUNT(*) FROM executions').fetchone()[0]
+        self.assertEqual(count, ResultHistory.BATCH_SIZE + 1)
+        resultHistory.close()
+
+    def test_get_solution_trends(self):
+        """
+        Ensure the timings of each solution's recent runs are summarized
+        """
+        for cpuTime in [1.0, 2.0, 3.0]:
+            self._record_run([self._get_result('a', 1, cpuTime),
+                self._get_result('a', 2, cpuTime, Status.TLE),
+                self._get_result('b', 1, cpuTime / 2)])
+
+        resultHistory = ResultHistory.open(self.historyPath)
+        trends = resultHistory.get_solution_trends(2)
+        self.assertEqual([(row[0], row[3], row[6], row[7], row[8], row[9])
+            for row in trends], [('a', 2, 2, 1, 4.0, 2.0),
+                ('a', 3, 2, 1, 6.0, 3.0), ('b', 2, 1, 0, 1.0, 1.0),
+                ('b', 3, 1, 0, 1.5, 1.5)])
+        self.assertEqual(len(resultHistory.get_solution_trends(5, ['b'],
+            ['Python'], [2])), 3)
+        self.assertEqual(resultHistory.get_solution_trends(5, ['b'], None,
+            [3]), [])
+        resultHistory.close()
+
+    def test_get_run_cpu_samples(self):
+        """
+        Ensure every sample of the correct executions of a run is found
+        """
+        repeatedResult = self._get_result('a', 1, None)
+        repeatedResult.samples = [(1.0, 1.0, 1), (3.0, 3.0, 1)]
+        self._record_run([repeatedResult, self._get_result('a', 2, 2.0,
+            Status.FAIL), self._get_result('b', 1, 5.0, Status.REGRESSION)])
+
+        resultHistory = ResultHistory.open(self.historyPath)
+        self.assertTrue(resultHistory.has_run(1))
+        self.assertFalse(resultHistory.has_run(2))
+        self.assertEqual(resultHistory.get_run_cpu_samples(1), {
+            ('a', 2, 'Python', 'case1') : [1.0, 3.0],
+            ('b', 2, 'Python', 'case1') : [5.0]})
+        self.assertEqual(ResultHistory.get_sample_key(
+            repeatedResult.solution, repeatedResult.case),
+            ('a', 2, 'Python', 'case1'))
+        resultHistory.close()
+
+    def test_get_latest_cpu_samples(self):
+        """
+        Ensure only the last run of each solution gives its samples
+        """
+        self._record_run([self._get_result('a', 1, 1.0),
+            self._get_result('b', 1, 2.0)])
+        self._record_run([self._get_result('a', 1, 3.0),
+            self._get_result('a', 2, 4.0, Status.TLE)])
+
+        resultHistory = ResultHistory.open(self.historyPath)
+        self.assertEqual(resultHistory.get_latest_cpu_samples(), {
+            ('a', 2, 'Python', 'case1') : [3.0],
+            ('b', 2, 'Python', 'case1') : [2.0]})
+        self.assertEqual(resultHistory.get_latest_cpu_samples(['b']), {
+            ('b', 2, 'Python', 'case1') : [2.0]})
+        resultHistory.close()
+
+    def test_get_slowest_cases(self):
+        """
+        Ensure the slowest cases of each problem are found over every run
+        """
+        self._record_run([self._get_result('a', 1, 1.0),
+            self._get_result('a', 2, 4.0), self._get_result('a', 3, 1.5),
+            self._get_result('b', 1, 3.0)])
+
+        resultHistory = ResultHistory.open(self.historyPath)
+        self.assertEqual([row[2:5] for row in resultHistory.get_slowest_cases(
+            2)], [(2, 1, 4.0), (1, 2, 2.0)])
+        resultHistory.close()
@@ -6,10 +6,15 @@
 # Tests to ensure the functionality of util/language.py
 ################################################################################
 import unittest
-from util.language import Language, Languages
+from util.language import Language, Languages, AppliedLanguage, ExecutionError
+from util.comparator import ExactComparator
+from util.limits import Limits
+from util.result import Status
 from unittest import mock
 from util.pathmapper import PathMapper
+import asyncio
 import os
+import sys
 from nose.plugins.deprecated import DeprecatedTest
 
 class TestLanguage(unittest.TestCase):
@@ -49,6 +54,16 @@ class TestLanguage(unittest.TestCase):
         self.assertEqual(testLanguage._runExtension, '')
         self.assertEqual(testLanguage._runCommand, '{directory}/{fileNameWoExtension}')
         self.assertEqual(testLanguage._runArguments, [])
+        self.assertEqual(testLanguage.limits, None)
+
+    def test_load_from_dict_limits(self):
+        """
+        Ensure Language.load_from_dict gathers the language's limits
+        """
+        testLanguage = Language.load_from_dict({'language' : 'Java',
+            'memoryBytesLimit' : None, 'cpuSecondsLimit' : 4})
+        self.assertEqual(testLanguage.limits, {'memoryBytes' : None,
+            'cpuSeconds' : 4})
 
 class TestLanguages(unittest.TestCase):
 
@@ -151,4 +166,114 @@ class TestLanguages(unittest.TestCase):
 
         self.assertEqual(Languages.get_language_by_name('non'), None)
 
+class TestAppliedLanguage(unittest.TestCase):
+
+    def _get_python_language(self, code):
+        return AppliedLanguage('Python', runCommand=sys.executable,
+                runArguments=['-c', code], path='Problem1.py')
+
+    def test_execute_code_async(self):
+        """
+        Ensure AppliedLanguage.execute_code_async returns the stripped output
+        """
+        language = self._get_python_language(
+                'import sys; print(sys.stdin.read().upper())')
+        self.assertEqual(asyncio.run(language.execute_code_async('hi')), 'HI')
+
+    def test_execute_code_async_runtime_error(self):
+        """
+        Ensure AppliedLanguage.execute_code_async raises on a failing exit code
+        """
+        language = self._get_python_language('import sys; sys.exit(3)')
+        with self.assertRaises(ExecutionError) as context:
+            asyncio.run(language.execute_code_async(''))
+        self.assertEqual(context.exception.message, 'Runtime Error')
+
+    def test_run_code_async_timeout(self):
+        """
+        Ensure AppliedLanguage.run_code_async kills timed out processes
+        """
+        language = self._get_python_language('import time; time.sleep(30)')
+        with self.assertRaises(ExecutionError) as context:
+            asyncio.run(language.run_code_async('',
+                limits=Limits(wallSeconds=0.2)))
+        self.assertEqual(context.exception.verdict, Status.TLE)
+
+    def test_run_code(self):
+        """
+        Ensure AppliedLanguage.run_code returns the output with measurements
+        """
+        language = self._get_python_language(
+                'import sys; print(sys.stdin.read().upper())')
+        result = language.run_code('hi')
+        self.assertEqual(result.output, 'HI')
+        self.assertGreater(result.cpuTime, 0)
+        self.assertGreater(result.wallTime, 0)
+        self.assertGreater(result.peakMemory, 0)
+
+    def test_run_code_invalid_output(self):
+        """
+        Ensure output that is not UTF-8 is returned with its invalid bytes
+        replaced
+        """
+        language = self._get_python_language(
+                'import sys; sys.stdout.buffer.write(b"a\\xff\\n")')
+        self.assertEqual(language.run_code('').output, 'a\ufffd')
+        self.assertEqual(asyncio.run(language.run_code_async('')).output,
+                'a\ufffd')
+
+    def test_run_code_comparator(self):
+        """
+        Ensure AppliedLanguage.run_code reports wrong output as unmatched
+        rather than as a runtime error
+        """
+        language = self._get_python_language('while True: print("no")')
+        result = language.run_code('', comparator=ExactComparator('yes'))
+        self.assertFalse(result.matched)
+        self.assertTrue(result.output.startswith('no'))
+        self.assertEqual(result.expectedOutput, 'yes')
+
+        language = self._get_python_language('print("yes")')
+        result = asyncio.run(language.run_code_async('',
+            comparator=ExactComparator('yes')))
+        self.assertTrue(result.matched)
+        self.assertEqual(result.output, 'yes')
+
+    def test_run_code_runtime_error(self):
+        """
+        Ensure AppliedLanguage.run_code attaches measurements to failures
+        """
+        language = self._get_python_language('import sys; sys.exit(3)')
+        with self.assertRaises(ExecutionError) as context:
+            language.run_code('')
+        self.assertEqual(context.exception.message, 'Runtime Error')
+        self.assertGreater(context.exception.result.wallTime, 0)
 
+    def test_run_code_cpu_limit(self):
+        """
+        Ensure AppliedLanguage.run_code stops processes at their CPU limit
+        """
+        language = self._get_python_language('while True: pass')
+        with self.assertRaises(ExecutionError) as context:
+            language.run_code('', limits=Limits(cpuSeconds=1, wallSeconds=10))
+        self.assertEqual(context.exception.verdict, Status.TLE)
+        self.assertLess(context.exception.result.wallTime, 5)
+
+    def test_run_code_memory_limit(self):
+        """
+        Ensure AppliedLanguage.run_code reports failed allocations as MLE
+        """
+        language = self._get_python_language(
+                'data = [bytearray(1 << 20) for i in range(1024)]')
+        with self.assertRaises(ExecutionError) as context:
+            language.run_code('', limits=Limits(memoryBytes=256 << 20))
+        self.assertEqual(context.exception.verdict, Status.MLE)
+
+    def test_run_code_output_limit(self):
+        """
+        Ensure AppliedLanguage.run_code kills processes at their output limit
+        """
+        language = self._get_python_language('while True: print("x" * 1000)')
+        with self.assertRaises(ExecutionError) as context:
+            language.run_code('', limits=Limits(outputBytes=1 << 16))
+        self.assertEqual(context.exception.verdict, Status.OLE)
@@ -0,0 +1,103 @@
+################################################################################
+# Filename: tests/test_limits.py
+# Date:     16 October 2026
+#
+# Contains tests for util/limits.py
+################################################################################
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from util.definitions import Definitions
+from util.language import Language
+from util.limits import Limits
+from util.result import Status
+
+class TestLimits(unittest.TestCase):
+
+    def test_load_from_dict(self):
+        """
+        Ensure Limits.load_from_dict inherits left out limits and treats null
+        as unlimited
+        """
+        baseLimits = Limits(cpuSeconds=2, memoryBytes=100)
+        limits = Limits.load_from_dict({'cpuSeconds' : 5,
+            'memoryBytes' : None}, baseLimits)
+        self.assertEqual(limits.cpuSeconds, 5)
+        self.assertEqual(limits.memoryBytes, None)
+        self.assertEqual(limits.wallSeconds, Limits.DEFAULT_WALL_SECONDS)
+
+    @mock.patch.object(Limits, 'get_problem_limits_dict')
+    def test_get_limits(self, mocked_get_problem_limits_dict):
+        """
+        Ensure Limits.get_limits applies definitions, language, problem and
+        problem language limits in order
+        """
+        Definitions._definitionsDict = {'cpu_seconds_limit' : 10,
+                'memory_bytes_limit' : 1000, 'output_bytes_limit' : 50}
+        mocked_get_problem_limits_dict.return_value = {'1' : {
+            'cpuSeconds' : 3, 'languages' : {'Java' : {'cpuSeconds' : 6}}}}
+        java = Language('Java', limits={'memoryBytes' : None,
+            'outputBytes' : 70})
+        python = Language('Python')
+        try:
+            javaLimits = Limits.get_limits(1, java)
+            self.assertEqual(javaLimits.cpuSeconds, 6)
+            self.assertEqual(javaLimits.memoryBytes, None)
+            self.assertEqual(javaLimits.outputBytes, 70)
+
+            pythonLimits = Limits.get_limits('1', python)
+            self.assertEqual(pythonLimits.cpuSeconds, 3)
+            self.assertEqual(pythonLimits.memoryBytes, 1000)
+
+            self.assertEqual(Limits.get_limits(2, python).cpuSeconds, 10)
+        finally:
+            Definitions._definitionsDict = None
+
+    def test_get_verdict(self):
+        """
+        Ensure Limits.get_verdict names the limit a run exceeded
+        """
+        limits = Limits(cpuSeconds=1, memoryBytes=1000)
+        self.assertEqual(limits.get_verdict(False), None)
+        self.assertEqual(limits.get_verdict(True, timedOut=True), Status.TLE)
+        self.assertEqual(limits.get_verdict(True, cpuTime=1.5), Status.TLE)
+        self.assertEqual(limits.get_verdict(True, outputExceeded=True),
+                Status.OLE)
+        self.assertEqual(limits.get_verdict(True, peakMemory=900), Status.MLE)
+        self.assertEqual(limits.get_verdict(True, peakMemory=100), Status.RTE)
+        self.assertEqual(limits.get_verdict(False, peakMemory=900), None)
+        self.assertEqual(limits.get_verdict(False, peakMemory=5000), None)
+
+    def test_get_preexec_function(self):
+        """
+        Ensure Limits.get_preexec_function is None without rlimits to apply
+        """
+        self.assertEqual(Limits(outputBytes=10).get_preexec_function(), None)
+        self.assertEqual(Limits(cpuSeconds=1).get_preexec_function(
+            includeCpu=False), None)
+        self.assertNotEqual(Limits(memoryBytes=10).get_preexec_function(),
+                None)
+
+    @mock.patch.object(Limits, 'get_problem_limits_filepath')
+    def test_set_problem_language_limits(self,
+            mocked_get_problem_limits_filepath):
+        """
+        Ensure Limits.set_problem_language_limits merges a language's limits
+        into the problem limits file
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, 'limits.json')
+            with open(filepath, 'w') as limitsFile:
+                json.dump({'problems' : {'1' : {'wallSeconds' : 5,
+                    'languages' : {'C++' : {'memoryBytes' : 10}}}}},
+                    limitsFile)
+            mocked_get_problem_limits_filepath.return_value = filepath
+
+            Limits.set_problem_language_limits(1, 'C++', {'cpuSeconds' : 2})
+            Limits.set_problem_language_limits(2, 'Java', {'cpuSeconds' : 4})
+            self.assertEqual(Limits.get_problem_limits_dict(), {
+                '1' : {'wallSeconds' : 5, 'languages' : {'C++' : {
+                    'memoryBytes' : 10, 'cpuSeconds' : 2}}},
+                '2' : {'languages' : {'Java' : {'cpuSeconds' : 4}}}})
@@ -0,0 +1,58 @@
+################################################################################
+# Filename: tests/test_matrix.py
+# Date:     16 October 2026
+#
+# Contains tests for util/subparsers/matrix.py
+################################################################################
+import unittest
+from unittest import mock
+from util.subparsers.matrix import _get_heaviest_cases, _get_recorded_time, \
+        _get_language_medians, _format_time
+
+class TestMatrix(unittest.TestCase):
+
+    def _get_case(self, inputSize, contentHash):
+        case = mock.MagicMock()
+        case.get_input_size.return_value = inputSize
+        case.get_content_hash.return_value = contentHash
+        return case
+
+    def test_get_heaviest_cases(self):
+        """
+        Ensure the cases with the largest inputs are chosen, largest first
+        """
+        cases = [self._get_case(size, str(size)) for size in [5, 50, 1, 20]]
+        self.assertEqual([case.get_input_size() for case in
+            _get_heaviest_cases(cases, 2)], [50, 20])
+        self.assertEqual(len(_get_heaviest_cases(cases, 10)), 4)
+
+    def test_get_recorded_time(self):
+        """
+        Ensure recorded times sum the median of each case, and are None if a
+        case has no recorded time
+        """
+        solution = mock.MagicMock(solutionWriter='a', problemNumber='1')
+        solution.solutionLanguage.name = 'Python'
+        cases = [self._get_case(1, 'x'), self._get_case(1, 'y')]
+        samples = {('a', 1, 'Python', 'x') : [1.0, 5.0, 2.0],
+                   ('a', 1, 'Python', 'y') : [0.5]}
+        self.assertEqual(_get_recorded_time(samples, solution, cases), 2.5)
+        self.assertIsNone(_get_recorded_time(samples, solution,
+            cases + [self._get_case(1, 'z')]))
+
+    def test_get_language_medians(self):
+        """
+        Ensure each language has the median of its timed solutions
+        """
+        self.assertEqual(_get_language_medians({('a', 'C++') : 1.0,
+            ('b', 'C++') : 3.0, ('a', 'Python') : 10.0,
+            ('b', 'Python') : None, ('c', 'Java') : None}),
+            {'C++' : 2.0, 'Python' : 10.0})
+
+    def test_format_time(self):
+        """
+        Ensure times are shown with their ratio to the fastest time
+        """
+        self.assertEqual(_format_time(0.5, 0.25), '0.500 x2.00')
+        self.assertEqual(_format_time(None, 0.25), '-')
+        self.assertEqual(_format_time(0, 0), '0.000')
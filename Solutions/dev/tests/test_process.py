@@ -0,0 +1,218 @@
+################################################################################
+# Filename: tests/test_process.py
+# Date:     16 October 2026
+#
+# Contains tests for util/process.py
+################################################################################
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from util.comparator import ExactComparator
+from util.process import InputFile, IOMode, run_process, \
+        run_process_async, kill_running_processes
+
+class TestProcess(unittest.TestCase):
+
+    def _get_command(self, code):
+        return [sys.executable, '-c', code]
+
+    def test_run_process(self):
+        """
+        Ensure run_process pipes input through the process and measures it
+        """
+        result = run_process(self._get_command(
+            'import sys; sys.stdout.write(sys.stdin.read()[::-1])'), b'abc', 5)
+        self.assertEqual(result.output, b'cba')
+        self.assertEqual(result.returnCode, 0)
+        self.assertFalse(result.timedOut)
+        self.assertGreater(result.cpuTime, 0)
+        self.assertGreaterEqual(result.wallTime, result.cpuTime / 2)
+        self.assertGreater(result.peakMemory, 0)
+
+    def test_run_process_large_input(self):
+        """
+        Ensure run_process does not deadlock when input and output both fill
+        their pipes
+        """
+        inputContents = b'x' * (1 << 20)
+        result = run_process(self._get_command(
+            'import sys\nfor line in sys.stdin.buffer: '
+            'sys.stdout.buffer.write(line)'), inputContents, 10)
+        self.assertEqual(result.output, inputContents)
+
+    def test_run_process_input_file(self):
+        """
+        Ensure InputFiles are opened as the standard input of the process
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'input.txt')
+            with open(path, 'wb') as inputFile:
+                inputFile.write(b'abc')
+            inputContents = InputFile(path)
+            self.assertEqual(len(inputContents), 3)
+            command = self._get_command('import os, sys; '
+                    'sys.stdout.write(str(os.path.isfile("/dev/stdin")) + '
+                    'sys.stdin.read()[::-1])')
+            self.assertEqual(run_process(command, inputContents, 5).output,
+                    b'Truecba')
+            self.assertEqual(asyncio.run(run_process_async(command,
+                inputContents, 5)).output, b'Truecba')
+
+    def test_run_process_memory(self):
+        """
+        Ensure run_process reports the peak memory of the process
+        """
+        result = run_process(self._get_command(
+            'data = bytearray(200 * 1024 * 1024)'), b'', 10)
+        self.assertGreater(result.peakMemory, 200 * 1024 * 1024)
+
+    @unittest.skipIf(not os.path.isfile('/proc/self/status'),
+            'Peak memory is only sampled from /proc')
+    def test_run_process_memory_large_runner(self):
+        """
+        Ensure the peak memory of a process does not include the memory of
+        the process running it
+        """
+        runnerData = b'x' * (300 * 1024 * 1024)
+        result = run_process(self._get_command(
+            'import time; time.sleep(0.1)'), b'', 10)
+        self.assertGreater(result.peakMemory, 0)
+        self.assertLess(result.peakMemory, 100 * 1024 * 1024)
+        result = run_process(self._get_command('import time\n'
+            'data = b"x" * (400 * 1024 * 1024)\ntime.sleep(0.1)'), b'', 10)
+        self.assertGreater(result.peakMemory, 400 * 1024 * 1024)
+        del runnerData
+
+    def test_run_process_exit_code(self):
+        """
+        Ensure run_process reports the exit code of the process
+        """
+        result = run_process(self._get_command('import sys; sys.exit(3)'),
+                b'', 5)
+        self.assertEqual(result.returnCode, 3)
+
+    def test_run_process_timeout(self):
+        """
+        Ensure run_process kills processes that run for too long
+        """
+        result = run_process(self._get_command('import time; time.sleep(30)'),
+                b'', 0.2)
+        self.assertTrue(result.timedOut)
+        self.assertLess(result.wallTime, 5)
+
+    def test_run_process_comparator(self):
+        """
+        Ensure run_process kills processes as soon as their output is wrong
+        """
+        comparator = ExactComparator('1\n2\n3')
+        result = run_process(self._get_command(
+            'import itertools\nfor number in itertools.count(1): '
+            'print(number * 2 - 1, flush=True)'), b'', 10,
+            comparator=comparator)
+        self.assertTrue(result.outputMismatched)
+        self.assertFalse(result.timedOut)
+        self.assertEqual(result.output, b'')
+        self.assertEqual(comparator.get_divergence(), 2)
+
+    def test_kill_running_processes(self):
+        """
+        Ensure kill_running_processes cuts short processes run by other threads
+        """
+        results = []
+        thread = threading.Thread(target=lambda: results.append(run_process(
+            self._get_command('print(1, flush=True); import time; '
+                'time.sleep(30)'), b'', 20)))
+        thread.start()
+        while thread.is_alive() and len(results) == 0:
+            kill_running_processes()
+            thread.join(0.05)
+        thread.join()
+        self.assertFalse(results[0].timedOut)
+        self.assertLess(results[0].wallTime, 10)
+
+    def test_run_process_async(self):
+        """
+        Ensure run_process_async pipes input through the process and measures it
+        """
+        result = asyncio.run(run_process_async(self._get_command(
+            'import sys; sys.stdout.write(sys.stdin.read()[::-1])'), b'abc', 5))
+        self.assertEqual(result.output, b'cba')
+        self.assertEqual(result.returnCode, 0)
+        self.assertGreater(result.cpuTime, 0)
+
+    def test_run_process_async_timeout(self):
+        """
+        Ensure run_process_async kills processes that run for too long
+        """
+        result = asyncio.run(run_process_async(self._get_command(
+            'import time; time.sleep(30)'), b'', 0.2))
+        self.assertTrue(result.timedOut)
+        self.assertLess(result.wallTime, 5)
+
+class TestProcessFileMode(unittest.TestCase):
+
+    def setUp(self):
+        IOMode.set_mode(IOMode.FILE)
+
+    def tearDown(self):
+        IOMode.set_mode(IOMode.PIPE)
+
+    def _get_command(self, code):
+        return [sys.executable, '-c', code]
+
+    def test_run_process(self):
+        """
+        Ensure run_process passes input and output as files in file mode
+        """
+        command = self._get_command('import os, sys; '
+                'sys.stdout.write(str(os.path.isfile("/dev/stdin")) + '
+                'str(os.path.isfile("/dev/stdout")) + sys.stdin.read()[::-1])')
+        result = run_process(command, b'abc', 5)
+        self.assertEqual(result.output, b'TrueTruecba')
+        self.assertEqual(result.returnCode, 0)
+        self.assertGreater(result.cpuTime, 0)
+        self.assertEqual(asyncio.run(run_process_async(command, b'abc',
+            5)).output, b'TrueTruecba')
+
+    def test_run_process_large_output(self):
+        """
+        Ensure large outputs are compared from the output file
+        """
+        inputContents = b'x' * (1 << 20)
+        command = self._get_command('import sys; '
+                'sys.stdout.buffer.write(sys.stdin.buffer.read() + b"\\n")')
+        comparator = ExactComparator(inputContents.decode('utf-8'))
+        run_process(command, inputContents, 10, comparator=comparator)
+        self.assertTrue(comparator.finish())
+
+        comparator = ExactComparator('y' * (1 << 20))
+        result = run_process(command, inputContents, 10,
+                comparator=comparator)
+        self.assertFalse(result.outputMismatched)
+        self.assertFalse(comparator.finish())
+
+    def test_run_process_output_limit(self):
+        """
+        Ensure processes are stopped once they write more than the output
+        limit into their output file
+        """
+        command = self._get_command('import sys\n'
+                'while True: sys.stdout.write("x" * 4096)')
+        for result in [run_process(command, b'', 10, outputLimit=1 << 16),
+                asyncio.run(run_process_async(command, b'', 10,
+                    outputLimit=1 << 16))]:
+            self.assertTrue(result.outputExceeded)
+            self.assertFalse(result.timedOut)
+
+    def test_run_process_timeout(self):
+        """
+        Ensure processes that run for too long are killed in file mode
+        """
+        command = self._get_command('import time; time.sleep(30)')
+        for result in [run_process(command, b'', 0.2), asyncio.run(
+                run_process_async(command, b'', 0.2))]:
+            self.assertTrue(result.timedOut)
+            self.assertLess(result.wallTime, 5)
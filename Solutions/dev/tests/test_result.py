@@ -0,0 +1,91 @@
+################################################################################
+# Filename: tests/test_result.py
+# Date:     16 October 2026
+#
+# Contains tests for util/result.py
+################################################################################
+import unittest
+from unittest import mock
+from util.result import CaseResult, Status, TimingSummary
+from util.solution import Solution
+
+class TestCaseResult(unittest.TestCase):
+
+    def test_set_samples(self):
+        """
+        Ensure CaseResult.set_samples keeps the median times and peak memory
+        of repeated runs
+        """
+        executionResults = [mock.MagicMock(cpuTime=cpuTime, wallTime=cpuTime
+            + 1, peakMemory=memory) for cpuTime, memory in [(3, 10), (1, 30),
+                (2, 20)]]
+        result = CaseResult(None, None, Status.PASS, '').set_samples(
+                executionResults)
+        self.assertEqual((result.cpuTime, result.wallTime, result.peakMemory),
+                (2, 3, 30))
+        self.assertEqual(result.get_cpu_samples(), [3, 1, 2])
+        self.assertEqual(CaseResult(None, None, Status.PASS, '',
+            cpuTime=4).get_cpu_samples(), [4])
+
+    def test_failed(self):
+        """
+        Ensure only results that went wrong are failures, and regressions are
+        reported apart from them
+        """
+        statuses = [Status.PASS, Status.FAIL, Status.TLE, Status.SKIP,
+                Status.REGRESSION]
+        results = [CaseResult(None, None, status, '') for status in statuses]
+        self.assertEqual([result.failed() for result in results],
+                [False, True, True, False, False])
+        self.assertEqual([result.regressed() for result in results],
+                [False, False, False, False, True])
+
+class TestTimingSummary(unittest.TestCase):
+
+    def _get_result(self, path, cpuTime, peakMemory=None):
+        solution = Solution(solutionPath=path, problemNumber='1')
+        return CaseResult(solution, mock.MagicMock(), Status.PASS, '',
+                cpuTime=cpuTime, wallTime=cpuTime, peakMemory=peakMemory)
+
+    def test_get_summary(self):
+        """
+        Ensure TimingSummary summarizes the slowest case of every solution
+        """
+        summary = TimingSummary()
+        summary.add(self._get_result('a/Problem1.py', 1.0, 10))
+        summary.add(self._get_result('a/Problem1.py', 3.0, 5))
+        summary.add(self._get_result('b/Problem1.py', 2.0))
+        summary.add(self._get_result('c/Problem1.cpp', 0.5))
+
+        problemSummary = summary.get_summary()['1']
+        self.assertEqual(problemSummary['cpuTime'], (0.5, 2.0, 3.0, 3))
+        self.assertEqual(problemSummary['peakMemory'], (10, 10, 10, 1))
+
+    def test_add_ignores_cached_results(self):
+        """
+        Ensure TimingSummary ignores results replayed from the result store
+        """
+        summary = TimingSummary()
+        result = self._get_result('a/Problem1.py', 1.0, 10)
+        result.cached = True
+        summary.add(result)
+        self.assertEqual(summary.get_summary(), {})
+
+    def test_add_ignores_compile_results(self):
+        """
+        Ensure TimingSummary ignores results without a case
+        """
+        summary = TimingSummary()
+        summary.add(None)
+        summary.add(CaseResult(Solution(problemNumber='1'), None, Status.FAIL,
+            'Compile Error'))
+        self.assertEqual(summary.get_summary(), {})
+
+    def test_add_ignores_skipped_results(self):
+        """
+        Ensure TimingSummary ignores results of cases that were not run
+        """
+        summary = TimingSummary()
+        summary.add(CaseResult(Solution(problemNumber='1'), mock.MagicMock(),
+            Status.SKIP, 'Not Run'))
+        self.assertEqual(summary.get_summary(), {})
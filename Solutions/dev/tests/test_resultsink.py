@@ -0,0 +1,98 @@
+################################################################################
+# Filename: tests/test_resultsink.py
+# Date:     16 October 2026
+#
+# Contains tests for util/resultsink.py
+################################################################################
+import unittest
+import tempfile
+import shutil
+import os
+import json
+import xml.etree.ElementTree as ElementTree
+from unittest import mock
+from util.case import Case, CaseType
+from util.definitions import Definitions
+from util.result import CaseResult, Status
+from util.resultsink import ResultSinks, JsonLinesSink, JUnitSink
+
+class TestResultSinks(unittest.TestCase):
+
+    def setUp(self):
+        self.sinkDir = tempfile.mkdtemp()
+        Definitions._definitionsDict = {'sample_case_type' : 'sample'}
+        solution = mock.MagicMock(solutionWriter='alice', problemNumber='3')
+        solution.solutionLanguage.name = 'Python'
+        self.results = [
+                CaseResult(solution, Case(CaseType.SAMPLE, 3, 1, ''), Status.PASS,
+                    'Correct Solution', cpuTime=0.5, wallTime=0.75,
+                    peakMemory=1024),
+                CaseResult(solution, Case(CaseType.SAMPLE, 3, 2, ''), Status.FAIL,
+                    'Incorrect Solution', diff=['-1', '+2 <&>']),
+                CaseResult(solution, Case(CaseType.SAMPLE, 3, 3, ''), Status.SKIP,
+                    'Not Run'),
+                CaseResult(solution, None, Status.FAIL, 'Compile Error'),
+                CaseResult(solution, Case(CaseType.SAMPLE, 3, 4, ''),
+                    Status.REGRESSION, '2.0x slower than baseline'),
+                None]
+
+    def tearDown(self):
+        shutil.rmtree(self.sinkDir)
+        Definitions._definitionsDict = None
+
+    def _write_results(self, sinkClass):
+        path = os.path.join(self.sinkDir, 'nested', 'results')
+        sink = sinkClass(path)
+        for result in self.results:
+            sink.add(result)
+        sink.close()
+        return path
+
+    def test_json_lines_sink(self):
+        """
+        Ensure JsonLinesSink writes a line of JSON for every result
+        """
+        with open(self._write_results(JsonLinesSink)) as resultsFile:
+            records = [json.loads(line) for line in resultsFile]
+
+        self.assertEqual(len(records), 5)
+        self.assertEqual(records[0], {'writer' : 'alice', 'problem' : 3,
+            'language' : 'Python', 'caseType' : 'sample', 'caseNumber' : 1,
+            'status' : 'PASS', 'message' : 'Correct Solution',
+            'cached' : False, 'cpuTime' : 0.5, 'wallTime' : 0.75,
+            'peakMemory' : 1024})
+        self.assertEqual(records[3]['caseNumber'], 'COMPILE')
+
+    def test_junit_sink(self):
+        """
+        Ensure JUnitSink writes a testcase for every result, marking failed
+        and skipped cases and reporting regressions without failing them
+        """
+        root = ElementTree.parse(self._write_results(JUnitSink)).getroot()
+        testcases = root.findall('./testsuite/testcase')
+
+        self.assertEqual(len(testcases), 5)
+        self.assertEqual(testcases[0].get('classname'), 'alice.problem3.Python')
+        self.assertEqual(testcases[0].get('name'), 'sample 1')
+        self.assertEqual(float(testcases[0].get('time')), 0.75)
+        self.assertIsNone(testcases[0].find('failure'))
+        self.assertEqual(testcases[1].find('failure').text, '-1\n+2 <&>')
+        self.assertEqual(testcases[2].find('skipped').get('message'),
+                'Not Run')
+        self.assertEqual(testcases[3].find('failure').get('message'),
+                'Compile Error')
+        self.assertIsNone(testcases[4].find('failure'))
+        self.assertEqual(testcases[4].find('system-out').text,
+                '2.0x slower than baseline')
+
+    def test_open_sinks(self):
+        """
+        Ensure ResultSinks.open_sinks only opens sinks with paths
+        """
+        self.assertEqual(ResultSinks.open_sinks(), [])
+        sinks = ResultSinks.open_sinks(os.path.join(self.sinkDir, 'a'),
+                os.path.join(self.sinkDir, 'b'))
+        self.assertEqual([type(sink) for sink in sinks], [JsonLinesSink,
+            JUnitSink])
+        for sink in sinks:
+            sink.close()
@@ -0,0 +1,68 @@
+################################################################################
+# Filename: tests/test_resultstore.py
+# Date:     16 October 2026
+#
+# Contains tests for util/resultstore.py
+################################################################################
+import unittest
+import tempfile
+import shutil
+import os
+from unittest import mock
+from util.resultstore import ResultStore
+from util.result import CaseResult, Status
+
+class TestResultStore(unittest.TestCase):
+
+    def setUp(self):
+        self.storeDir = tempfile.mkdtemp()
+        self.storePath = os.path.join(self.storeDir, 'results.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.storeDir)
+
+    @mock.patch.object(ResultStore, 'get_key')
+    def test_get_cached_result(self, mocked_get_key):
+        """
+        Ensure only passing results are reused, and that they are marked cached
+        """
+        mocked_get_key.side_effect = lambda solution, case: case
+        resultStore = ResultStore.load(self.storePath)
+        resultStore.record_result(CaseResult('solution', 'passing', Status.PASS,
+            'Correct Solution'))
+        resultStore.record_result(CaseResult('solution', 'failing', Status.FAIL,
+            'Incorrect Solution'))
+
+        cachedResult = resultStore.get_cached_result('solution', 'passing')
+        self.assertTrue(cachedResult.cached)
+        self.assertEqual(cachedResult.status, Status.PASS)
+        self.assertEqual(cachedResult.message, 'Correct Solution' + 
+                ResultStore.CACHED_SUFFIX)
+        self.assertEqual(resultStore.get_cached_result('solution', 'failing'),
+                None)
+        self.assertEqual(resultStore.get_cached_result('solution', 'new'), None)
+
+    @mock.patch.object(ResultStore, 'get_key')
+    def test_save_and_load(self, mocked_get_key):
+        """
+        Ensure results survive saving and reloading the store
+        """
+        mocked_get_key.side_effect = lambda solution, case: case
+        resultStore = ResultStore.load(self.storePath)
+        resultStore.record_result(CaseResult('solution', 'passing', Status.PASS,
+            'Correct Solution'))
+        resultStore.save()
+
+        reloadedStore = ResultStore.load(self.storePath)
+        self.assertNotEqual(reloadedStore.get_cached_result('other', 
+            'passing'), None)
+
+    def test_record_result_ignores_compile_results(self):
+        """
+        Ensure ResultStore.record_result ignores results without a case
+        """
+        resultStore = ResultStore.load(self.storePath)
+        resultStore.record_result(CaseResult('solution', None, Status.FAIL,
+            'Compile Error'))
+        resultStore.record_result(None)
+        self.assertEqual(resultStore._entries, {})
@@ -0,0 +1,125 @@
+################################################################################
+# Filename: tests/test_scheduler.py
+# Date:     16 October 2026
+#
+# Contains tests for util/scheduler.py
+################################################################################
+import asyncio
+import threading
+import unittest
+from util.scheduler import run_jobs, run_jobs_async, OrderedEmitter, \
+        get_longest_first_order, get_makespan, get_makespan_lower_bound
+
+class TestScheduler(unittest.TestCase):
+
+    def test_run_jobs_sequential(self):
+        """
+        Ensure run_jobs with a single worker runs jobs in order
+        """
+        results = []
+        run_jobs([1, 2, 3], lambda job: job * 2, 1,
+                lambda index, result: results.append((index, result)))
+        self.assertEqual(results, [(0, 2), (1, 4), (2, 6)])
+
+    def test_run_jobs_parallel(self):
+        """
+        Ensure run_jobs with many workers reports every job exactly once
+        """
+        results = {}
+        run_jobs(list(range(20)), lambda job: job * 2, 4,
+                lambda index, result: results.__setitem__(index, result))
+        self.assertEqual(results, {index: index * 2 for index in range(20)})
+
+    def test_run_jobs_stop_sequential(self):
+        """
+        Ensure run_jobs runs no more jobs once resultCallback returns True
+        """
+        ranJobs = []
+        def run_job(job):
+            ranJobs.append(job)
+            return job
+        self.assertTrue(run_jobs([1, 2, 3], run_job, 1,
+            lambda index, result: result == 2))
+        self.assertEqual(ranJobs, [1, 2])
+        self.assertFalse(run_jobs([1], run_job, 1, lambda index, result: None))
+
+    def test_run_jobs_stop_parallel(self):
+        """
+        Ensure run_jobs cancels jobs that have not started and cuts short
+        running ones once resultCallback returns True
+        """
+        cancelled = threading.Event()
+        ranJobs = []
+        def run_job(job):
+            ranJobs.append(job)
+            if job > 0:
+                cancelled.wait(10)
+            return job
+        results = []
+        def store_result(index, result):
+            results.append(result)
+            return True
+        self.assertTrue(run_jobs(list(range(100)), run_job, 2, store_result,
+            cancelFunction=cancelled.set))
+        self.assertEqual(results, [0])
+        self.assertLess(len(ranJobs), 100)
+
+    def test_run_jobs_async_stop(self):
+        """
+        Ensure run_jobs_async cancels jobs in flight once resultCallback
+        returns True
+        """
+        async def run_job(job):
+            if job > 0:
+                await asyncio.sleep(30)
+            return job
+        results = []
+        def store_result(index, result):
+            results.append(result)
+            return True
+        self.assertTrue(run_jobs_async(list(range(10)), run_job, 4,
+            store_result))
+        self.assertEqual(results, [0])
+
+    def test_get_longest_first_order(self):
+        """
+        Ensure get_longest_first_order orders jobs longest first, keeping the
+        order of jobs of equal duration
+        """
+        self.assertEqual(get_longest_first_order([1, 5, 2, 5]), [1, 3, 2, 0])
+
+    def test_get_makespan(self):
+        """
+        Ensure get_makespan starts each job on the first free worker
+        """
+        self.assertEqual(get_makespan([1, 1, 1, 5], 2), 6)
+        self.assertEqual(get_makespan([5, 1, 1, 1], 2), 5)
+        self.assertEqual(get_makespan([], 4), 0)
+        self.assertEqual(get_makespan_lower_bound([5, 1, 1, 1], 2), 5)
+        self.assertEqual(get_makespan_lower_bound([2, 2, 2, 2], 2), 4)
+
+class TestOrderedEmitter(unittest.TestCase):
+
+    def test_add_in_order(self):
+        """
+        Ensure OrderedEmitter.add emits in-order results immediately
+        """
+        emitted = []
+        emitter = OrderedEmitter(emitted.append)
+        emitter.add(0, 'a')
+        emitter.add(1, 'b')
+        self.assertEqual(emitted, ['a', 'b'])
+
+    def test_add_out_of_order(self):
+        """
+        Ensure OrderedEmitter.add holds results until all earlier ones arrive
+        """
+        emitted = []
+        emitter = OrderedEmitter(emitted.append)
+        emitter.add(2, 'c')
+        emitter.add(1, 'b')
+        self.assertEqual(emitted, [])
+        self.assertEqual(emitter.get_pending_count(), 2)
+        emitter.add(0, 'a')
+        self.assertEqual(emitted, ['a', 'b', 'c'])
+        self.assertEqual(emitter.get_pending_count(), 0)
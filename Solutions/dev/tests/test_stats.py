@@ -0,0 +1,84 @@
+################################################################################
+# Filename: tests/test_stats.py
+# Date:     16 October 2026
+#
+# Contains tests for util/stats.py
+################################################################################
+import unittest
+from unittest import mock
+from util import stats
+
+class TestSummaryStatistics(unittest.TestCase):
+
+    def test_percentile(self):
+        """
+        Ensure percentile interpolates linearly between the closest values
+        """
+        self.assertEqual(stats.percentile([4, 1, 3, 2], 0), 1)
+        self.assertEqual(stats.percentile([4, 1, 3, 2], 1), 4)
+        self.assertEqual(stats.percentile([4, 1, 3, 2], 0.5), 2.5)
+        self.assertAlmostEqual(stats.percentile([1, 2, 3, 4], 0.95), 3.85)
+        self.assertEqual(stats.percentile([7], 0.95), 7)
+
+    def test_standard_deviation(self):
+        """
+        Ensure standard_deviation is the sample standard deviation, and 0 for
+        a single value
+        """
+        self.assertAlmostEqual(stats.standard_deviation([2, 4, 4, 4, 5, 5, 7,
+            9]), 2.138089935)
+        self.assertEqual(stats.standard_deviation([3]), 0)
+
+    def test_bootstrap_confidence_interval(self):
+        """
+        Ensure bootstrap intervals hold the statistic, are reproducible with a
+        seed and do not widen past the values
+        """
+        values = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+        low, high = stats.bootstrap_confidence_interval(values, seed=1)
+        self.assertLessEqual(1, low)
+        self.assertLessEqual(low, 5.5)
+        self.assertLessEqual(5.5, high)
+        self.assertLessEqual(high, 10)
+        self.assertEqual(stats.bootstrap_confidence_interval(values, seed=1),
+                (low, high))
+
+        self.assertEqual(stats.bootstrap_confidence_interval([3, 3, 3]),
+                (3, 3))
+
+class TestMannWhitney(unittest.TestCase):
+
+    def test_mann_whitney_u(self):
+        """
+        Ensure mann_whitney_u counts larger pairs, with ties counting half
+        """
+        self.assertEqual(stats.mann_whitney_u([3, 4], [1, 2]), 4)
+        self.assertEqual(stats.mann_whitney_u([1, 2], [3, 4]), 0)
+        self.assertEqual(stats.mann_whitney_u([2, 5], [2, 3, 6]), 2.5)
+
+    def test_exact_p_value(self):
+        """
+        Ensure small samples use the exact distribution of U
+        """
+        self.assertAlmostEqual(stats.mann_whitney_p_value([6, 7, 8, 9, 10],
+            [1, 2, 3, 4, 5]), 1 / 252)
+        self.assertEqual(stats.mann_whitney_p_value([1, 2, 3], [4, 5, 6]), 1)
+        self.assertAlmostEqual(stats.mann_whitney_p_value([2, 4], [1, 3]),
+                2 / 6)
+        self.assertEqual(stats.mann_whitney_p_value([], [1]), 1)
+
+    def test_approximate_p_value(self):
+        """
+        Ensure the normal approximation agrees with the exact distribution
+        and handles ties
+        """
+        samples = [value + 0.5 for value in range(20)]
+        otherSamples = list(range(-4, 16))
+        exactPValue = stats.mann_whitney_p_value(samples, otherSamples)
+        with mock.patch.object(stats, 'MAX_EXACT_SAMPLE_PRODUCT', 0):
+            approximatePValue = stats.mann_whitney_p_value(samples,
+                    otherSamples)
+        self.assertAlmostEqual(exactPValue, approximatePValue, places=2)
+
+        self.assertLess(stats.mann_whitney_p_value([2] * 10, [1] * 10), 0.001)
+        self.assertEqual(stats.mann_whitney_p_value([1] * 5, [1] * 5), 1)
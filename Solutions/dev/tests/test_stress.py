@@ -0,0 +1,55 @@
+################################################################################
+# Filename: tests/test_stress.py
+# Date:     16 October 2026
+#
+# Contains tests for util/subparsers/stress.py
+################################################################################
+import unittest
+import tempfile
+import shutil
+import os
+from util import fileops
+from util.definitions import Definitions
+from util.subparsers.stress import Outcome, OUTPUT_PREVIEW_LENGTH, \
+        _group_outcomes, _save_case
+
+class TestStress(unittest.TestCase):
+
+    def setUp(self):
+        self.casesDir = tempfile.mkdtemp()
+        Definitions._definitionsDict = {'comparator' : 'tokens'}
+
+    def tearDown(self):
+        shutil.rmtree(self.casesDir)
+        Definitions._definitionsDict = None
+
+    def test_group_outcomes(self):
+        """
+        Ensure outcomes are grouped by the problem's comparator and errors
+        only match the same error
+        """
+        outcomes = [Outcome(output='1 2'), Outcome(output='1\n2'),
+                Outcome(error='Runtime Error'), Outcome(output='3'),
+                Outcome(error='Runtime Error'), Outcome(error='Time Limit')]
+        self.assertEqual(_group_outcomes(outcomes, 1),
+                [[0, 1], [2, 4], [3], [5]])
+        self.assertEqual(_group_outcomes(outcomes[:2], 1), [[0, 1]])
+
+    def test_outcome_str(self):
+        """
+        Ensure outcomes show their error or a preview of their output
+        """
+        self.assertEqual(str(Outcome(error='Runtime Error')), 'Runtime Error')
+        self.assertEqual(str(Outcome(output='a\nb')), 'a\\nb')
+        self.assertEqual(str(Outcome(output='x' * 100)),
+                'x' * OUTPUT_PREVIEW_LENGTH + '...')
+
+    def test_save_case(self):
+        """
+        Ensure inputs are saved as the next case of the case file
+        """
+        path = os.path.join(self.casesDir, 'problem1_stress.json')
+        self.assertEqual(_save_case(path, [1, 2]), 1)
+        self.assertEqual(_save_case(path, 'text'), 2)
+        self.assertEqual(fileops.get_json_dict(path), {'cases' : {
+            '1' : {'input' : [1, 2]}, '2' : {'input' : 'text'}}})
@@ -0,0 +1,203 @@
+################################################################################
+# Filename: tests/test_zygote.py
+# Date:     16 October 2026
+#
+# Contains tests for util/zygote.py
+################################################################################
+import os
+import resource
+import sys
+import tempfile
+import threading
+import unittest
+from util.comparator import ExactComparator
+from util.process import kill_running_processes
+from util.zygote import Zygote, Zygotes, ZygoteSpawnError
+
+@unittest.skipIf(not hasattr(os, 'fork'), 'Zygotes need fork')
+class TestZygote(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        Zygotes.close_all()
+        self.directory.cleanup()
+
+    def _write_script(self, code: str) -> str:
+        path = os.path.join(self.directory.name, 'solution.py')
+        with open(path, 'w') as scriptFile:
+            scriptFile.write(code)
+        return path
+
+    def _run_python(self, code: str, inputContents: bytes=b'', **kwargs):
+        return Zygotes.run_process(Zygote.KIND_PYTHON, [sys.executable,
+            self._write_script(code)], inputContents, **kwargs)
+
+    def test_run_python(self):
+        """
+        Ensure Python scripts run as __main__ with their input, arguments and
+        exit code
+        """
+        result = self._run_python('import sys\n'
+                'if __name__ == "__main__":\n'
+                '    sys.stdout.write(sys.stdin.read()[::-1])\n', b'abc',
+                timeout=10)
+        self.assertEqual(result.output, b'cba')
+        self.assertEqual(result.returnCode, 0)
+        self.assertFalse(result.timedOut)
+        self.assertGreater(result.peakMemory, 0)
+
+        self.assertEqual(self._run_python('import sys; sys.exit(3)',
+            timeout=10).returnCode, 3)
+        self.assertEqual(self._run_python('raise ValueError()',
+            timeout=10).returnCode, 1)
+
+    def test_run_python_thread(self):
+        """
+        Ensure the output of non-daemon threads that are never joined is kept,
+        as it is when the interpreter exits
+        """
+        result = self._run_python('import sys, threading\n'
+                'def main():\n'
+                '    print(sum(map(int, sys.stdin.read().split())))\n'
+                'threading.Thread(target=main).start()\n', b'1 2 3',
+                timeout=10)
+        self.assertEqual(result.output, b'6\n')
+        self.assertEqual(result.returnCode, 0)
+
+    def test_zygote_is_reused(self):
+        """
+        Ensure the cases of a thread share its zygote, and every case starts
+        from a fresh child
+        """
+        self._run_python('import sys; sys.modules["__main__"].seen = True',
+                timeout=10)
+        zygote = Zygotes.get_zygote(sys.executable)
+        result = self._run_python('import sys\n'
+                'print(hasattr(sys.modules["__main__"], "seen"))\n',
+                timeout=10)
+        self.assertEqual(result.output, b'False\n')
+        self.assertIs(Zygotes.get_zygote(sys.executable), zygote)
+
+        threadZygotes = []
+        thread = threading.Thread(target=lambda: threadZygotes.append(
+            Zygotes.get_zygote(sys.executable)))
+        thread.start()
+        thread.join()
+        self.assertIsNot(threadZygotes[0], zygote)
+
+    def test_run_native(self):
+        """
+        Ensure native programs are spawned with their input and limits
+        """
+        for rlimits in [None, [(0, (100, 100))]]:
+            result = Zygotes.run_process(Zygote.KIND_NATIVE, ['cat'],
+                    b'abc\n', 10, rlimits=rlimits)
+            self.assertEqual(result.output, b'abc\n')
+            self.assertEqual(result.returnCode, 0)
+
+        with self.assertRaises(ZygoteSpawnError):
+            Zygotes.run_process(Zygote.KIND_NATIVE, [os.path.join(
+                self.directory.name, 'missing')], b'', 10)
+        self.assertEqual(Zygotes.run_process(Zygote.KIND_NATIVE, ['true'],
+            b'', 10).returnCode, 0)
+
+    def test_run_native_spawned_with_limits(self):
+        """
+        Ensure native programs are spawned by a zygote with the limits of
+        its cases applied to itself, and their CPU time is limited once they
+        are spawned
+        """
+        memoryBytes = 1 << 30
+        rlimits = [(resource.RLIMIT_CPU, (1, 2)), (resource.RLIMIT_AS,
+            (memoryBytes, memoryBytes))]
+        result = Zygotes.run_process(Zygote.KIND_NATIVE, ['sh', '-c',
+            'ulimit -v'], b'', 10, rlimits=rlimits)
+        self.assertEqual(result.output, '{}\n'.format(memoryBytes //
+            1024).encode('utf-8'))
+
+        zygote = Zygotes.get_zygote(sys.executable, (tuple(rlimits), None))
+        self.assertEqual(resource.prlimit(zygote._process.pid,
+            resource.RLIMIT_AS), (memoryBytes, memoryBytes))
+        self.assertEqual(resource.prlimit(zygote._process.pid,
+            resource.RLIMIT_CPU)[0], resource.RLIM_INFINITY)
+
+        result = Zygotes.run_process(Zygote.KIND_NATIVE, ['sh', '-c',
+            'while :; do :; done'], b'', 10, rlimits=rlimits)
+        self.assertFalse(result.timedOut)
+        self.assertNotEqual(result.returnCode, 0)
+
+    def test_timeout(self):
+        """
+        Ensure cases are killed once they time out and the zygote still runs
+        the next case
+        """
+        result = self._run_python('while True: pass', timeout=0.5)
+        self.assertTrue(result.timedOut)
+        self.assertEqual(self._run_python('print(1)', timeout=10).output,
+                b'1\n')
+
+    def test_output_limit_and_comparator(self):
+        """
+        Ensure output past the limit is detected and output is compared as it
+        is read
+        """
+        result = self._run_python('print("a" * 1000)', timeout=10,
+                outputLimit=100)
+        self.assertTrue(result.outputExceeded)
+
+        comparator = ExactComparator('a' * 1000)
+        result = self._run_python('print("a" * 1000)', timeout=10,
+                comparator=comparator)
+        self.assertTrue(comparator.finish())
+
+    def test_kill_running_processes(self):
+        """
+        Ensure kill_running_processes kills the cases of zygotes
+        """
+        timer = threading.Timer(0.5, kill_running_processes)
+        timer.start()
+        result = self._run_python('while True: pass', timeout=30)
+        timer.join()
+        self.assertLess(result.wallTime, 10)
+        self.assertNotEqual(result.returnCode, 0)
+
+    def test_late_kill(self):
+        """
+        Ensure a kill that arrives after its case exited is ignored by the
+        zygote rather than sent to a reused pid or taken for a request
+        """
+        self.assertEqual(self._run_python('print(1)', timeout=10).output,
+                b'1\n')
+        zygote = Zygotes.get_zygote(sys.executable)
+        zygote._send_kill()
+        self.assertEqual(self._run_python('print(2)', timeout=10).output,
+                b'2\n')
+        self.assertIs(Zygotes.get_zygote(sys.executable)._process,
+                zygote._process)
+
+    @unittest.skipIf(not os.path.isfile('/proc/self/status'),
+            'Peak memory is only sampled from /proc')
+    def test_run_native_memory(self):
+        """
+        Ensure the peak memory of native programs is their own
+        """
+        result = Zygotes.run_process(Zygote.KIND_NATIVE, [sys.executable,
+            '-c', 'import time\ndata = b"x" * (200 * 1024 * 1024)\n'
+            'time.sleep(0.1)'], b'', 10)
+        self.assertGreater(result.peakMemory, 200 * 1024 * 1024)
+        self.assertLess(Zygotes.run_process(Zygote.KIND_NATIVE, ['sleep',
+            '0.1'], b'', 10).peakMemory, 100 * 1024 * 1024)
+
+    def test_supports(self):
+        """
+        Ensure only launchers of known kinds, and Python scripts without
+        interpreter options, are supported
+        """
+        self.assertTrue(Zygotes.supports('native', ['./a.out']))
+        self.assertTrue(Zygotes.supports('python', ['python3', 'a.py']))
+        self.assertFalse(Zygotes.supports('python', ['python3', '-O',
+            'a.py']))
+        self.assertFalse(Zygotes.supports('python', ['python3']))
+        self.assertFalse(Zygotes.supports(None, ['java', 'Main']))
@@ -0,0 +1,246 @@
+################################################################################
+# Filename: util/bulkgen.py
+# Date:     16 October 2026
+#
+# Contains the library generators, which build large case inputs such as long
+# arrays, trees, graphs and matrices with vectorized NumPy rather than Python
+# loops, and the benchmark of their throughput
+################################################################################
+from util import fileops
+from util.case import CaseFileWriter
+from util.perror import PyCException
+import json
+import random
+import time
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+DEFAULT_LOW = 0
+DEFAULT_HIGH = 10 ** 9
+DEFAULT_ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
+# Ranges of distinct values up to this many times the number of values are
+# permuted in full, and larger ones sampled
+DISTINCT_PERMUTATION_FACTOR = 2
+
+def _get_rng(seed: int):
+    if numpy is None:
+        raise PyCException('Error: Library generators require NumPy')
+    return numpy.random.default_rng(seed)
+
+def _get_integers(rng, size, low: int, high: int):
+    """
+    Gets uniform integers of low to high, inclusive
+    """
+    if low > high:
+        raise PyCException('Error: low must be at most high')
+    return rng.integers(low, high, size=size, endpoint=True, dtype=numpy.int64)
+
+def _get_weighted_edges(rng, edges, weights: list):
+    """
+    Adds a column of weights of weights[0] to weights[1] to edges, if weights
+    is given
+    """
+    if weights is None:
+        return edges
+    low, high = weights
+    return numpy.column_stack((edges, _get_integers(rng, len(edges), low,
+        high)))
+
+def _get_distinct_integers(rng, n: int, low: int, high: int):
+    """
+    Gets n distinct integers of low to high, inclusive, in random order.
+    Sampling without replacement permutes every value of the range, so it is
+    only used for ranges of up to DISTINCT_PERMUTATION_FACTOR * n values.
+    Larger ranges are sampled with replacement until n distinct values remain
+    """
+    if high - low + 1 < n:
+        raise PyCException('Error: There are fewer than {} distinct '
+                'values from {} to {}'.format(n, low, high))
+    if high - low + 1 <= DISTINCT_PERMUTATION_FACTOR * n:
+        return low + rng.choice(high - low + 1, size=n, replace=False)
+
+    # Draws are oversampled by the fraction expected to repeat, so that
+    # a single round is normally enough
+    population = high - low + 1
+    values = numpy.empty(0, dtype=numpy.int64)
+    while len(values) < n:
+        missing = n - len(values)
+        values = numpy.concatenate((values, _get_integers(rng, missing +
+            missing * n // population + 16, low, high)))
+        # Sorting and dropping repeated neighbours is much faster than
+        # numpy.unique for large arrays
+        values.sort()
+        values = values[numpy.concatenate(([True], values[1:] !=
+            values[:-1]))]
+    rng.shuffle(values)
+    return values[:n]
+
+def array(rng, n: int, low: int=DEFAULT_LOW, high: int=DEFAULT_HIGH,
+        distinct: bool=False, sort: bool=False) -> dict:
+    """
+    n integers of low to high, inclusive. The input is [n, values]
+    """
+    if distinct:
+        values = _get_distinct_integers(rng, n, low, high)
+    else:
+        values = _get_integers(rng, n, low, high)
+    if sort:
+        values.sort()
+    return {'n' : n, 'values' : values}
+
+def permutation(rng, n: int) -> dict:
+    """
+    A permutation of 1 to n. The input is [n, values]
+    """
+    return {'n' : n, 'values' : rng.permutation(n) + 1}
+
+def matrix(rng, rows: int, cols: int, low: int=DEFAULT_LOW,
+        high: int=DEFAULT_HIGH) -> dict:
+    """
+    A rows by cols matrix of integers of low to high, inclusive. The input is
+    [cols, matrix, rows]
+    """
+    return {'rows' : rows, 'cols' : cols, 'matrix' : _get_integers(rng,
+        (rows, cols), low, high)}
+
+def tree(rng, n: int, weights: list=None) -> dict:
+    """
+    The n - 1 edges [u, v] of a random tree of the vertices 1 to n, each
+    vertex joined to a random earlier vertex of a random labelling. Given
+    weights [low, high], each edge is [u, v, weight]. The input is [edges, n]
+    """
+    if n < 1:
+        raise PyCException('Error: A tree needs at least 1 vertex')
+    parents = (rng.random(n - 1) * numpy.arange(1, n)).astype(numpy.int64)
+    labels = rng.permutation(n) + 1
+    edges = numpy.column_stack((labels[parents], labels[1:]))
+    return {'n' : n, 'edges' : _get_weighted_edges(rng, edges, weights)}
+
+def graph(rng, n: int, m: int, simple: bool=False, connected: bool=False,
+        weights: list=None) -> dict:
+    """
+    The m edges [u, v] of a random undirected graph of the vertices 1 to n,
+    without self loops. A simple graph has no repeated edges, and a connected
+    graph starts from the edges of a random tree. Given weights [low, high],
+    each edge is [u, v, weight]. The input is [edges, n]
+    """
+    if n < 2 and m > 0:
+        raise PyCException('Error: Edges need at least 2 vertices')
+    if connected and m < n - 1:
+        raise PyCException('Error: A connected graph of {} vertices needs at '
+                'least {} edges'.format(n, n - 1))
+    if simple and m > n * (n - 1) // 2:
+        raise PyCException('Error: A simple graph of {} vertices has at most '
+                '{} edges'.format(n, n * (n - 1) // 2))
+
+    edges = tree(rng, n)['edges'] if connected else numpy.empty((0, 2),
+            dtype=numpy.int64)
+    while len(edges) < m:
+        missing = m - len(edges)
+        sources = rng.integers(1, n, size=missing, endpoint=True)
+        targets = (sources + rng.integers(0, n - 1, size=missing)) % n + 1
+        edges = numpy.concatenate((edges, numpy.column_stack((sources,
+            targets))))
+        if simple:
+            # Keep the first of every repeated edge, in either direction
+            keys = numpy.minimum(edges[:, 0], edges[:, 1]) * (n + 1) + \
+                    numpy.maximum(edges[:, 0], edges[:, 1])
+            _, first = numpy.unique(keys, return_index=True)
+            edges = edges[numpy.sort(first)]
+    edges = edges[rng.permutation(m)]
+    return {'n' : n, 'edges' : _get_weighted_edges(rng, edges, weights)}
+
+def string(rng, n: int, alphabet: str=DEFAULT_ALPHABET) -> dict:
+    """
+    n characters of alphabet. The input is [n, text]
+    """
+    characters = numpy.array(list(alphabet))
+    if len(characters) == 0:
+        raise PyCException('Error: The alphabet is empty')
+    return {'n' : n, 'text' : ''.join(characters[rng.integers(0,
+        len(characters), size=n)].tolist())}
+
+LIBRARY = {generatorFunction.__name__ : generatorFunction for
+        generatorFunction in [array, permutation, matrix, tree, graph, string]}
+
+def generate(name: str, seed: int, params: dict=None):
+    """
+    Runs the library generator called name with a seed and parameters
+
+    :return: The JSON value of the input it built, holding NumPy arrays
+    :raises PyCException: If there is no such generator or the parameters are
+                          not its own
+    """
+    if not name in LIBRARY:
+        raise PyCException('Error: {} is not a library generator, which are '
+                '{}'.format(name, ', '.join(sorted(LIBRARY))))
+    rng = _get_rng(seed)
+    try:
+        return LIBRARY[name](rng, **(params or {}))
+    except (TypeError, ValueError) as e:
+        raise PyCException('Error: Library generator {} failed with seed {}: '
+                '{}'.format(name, seed, e))
+
+# The parameters of each library generator that make an input of about size
+# elements
+BENCHMARK_PARAMS = {
+        'array' : lambda size: {'n' : size},
+        'permutation' : lambda size: {'n' : size},
+        'matrix' : lambda size: {'rows' : max(1, int(size ** 0.5)),
+            'cols' : max(1, int(size ** 0.5))},
+        'tree' : lambda size: {'n' : size // 2 + 1},
+        'graph' : lambda size: {'n' : max(2, size // 4), 'm' : size // 2},
+        'string' : lambda size: {'n' : size},
+        }
+
+def _build_python_array(seed: int, n: int) -> dict:
+    """
+    Builds the input of the array generator with a Python loop, as generator
+    programs do, for the benchmark to compare against
+    """
+    rng = random.Random(seed)
+    return {'n' : n, 'values' : [rng.randint(DEFAULT_LOW, DEFAULT_HIGH) for _
+        in range(n)]}
+
+def _time_case(path: str, build, writeInput) -> tuple:
+    """
+    Times building an input and writing it as the only case of the case file
+    at path
+
+    :return: (build seconds, write seconds)
+    """
+    startTime = time.perf_counter()
+    inputJson = build()
+    buildTime = time.perf_counter() - startTime
+
+    startTime = time.perf_counter()
+    writer = CaseFileWriter(path)
+    writeInput(writer, inputJson)
+    writer.close()
+    return (buildTime, time.perf_counter() - startTime)
+
+def benchmark(sizes: list, path: str, seed: int=1) -> list:
+    """
+    Times every library generator building an input of each size and writing
+    it to a case file at path. Each size is also timed building an array with
+    a Python loop and passing it through a single JSON string, the way the
+    output of generator programs is
+
+    :return: [(generator, size, build seconds, write seconds)]
+    """
+    def write_bulk(writer, inputJson):
+        writer.add(1, inputJson)
+
+    def write_string(writer, inputJson):
+        writer.add(1, json.loads(fileops.get_json_string(inputJson)))
+
+    rows = []
+    for size in sizes:
+        for name in sorted(LIBRARY):
+            rows.append((name, size) + _time_case(path, lambda: generate(name,
+                seed, BENCHMARK_PARAMS[name](size)), write_bulk))
+        rows.append(('python array', size) + _time_case(path, lambda:
+            _build_python_array(seed, size), write_string))
+    return rows
@@ -9,7 +9,11 @@ from util import fileops
 from util.variables import Variables
 from util.pathmapper import PathMapper
 from util.definitions import Definitions
-import difflib
+from util.diff import DiffMode, get_diff
+from util.perror import PyCException
+from util.process import InputFile, IOMode, materialize_input
+import os
+import threading
 
 class CaseType:
     """
@@ -52,21 +56,69 @@ class CaseType:
 
 class Case:
     """
-    Stores a general case object with specific input
+    Stores a general case object with specific input. The input is either a
+    string or, for cases whose input is kept in a sidecar file, an InputFile
+    that is only opened when the case is run
     """
     NAMING_DEFINITION_KEY = 'case_naming'
     CASES_JSON_KEY = 'cases'
     CASES_INPUT_KEY = 'input'
+    CASES_INPUT_FILE_KEY = 'input_file'
+
+    _materializeLock = threading.Lock()
 
     def __init__(self, caseType, problemNumber, caseNumber, inputContents):
         self.caseType = caseType
         self.problemNumber = problemNumber
         self.caseNumber = caseNumber
         self.inputContents = inputContents
+        self._contentHash = None
+        self._materializedInput = None
 
     def get_case_string(self):
         return CaseType.to_string(self.caseType)
 
+    def get_input_size(self) -> int:
+        """
+        Returns the length of the input, which is its size in bytes for the
+        ASCII input of most cases
+        """
+        return len(self.inputContents)
+
+    def get_process_input(self):
+        """
+        Returns the input to run the case with. In IOMode.FILE, string inputs
+        are written to a file once per case, which every run of the case
+        opens as its standard input
+        """
+        if isinstance(self.inputContents, InputFile) or \
+                not IOMode.get_mode() == IOMode.FILE:
+            return self.inputContents
+        with Case._materializeLock:
+            if self._materializedInput is None:
+                self._materializedInput = materialize_input(
+                        self.inputContents.encode('utf-8'))
+        return self._materializedInput
+
+    def get_content_hash(self) -> str:
+        """
+        Returns the sha256 of the input (and output, if known) of the case,
+        computed once per case
+        """
+        if self._contentHash is None:
+            self._contentHash = fileops.get_string_hash(
+                    fileops.get_json_string(self._get_hashed_contents()))
+        return self._contentHash
+
+    def _get_hashed_contents(self) -> list:
+        return [self._get_hashed_input()]
+
+    def _get_hashed_input(self):
+        if isinstance(self.inputContents, InputFile):
+            return {Case.CASES_INPUT_FILE_KEY : fileops.get_file_hash(
+                self.inputContents.path)}
+        return self.inputContents
+
 class KnownCase(Case):
     """
     Stores a general case object with specific input and output
@@ -78,12 +130,16 @@ class KnownCase(Case):
         super().__init__(caseType, problemNumber, caseNumber, inputContents)
         self.outputContents = str(outputContents)
 
+    def _get_hashed_contents(self) -> list:
+        return [self._get_hashed_input(), self.outputContents]
+
     def get_output_diff(self, otherOutput: str) -> str:
         """
-        Returns `diff otherOutput self.outputContents`
+        Returns `diff -u otherOutput self.outputContents`, or the lines around
+        their first difference if the full diff is too large to find
         """
-        return '\n'.join(difflib.ndiff(otherOutput.splitlines(),
-            self.outputContents.splitlines())) + '\n'
+        return '\n'.join(get_diff(otherOutput, self.outputContents,
+            DiffMode.FULL)) + '\n'
 
     @staticmethod
     def from_case(case, outputContents):
@@ -115,7 +171,7 @@ def _get_cases_from_json_file_given_problem_type(path, problemNumber, caseType):
     the case type and problem number
     """
     return get_cases_from_json(fileops.get_json_dict(path), problemNumber,
-            caseType)
+            caseType, fileops.get_parent_dir(path))
 
 def _get_file_problemnumber_type_tuple(path):
     """
@@ -172,18 +228,40 @@ def get_all_cases(problemNumber=None):
     return _get_all_cases(fileops.join_path(PathMapper._rootPath, 
         Definitions.get_value('test_directory')), problemNumber=problemNumber)
 
-def get_cases_from_json(json, problemNumber, caseType):
+def get_case_file_path(problemNumber, caseTypeName: str) -> str:
+    """
+    Gets the path of the case file of a problem and case type in the
+    definitions-defined case directory, named like every other case file
+    """
+    fileName = Definitions.get_value(Case.NAMING_DEFINITION_KEY).format(**{
+        Variables.get_variable_key_name(Variables.NAME_PROBLEM_NUMBER) :
+            problemNumber,
+        Variables.get_variable_key_name(Variables.NAME_CASE_TYPE) :
+            caseTypeName})
+    return PathMapper.get_mapped_path(Definitions.get_value('test_directory'),
+            fileName + '.json')
+
+def get_cases_from_json(json, problemNumber, caseType, directory: str=''):
     """
     Create a list of Case objects from the specified json with the provided
-    problem number and case type
+    problem number and case type. Cases may name an "input_file" instead of
+    an "input", a sidecar file holding the raw standard input of the case,
+    relative to directory. Sidecar files should be kept in a directory whose
+    name contains "_data", so that they are never read as case files
 
     :return: [Case]
     """
     caseList = []
 
     for caseNumberStr, caseContents in json[Case.CASES_JSON_KEY].items():
+        if Case.CASES_INPUT_FILE_KEY in caseContents:
+            inputContents = _get_input_file(fileops.join_path(directory,
+                caseContents[Case.CASES_INPUT_FILE_KEY]))
+        else:
+            inputContents = _parse_input_json(
+                    caseContents[Case.CASES_INPUT_KEY])
         caseObject = Case(caseType, problemNumber, int(caseNumberStr), 
-                _parse_input_json(caseContents[Case.CASES_INPUT_KEY]))
+                inputContents)
         if KnownCase.CASES_OUTPUT_KEY in caseContents:
             caseList.append(KnownCase.from_case(caseObject, 
                 caseContents[KnownCase.CASES_OUTPUT_KEY]))
@@ -192,6 +270,18 @@ def get_cases_from_json(json, problemNumber, caseType):
 
     return caseList
 
+def _get_input_file(path: str) -> InputFile:
+    """
+    Gets the InputFile of a sidecar file, keeping only its path and size
+
+    :raises PyCException: If the file does not exist
+    """
+    try:
+        return InputFile(path)
+    except OSError:
+        raise PyCException('Error: The input file {} does not exist'.format(
+            path)) from None
+
 def _parse_input_json(jsonData):
     if not isinstance(jsonData, dict):
         jsonData = [jsonData]
@@ -199,3 +289,58 @@ def _parse_input_json(jsonData):
     else:
         return fileops.get_json_string([jsonData[key] for key in 
             sorted(jsonData.keys())])
+
+class CaseFileWriter:
+    """
+    Writes a case file one case at a time, so that its cases never all have
+    to be held in memory. Cases are written to a hidden file beside the case
+    file, which replaces it once the writer is closed, so that an unfinished
+    file is never read as cases
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        parentDir = fileops.get_parent_dir(path)
+        if len(parentDir) > 0:
+            fileops.make(parentDir, fileops.FileType.DIRECTORY)
+        self._temporaryPath = fileops.join_path(parentDir, '.{}.{}.tmp'.format(
+            fileops.get_basename(path), os.getpid()))
+        self._file = open(self._temporaryPath, 'w')
+        self._file.write('{{{}:{{'.format(fileops.get_json_string(
+            Case.CASES_JSON_KEY)))
+        self._caseCount = 0
+
+    def add(self, caseNumber: int, inputJson, outputContents: str=None):
+        """
+        Writes a case
+
+        :param inputJson: The JSON value of the case's input, whose arrays may
+                          be NumPy arrays
+        :param outputContents: The output of the case, or None if unknown
+        """
+        if self._caseCount > 0:
+            self._file.write(',')
+        self._file.write('{}:{{{}:'.format(fileops.get_json_string(
+            str(caseNumber)), fileops.get_json_string(Case.CASES_INPUT_KEY)))
+        fileops.write_json(self._file, inputJson)
+        if not outputContents is None:
+            self._file.write(',{}:{}'.format(fileops.get_json_string(
+                KnownCase.CASES_OUTPUT_KEY), fileops.get_json_string(
+                    outputContents)))
+        self._file.write('}')
+        self._caseCount += 1
+
+    def close(self):
+        """
+        Ends the case file and moves it into place
+        """
+        self._file.write('}}')
+        self._file.close()
+        os.replace(self._temporaryPath, self._path)
+
+    def discard(self):
+        """
+        Deletes the unfinished case file, leaving any previous one in place
+        """
+        self._file.close()
+        os.remove(self._temporaryPath)
@@ -0,0 +1,353 @@
+################################################################################
+# Filename: util/comparator.py
+# Date:     16 October 2026
+#
+# Contains the comparators, which compare the output of a process with the
+# expected output of a case while the output is still being read, and the
+# logic for choosing the comparator of each problem
+################################################################################
+from util.definitions import Definitions
+from util.perror import PyCException
+import re
+
+# The most bytes a single UTF-8 character may take
+MAX_CHARACTER_BYTES = 4
+
+TOKEN_PATTERN = re.compile(rb'\S+')
+
+class Comparator:
+    """
+    Compares the output of a process, chunk by chunk, with the expected output
+    of a case. Comparators work on the raw bytes of the output in linear time
+    and keep nothing but a bounded window of the output around its first
+    wrong byte.
+
+    Subclasses implement feed and finish, calling _diverge with the offset of
+    the expected output at which the output went wrong.
+    """
+    NAME = None
+    WINDOW_BYTES = 1024
+
+    def __init__(self, expectedOutput: str, windowBytes: int=WINDOW_BYTES):
+        self.expectedOutput = expectedOutput
+        self._expected = expectedOutput.encode('utf-8')
+        self._windowBytes = windowBytes
+        # The offset of the first wrong byte and the output from it on
+        self._divergence = None
+        self._divergentOutput = b''
+
+    def feed(self, data: bytes) -> bool:
+        """
+        Compares the next chunk of output
+
+        :param data: The bytes read from the process
+        :return: False once the output is known to be wrong
+        """
+        raise NotImplementedError
+
+    def finish(self) -> bool:
+        """
+        Ends the output, checking that none of the expected output is missing
+
+        :return: Whether the output matched
+        """
+        raise NotImplementedError
+
+    def _diverge(self, offset: int, divergentOutput: bytes):
+        self._divergence = offset
+        self._divergentOutput = bytes(divergentOutput[:self._windowBytes])
+
+    def get_divergence(self):
+        """
+        Returns the offset into the expected output at which the output went
+        wrong, or None
+        """
+        return self._divergence
+
+    def _get_window_start(self) -> int:
+        # Windows start at the first line within windowBytes before the
+        # divergence, or mid-line if the divergent line is longer than that
+        start = self._divergence - self._windowBytes
+        if start <= 0:
+            return 0
+        lineEnd = self._expected.find(b'\n', start, self._divergence)
+        return start if lineEnd < 0 else lineEnd + 1
+
+    def get_output(self) -> str:
+        """
+        Returns the output if it matched, or else the window of the output
+        around the point at which it went wrong
+        """
+        if self._divergence is None:
+            return self.expectedOutput
+
+        # The output before the divergence matched, so it is shown as the
+        # expected output it matched
+        return (self._expected[self._get_window_start():self._divergence] +
+                self._divergentOutput).decode('utf-8', errors='replace')
+
+    def get_expected_output(self) -> str:
+        """
+        Returns the expected output if the output matched, or else the window
+        of the expected output which get_output's window is compared with
+        """
+        if self._divergence is None:
+            return self.expectedOutput
+
+        return self._expected[self._get_window_start():self._divergence +
+                self._windowBytes].decode('utf-8', errors='replace')
+
+class ExactComparator(Comparator):
+    """
+    Matches output which, with carriage returns removed, is the expected
+    output followed by a single character, normally the trailing newline.
+    Empty expected output also matches empty output, as test always allowed
+    """
+    NAME = 'exact'
+
+    def __init__(self, expectedOutput: str, windowBytes: int=
+            Comparator.WINDOW_BYTES):
+        super().__init__(expectedOutput, windowBytes)
+        # The number of bytes of the output that matched so far
+        self._offset = 0
+        # The bytes written after the expected output
+        self._tail = b''
+
+    def feed(self, data: bytes) -> bool:
+        if not self._divergence is None:
+            return False
+
+        data = data.replace(b'\r', b'')
+        matchLength = min(len(data), len(self._expected) - self._offset)
+        if not memoryview(data)[:matchLength] == memoryview(self._expected)[
+                self._offset:self._offset + matchLength]:
+            index = next(index for index in range(matchLength) if not
+                    data[index] == self._expected[self._offset + index])
+            self._diverge(self._offset + index, data[index:])
+            return False
+
+        self._offset += matchLength
+        if matchLength < len(data):
+            self._tail += data[matchLength:]
+            if len(self._tail) > MAX_CHARACTER_BYTES:
+                self._diverge(self._offset, self._tail)
+                return False
+
+        return True
+
+    def finish(self) -> bool:
+        if self._divergence is None and (self._offset < len(self._expected)
+                or not (_is_single_character(self._tail) or (len(self._tail)
+                    == 0 and len(self._expected) == 0))):
+            self._diverge(self._offset, self._tail)
+
+        return self._divergence is None
+
+class TokenComparator(Comparator):
+    """
+    Matches output with the same whitespace-separated tokens as the expected
+    output, however the tokens are spaced
+    """
+    NAME = 'tokens'
+
+    # Longer tokens than this past the length of the expected output cannot
+    # match, so no more of a token than this is kept between chunks
+    MAX_TOKEN_SLACK_BYTES = 64
+
+    def __init__(self, expectedOutput: str, windowBytes: int=
+            Comparator.WINDOW_BYTES):
+        super().__init__(expectedOutput, windowBytes)
+        # The offset in the expected output past the last matched token
+        self._expectedOffset = 0
+        # The token the last chunk ended in, which may go on in the next one
+        self._partialToken = b''
+
+    def _tokens_match(self, token: bytes, expectedToken: bytes) -> bool:
+        return token == expectedToken
+
+    def _compare_token(self, token: bytes, divergentOutput: bytes) -> bool:
+        """
+        Compares the next token of the output with the next expected token
+
+        :param divergentOutput: The output from the token on, kept if the
+                                token is wrong
+        """
+        expectedMatch = TOKEN_PATTERN.search(self._expected,
+                self._expectedOffset)
+        if expectedMatch is None:
+            self._diverge(len(self._expected), divergentOutput)
+        elif not self._tokens_match(token, expectedMatch.group()):
+            self._diverge(expectedMatch.start(), divergentOutput)
+        else:
+            self._expectedOffset = expectedMatch.end()
+        return self._divergence is None
+
+    def _compare_tokens(self, data: bytes, start: int, end: int) -> bool:
+        """
+        Compares the complete tokens of data between start and end
+        """
+        # Tokens spaced exactly as the expected ones are compared at once
+        tokens = data[start:end].strip()
+        if len(tokens) == 0:
+            return True
+        expectedMatch = TOKEN_PATTERN.search(self._expected,
+                self._expectedOffset)
+        if not expectedMatch is None:
+            tokensStart = expectedMatch.start()
+            tokensEnd = tokensStart + len(tokens)
+            nextByte = self._expected[tokensEnd:tokensEnd + 1]
+            if memoryview(self._expected)[tokensStart:tokensEnd] == tokens \
+                    and (len(nextByte) == 0 or nextByte.isspace()):
+                self._expectedOffset = tokensEnd
+                return True
+
+        # Tokens which are spaced differently are compared one by one. The
+        # rest of the output is only copied if a token is wrong
+        dataView = memoryview(data)
+        for match in TOKEN_PATTERN.finditer(data, start, end):
+            if not self._compare_token(match.group(),
+                    dataView[match.start():]):
+                return False
+        return True
+
+    def feed(self, data: bytes) -> bool:
+        if not self._divergence is None:
+            return False
+
+        start = 0
+        if len(self._partialToken) > 0:
+            match = TOKEN_PATTERN.match(data)
+            if not match is None and match.end() == len(data):
+                self._partialToken += data
+                if len(self._partialToken) > len(self._expected) + \
+                        self.MAX_TOKEN_SLACK_BYTES:
+                    token = self._partialToken
+                    self._partialToken = b''
+                    return self._compare_token(token, token)
+                return True
+
+            token = self._partialToken
+            if not match is None:
+                token += match.group()
+                start = match.end()
+            self._partialToken = b''
+            if not self._compare_token(token, token + data[start:]):
+                return False
+
+        # A token at the end of the chunk may go on in the next one
+        end = len(data)
+        if not data[-1:].isspace():
+            self._partialToken = data[start:].rsplit(None, 1)[-1]
+            end -= len(self._partialToken)
+
+        return self._compare_tokens(data, start, end)
+
+    def finish(self) -> bool:
+        if self._divergence is None and len(self._partialToken) > 0:
+            self._compare_token(self._partialToken, self._partialToken)
+            self._partialToken = b''
+        if self._divergence is None:
+            expectedMatch = TOKEN_PATTERN.search(self._expected,
+                    self._expectedOffset)
+            if not expectedMatch is None:
+                self._diverge(expectedMatch.start(), b'')
+
+        return self._divergence is None
+
+class NumericComparator(TokenComparator):
+    """
+    Matches output with the same tokens as the expected output, where tokens
+    that are both numbers match if they are within the tolerance of each
+    other, either absolutely or relative to the expected number
+    """
+    NAME = 'numeric'
+    DEFAULT_TOLERANCE = 1e-6
+
+    def __init__(self, expectedOutput: str, windowBytes: int=
+            Comparator.WINDOW_BYTES, tolerance: float=DEFAULT_TOLERANCE):
+        super().__init__(expectedOutput, windowBytes)
+        self._tolerance = tolerance
+
+    def _tokens_match(self, token: bytes, expectedToken: bytes) -> bool:
+        if token == expectedToken:
+            return True
+
+        try:
+            number = float(token)
+            expectedNumber = float(expectedToken)
+        except ValueError:
+            return False
+        return abs(number - expectedNumber) <= self._tolerance * max(1,
+                abs(expectedNumber))
+
+class Comparators:
+    """
+    Chooses the comparator of each problem from the definitions file. The
+    "comparator" definition names the comparator of every problem and may be
+    overridden for a single problem by a "problem_<number>_comparator"
+    definition. Tolerances of the numeric comparator are set the same way
+    with "comparator_tolerance" and "problem_<number>_comparator_tolerance".
+    """
+    COMPARATOR_KEY = 'comparator'
+    TOLERANCE_KEY = 'comparator_tolerance'
+    PROBLEM_KEY_FORMAT = 'problem_{}_{}'
+
+    ALL = {comparatorClass.NAME : comparatorClass for comparatorClass in
+           [ExactComparator, TokenComparator, NumericComparator]}
+
+    @classmethod
+    def _get_problem_value(cls, problemNumber, key: str):
+        """
+        Gets the definition given by key for the problem, falling back to the
+        definition shared by every problem
+        """
+        problemKey = cls.PROBLEM_KEY_FORMAT.format(int(problemNumber), key)
+        if Definitions.has_value(problemKey):
+            return Definitions.get_value(problemKey)
+        return Definitions.get_value(key)
+
+    @classmethod
+    def get_config(cls, problemNumber) -> tuple:
+        """
+        Gets the comparator settings of the problem
+
+        :return: (comparator name, tolerance)
+        """
+        name = cls._get_problem_value(problemNumber, cls.COMPARATOR_KEY)
+        tolerance = cls._get_problem_value(problemNumber, cls.TOLERANCE_KEY)
+        return (ExactComparator.NAME if name is None else name,
+                NumericComparator.DEFAULT_TOLERANCE if tolerance is None else
+                tolerance)
+
+    @classmethod
+    def get_comparator(cls, problemNumber, expectedOutput: str) -> Comparator:
+        """
+        Gets a new comparator of the problem for the expected output
+
+        :raises PyCException: If the definitions name an unknown comparator
+        """
+        name, tolerance = cls.get_config(problemNumber)
+        if not name in cls.ALL:
+            raise PyCException('Error: {} is an invalid comparator'.format(
+                name))
+        if name == NumericComparator.NAME:
+            return NumericComparator(expectedOutput, tolerance=tolerance)
+        return cls.ALL[name](expectedOutput)
+
+    @classmethod
+    def outputs_match(cls, problemNumber, output: str,
+            otherOutput: str) -> bool:
+        """
+        Checks whether two decoded outputs of the problem's solutions, which
+        have lost their trailing newline, are the same as far as the
+        problem's comparator can tell
+        """
+        comparator = cls.get_comparator(problemNumber, output)
+        comparator.feed((otherOutput + '\n').encode('utf-8'))
+        return comparator.finish()
+
+def _is_single_character(data: bytes) -> bool:
+    try:
+        return len(data.decode('utf-8')) == 1
+    except UnicodeDecodeError:
+        return False
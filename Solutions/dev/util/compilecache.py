@@ -0,0 +1,197 @@
+################################################################################
+# Filename: util/compilecache.py
+# Date:     16 October 2026
+#
+# Contains the CompileCache class, which keeps the artifacts (and failures) of
+# previous compilations on disk so unchanged solutions are not recompiled
+################################################################################
+from util import fileops
+from util.definitions import Definitions
+from util.pathmapper import PathMapper
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+
+class CompileCacheEntry:
+    """
+    The cached outcome of a single compilation
+    """
+    SUCCEEDED_KEY = 'succeeded'
+    ARTIFACTS_KEY = 'artifacts'
+    LOG_KEY = 'log'
+
+    def __init__(self, path, succeeded, artifacts, log):
+        self.path = path
+        self.succeeded = succeeded
+        self.artifacts = artifacts # {artifact filename : sha256}
+        self.log = log
+
+    def restore(self, directory):
+        """
+        Copies the cached artifacts into directory, skipping any artifact that
+        is already present and unchanged
+        """
+        for artifactName, artifactHash in self.artifacts.items():
+            artifactPath = fileops.join_path(directory, artifactName)
+            if (fileops.exists(artifactPath, fileops.FileType.FILE) and
+                    fileops.get_file_hash(artifactPath) == artifactHash):
+                continue
+            shutil.copy2(fileops.join_path(self.path, artifactName),
+                    artifactPath)
+
+class CompileCache:
+    """
+    A persistent cache of compilations keyed by the hash of the source file,
+    the resolved compile command and the version of the compiler
+    """
+    CACHE_DIRECTORY_KEY = 'compile_cache_directory'
+    DEFAULT_CACHE_DIRECTORY = '.cache/compile'
+    MANIFEST_FILE = 'manifest.json'
+    VERSION_FLAGS = ['--version', '-version']
+
+    _enabled = True
+    _compilerFingerprints = {}
+    _directoryLocks = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def set_enabled(cls, enabled: bool):
+        cls._enabled = enabled
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    def get_cache_path(cls) -> str:
+        """
+        Gets the directory of the cache from the definitions file
+        """
+        cacheDirectory = Definitions.get_value(cls.CACHE_DIRECTORY_KEY)
+        return PathMapper.get_mapped_path(cacheDirectory if not
+                cacheDirectory is None else cls.DEFAULT_CACHE_DIRECTORY)
+
+    @classmethod
+    def get_compiler_fingerprint(cls, compiler: str) -> str:
+        """
+        Gets a string identifying the installed version of the compiler. The
+        result is remembered for the lifetime of the process
+        """
+        with cls._lock:
+            if compiler in cls._compilerFingerprints:
+                return cls._compilerFingerprints[compiler]
+
+        fingerprint = str(shutil.which(compiler))
+        for versionFlag in cls.VERSION_FLAGS:
+            try:
+                versionProcess = subprocess.run([compiler, versionFlag],
+                        stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                        stderr=subprocess.STDOUT, timeout=30)
+            except Exception:
+                continue
+            if versionProcess.returncode == 0:
+                fingerprint += versionProcess.stdout.decode('utf-8', 'replace')
+                break
+
+        with cls._lock:
+            cls._compilerFingerprints[compiler] = fingerprint
+        return fingerprint
+
+    @classmethod
+    def get_key(cls, sourcePath: str, compileCommand: list) -> str:
+        """
+        Gets the cache key for compiling the source at sourcePath with the
+        given compile command
+        """
+        return fileops.get_string_hash(json.dumps([
+            fileops.get_file_hash(sourcePath), compileCommand,
+            cls.get_compiler_fingerprint(compileCommand[0])]))
+
+    @classmethod
+    def _get_entry_path(cls, key: str) -> str:
+        return fileops.join_path(cls.get_cache_path(), key[:2], key)
+
+    @classmethod
+    def get_entry(cls, key: str):
+        """
+        Gets the CompileCacheEntry stored under key, or None if there is none
+        """
+        entryPath = cls._get_entry_path(key)
+        manifestPath = fileops.join_path(entryPath, cls.MANIFEST_FILE)
+        if not fileops.exists(manifestPath, fileops.FileType.FILE):
+            return None
+
+        try:
+            manifest = fileops.get_json_dict(manifestPath)
+            return CompileCacheEntry(entryPath,
+                    manifest[CompileCacheEntry.SUCCEEDED_KEY],
+                    manifest[CompileCacheEntry.ARTIFACTS_KEY],
+                    manifest[CompileCacheEntry.LOG_KEY])
+        except Exception:
+            return None
+
+    @classmethod
+    def store_entry(cls, key: str, succeeded: bool, directory: str,
+            artifactNames: list, log: str):
+        """
+        Stores the outcome of a compilation under key, copying the artifacts
+        found in directory into the cache
+        """
+        entryPath = cls._get_entry_path(key)
+        fileops.make(fileops.get_parent_dir(entryPath),
+                fileops.FileType.DIRECTORY)
+
+        # Build the entry in a temporary directory so readers never observe a
+        # partially written entry
+        stagingPath = tempfile.mkdtemp(dir=fileops.get_parent_dir(entryPath))
+        try:
+            artifacts = {}
+            for artifactName in artifactNames:
+                artifactPath = fileops.join_path(directory, artifactName)
+                shutil.copy2(artifactPath, fileops.join_path(stagingPath,
+                    artifactName))
+                artifacts[artifactName] = fileops.get_file_hash(artifactPath)
+
+            fileops.write_json_dict(fileops.join_path(stagingPath,
+                cls.MANIFEST_FILE), {
+                    CompileCacheEntry.SUCCEEDED_KEY : succeeded,
+                    CompileCacheEntry.ARTIFACTS_KEY : artifacts,
+                    CompileCacheEntry.LOG_KEY       : log
+                })
+            fileops.remove(entryPath, fileops.FileType.DIRECTORY)
+            os.rename(stagingPath, entryPath)
+        except OSError:
+            # Another process stored the same entry first
+            fileops.remove(stagingPath, fileops.FileType.DIRECTORY)
+
+    @classmethod
+    def get_directory_lock(cls, directory: str):
+        """
+        Gets the lock which must be held while compiling into directory, so
+        that the artifacts of concurrent compilations can be told apart
+        """
+        with cls._lock:
+            if not directory in cls._directoryLocks:
+                cls._directoryLocks[directory] = threading.Lock()
+            return cls._directoryLocks[directory]
+
+def get_directory_snapshot(directory: str) -> dict:
+    """
+    Returns {filename: (modification time, size)} for the files in directory
+    """
+    snapshot = {}
+    for entry in os.scandir(directory):
+        if entry.is_file():
+            fileStat = entry.stat()
+            snapshot[entry.name] = (fileStat.st_mtime_ns, fileStat.st_size)
+    return snapshot
+
+def get_changed_files(before: dict, after: dict) -> list:
+    """
+    Returns the filenames that were added or modified between two snapshots
+    """
+    return sorted([fileName for fileName, fileState in after.items() if
+                   not before.get(fileName) == fileState])
@@ -26,6 +26,16 @@ class Definitions:
         else:
             return cls._definitionsDict[key]
 
+    @classmethod
+    def has_value(cls, key) -> bool:
+        """
+        Checks whether the definitions file defines key, even as null
+        """
+        if cls._definitionsDict is None:
+            cls.load_definitions()
+
+        return key in cls._definitionsDict
+
     @classmethod
     def load_definitions(cls):
         """
@@ -0,0 +1,296 @@
+################################################################################
+# Filename: util/diff.py
+# Date:     16 October 2026
+#
+# Contains functions for diffing outputs in bounded time: a window around the
+# first differing line, and unified diffs found with Myers' linear-space O(ND)
+# algorithm within a line and time budget
+################################################################################
+import time
+
+DEFAULT_CONTEXT_LINES = 3
+# Diffs of outputs with more lines than this, in total, are not attempted
+MAX_DIFF_LINES = 200000
+DIFF_TIMEOUT_SECONDS = 2
+
+BUDGET_EXCEEDED_MESSAGE = ('Full diff exceeded its budget, showing the first '
+        'difference')
+
+class DiffMode:
+    """
+    The ways in which outputs may be diffed. The first mode shows the lines
+    around the first difference, while the full mode shows every difference
+    if that can be found within the diff budget
+    """
+    FIRST = 'first'
+    FULL = 'full'
+
+    ALL = [FIRST, FULL]
+
+class DiffBudgetExceeded(Exception):
+    pass
+
+def _bisect(a: list, aLo: int, aHi: int, b: list, bLo: int, bHi: int,
+        deadline: float):
+    """
+    Finds the middle snake of the shortest edit script of a[aLo:aHi] and
+    b[bLo:bHi] by searching from both ends at once, in space linear in the
+    number of lines
+
+    :return: The point (x, y), relative to (aLo, bLo), at which the forward
+             and backward searches meet, or None if the ranges share nothing
+    :raises DiffBudgetExceeded: If the deadline passes
+    """
+    n = aHi - aLo
+    m = bHi - bLo
+    maxD = (n + m + 1) // 2
+    vOffset = maxD
+    vLength = 2 * maxD + 2
+    forward = [-1] * vLength
+    backward = [-1] * vLength
+    forward[vOffset + 1] = 0
+    backward[vOffset + 1] = 0
+    delta = n - m
+    # With an odd delta the forward search finds the overlap, else the
+    # backward one does
+    checkForward = delta % 2 == 1
+    # Diagonals that ran off the edges are no longer searched
+    forwardStart = forwardEnd = backwardStart = backwardEnd = 0
+
+    for d in range(maxD):
+        if not deadline is None and time.monotonic() > deadline:
+            raise DiffBudgetExceeded()
+
+        for k in range(-d + forwardStart, d + 1 - forwardEnd, 2):
+            kOffset = vOffset + k
+            if k == -d or (not k == d and forward[kOffset - 1] <
+                    forward[kOffset + 1]):
+                x = forward[kOffset + 1]
+            else:
+                x = forward[kOffset - 1] + 1
+            y = x - k
+            while x < n and y < m and a[aLo + x] == b[bLo + y]:
+                x += 1
+                y += 1
+            forward[kOffset] = x
+            if x > n:
+                forwardEnd += 2
+            elif y > m:
+                forwardStart += 2
+            elif checkForward:
+                backwardOffset = vOffset + delta - k
+                if 0 <= backwardOffset < vLength and \
+                        not backward[backwardOffset] == -1 and \
+                        x >= n - backward[backwardOffset]:
+                    return (x, y)
+
+        for k in range(-d + backwardStart, d + 1 - backwardEnd, 2):
+            kOffset = vOffset + k
+            if k == -d or (not k == d and backward[kOffset - 1] <
+                    backward[kOffset + 1]):
+                x = backward[kOffset + 1]
+            else:
+                x = backward[kOffset - 1] + 1
+            y = x - k
+            while x < n and y < m and a[aHi - x - 1] == b[bHi - y - 1]:
+                x += 1
+                y += 1
+            backward[kOffset] = x
+            if x > n:
+                backwardEnd += 2
+            elif y > m:
+                backwardStart += 2
+            elif not checkForward:
+                forwardOffset = vOffset + delta - k
+                if 0 <= forwardOffset < vLength and \
+                        not forward[forwardOffset] == -1:
+                    forwardX = forward[forwardOffset]
+                    if forwardX >= n - x:
+                        return (forwardX, vOffset + forwardX - forwardOffset)
+
+    return None
+
+def get_opcodes(a: list, b: list, deadline: float=None) -> list:
+    """
+    Finds a shortest edit script turning a into b
+
+    :param deadline: The time.monotonic() by which the script must be found
+    :return: [(tag, aLo, aHi, bLo, bHi)] like difflib's get_opcodes, with
+             tags 'equal', 'delete' and 'insert'
+    :raises DiffBudgetExceeded: If the deadline passes
+    """
+    opcodes = []
+
+    def add_opcode(tag, aLo, aHi, bLo, bHi):
+        if len(opcodes) > 0 and opcodes[-1][0] == tag:
+            lastOpcode = opcodes.pop()
+            aLo, bLo = lastOpcode[1], lastOpcode[3]
+        opcodes.append((tag, aLo, aHi, bLo, bHi))
+
+    # Ranges still to be diffed, and equal ranges to be added once the ranges
+    # before them have been, as a stack rather than by recursion
+    stack = [('diff', 0, len(a), 0, len(b))]
+    while len(stack) > 0:
+        tag, aLo, aHi, bLo, bHi = stack.pop()
+        if not tag == 'diff':
+            add_opcode(tag, aLo, aHi, bLo, bHi)
+            continue
+
+        prefixLength = 0
+        while aLo + prefixLength < aHi and bLo + prefixLength < bHi and \
+                a[aLo + prefixLength] == b[bLo + prefixLength]:
+            prefixLength += 1
+        if prefixLength > 0:
+            add_opcode('equal', aLo, aLo + prefixLength, bLo,
+                    bLo + prefixLength)
+            aLo += prefixLength
+            bLo += prefixLength
+
+        suffixLength = 0
+        while aHi - suffixLength > aLo and bHi - suffixLength > bLo and \
+                a[aHi - suffixLength - 1] == b[bHi - suffixLength - 1]:
+            suffixLength += 1
+        if suffixLength > 0:
+            stack.append(('equal', aHi - suffixLength, aHi,
+                bHi - suffixLength, bHi))
+            aHi -= suffixLength
+            bHi -= suffixLength
+
+        split = None
+        if aLo < aHi and bLo < bHi:
+            split = _bisect(a, aLo, aHi, b, bLo, bHi, deadline)
+        if split is None or split in [(0, 0), (aHi - aLo, bHi - bLo)]:
+            if aLo < aHi:
+                add_opcode('delete', aLo, aHi, bLo, bLo)
+            if bLo < bHi:
+                add_opcode('insert', aHi, aHi, bLo, bHi)
+            continue
+
+        x, y = split
+        stack.append(('diff', aLo + x, aHi, bLo + y, bHi))
+        stack.append(('diff', aLo, aLo + x, bLo, bLo + y))
+
+    return opcodes
+
+def _group_opcodes(opcodes: list, context: int) -> list:
+    """
+    Groups opcodes into hunks with at most context equal lines around their
+    changes, like difflib's get_grouped_opcodes
+    """
+    opcodes = list(opcodes)
+    if len(opcodes) == 0 or (len(opcodes) == 1 and opcodes[0][0] == 'equal'):
+        return []
+
+    # Trim the equal lines at the very start and end to the context
+    tag, aLo, aHi, bLo, bHi = opcodes[0]
+    if tag == 'equal':
+        opcodes[0] = (tag, max(aLo, aHi - context), aHi,
+                max(bLo, bHi - context), bHi)
+    tag, aLo, aHi, bLo, bHi = opcodes[-1]
+    if tag == 'equal':
+        opcodes[-1] = (tag, aLo, min(aHi, aLo + context), bLo,
+                min(bHi, bLo + context))
+
+    groups = []
+    group = []
+    for tag, aLo, aHi, bLo, bHi in opcodes:
+        # Long runs of equal lines end one hunk and start the next
+        if tag == 'equal' and aHi - aLo > 2 * context:
+            group.append((tag, aLo, min(aHi, aLo + context), bLo,
+                min(bHi, bLo + context)))
+            groups.append(group)
+            group = []
+            aLo = max(aLo, aHi - context)
+            bLo = max(bLo, bHi - context)
+        group.append((tag, aLo, aHi, bLo, bHi))
+
+    if len(group) > 0 and not (len(group) == 1 and group[0][0] == 'equal'):
+        groups.append(group)
+    return groups
+
+def _format_range(start: int, stop: int) -> str:
+    # Follows the range format of unified diffs
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return '{}'.format(beginning)
+    if length == 0:
+        beginning -= 1
+    return '{},{}'.format(beginning, length)
+
+def _get_hunk_lines(a: list, b: list, group: list) -> list:
+    lines = ['@@ -{} +{} @@'.format(_format_range(group[0][1], group[-1][2]),
+        _format_range(group[0][3], group[-1][4]))]
+    for tag, aLo, aHi, bLo, bHi in group:
+        if tag == 'equal':
+            lines.extend(' ' + line for line in a[aLo:aHi])
+        if tag == 'delete':
+            lines.extend('-' + line for line in a[aLo:aHi])
+        if tag == 'insert':
+            lines.extend('+' + line for line in b[bLo:bHi])
+    return lines
+
+def unified_diff(a: list, b: list, fromfile: str='', tofile: str='',
+        context: int=DEFAULT_CONTEXT_LINES, maxLines: int=MAX_DIFF_LINES,
+        timeout: float=DIFF_TIMEOUT_SECONDS) -> list:
+    """
+    Returns the lines of a unified diff turning the lines of a into the lines
+    of b
+
+    :param maxLines: The most lines a and b may have in total, or None
+    :param timeout: The most seconds to spend finding the diff, or None
+    :raises DiffBudgetExceeded: If the diff is too large to find in budget
+    """
+    if not maxLines is None and len(a) + len(b) > maxLines:
+        raise DiffBudgetExceeded()
+
+    groups = _group_opcodes(get_opcodes(a, b, None if timeout is None else
+        time.monotonic() + timeout), context)
+    if len(groups) == 0:
+        return []
+
+    lines = ['--- {}'.format(fromfile), '+++ {}'.format(tofile)]
+    for group in groups:
+        lines.extend(_get_hunk_lines(a, b, group))
+    return lines
+
+def first_difference_diff(a: list, b: list, fromfile: str='',
+        tofile: str='', context: int=DEFAULT_CONTEXT_LINES) -> list:
+    """
+    Returns the lines of a unified diff with a single hunk of the lines
+    around the first line at which a and b differ, in time linear in the
+    position of that line
+    """
+    index = 0
+    while index < len(a) and index < len(b) and a[index] == b[index]:
+        index += 1
+    if index == len(a) and index == len(b):
+        return []
+
+    contextStart = max(0, index - context)
+    aEnd = min(len(a), index + context + 1)
+    bEnd = min(len(b), index + context + 1)
+    group = [('equal', contextStart, index, contextStart, index),
+             ('delete', index, aEnd, index, index),
+             ('insert', aEnd, aEnd, index, bEnd)]
+    return ['--- {}'.format(fromfile), '+++ {}'.format(tofile)] + \
+            _get_hunk_lines(a, b, group)
+
+def get_diff(a: str, b: str, mode: str=DiffMode.FULL, fromfile: str='',
+        tofile: str='') -> list:
+    """
+    Diffs two outputs in the given DiffMode. Full diffs that exceed their
+    budget fall back to the first difference
+
+    :return: The lines of the diff, empty if the outputs are the same
+    """
+    aLines = a.splitlines()
+    bLines = b.splitlines()
+    if mode == DiffMode.FULL:
+        try:
+            return unified_diff(aLines, bLines, fromfile, tofile)
+        except DiffBudgetExceeded:
+            return [BUDGET_EXCEEDED_MESSAGE] + first_difference_diff(aLines,
+                    bLines, fromfile, tofile)
+
+    return first_difference_diff(aLines, bLines, fromfile, tofile)
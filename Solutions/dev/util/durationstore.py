@@ -0,0 +1,82 @@
+################################################################################
+# Filename: util/durationstore.py
+# Date:     16 October 2026
+#
+# Contains the DurationStore class, which remembers how long each solution
+# took on each case in previous test runs so that the durations of the next
+# run can be predicted
+################################################################################
+from util import fileops
+from util.jsonstore import JsonStore
+import json
+
+class DurationStore(JsonStore):
+    """
+    A persistent store of the wall times of solution/case pairs, keyed by the
+    writer, language and problem of the solution and the type and number of
+    the case. Unlike the ResultStore, durations outlive changes to solutions
+    and cases, since the last duration is still the best guess at the next.
+    """
+    STORE_FILE_KEY = 'duration_store_file'
+    DEFAULT_STORE_FILE = '.cache/durations.json'
+
+    # The weight of the newest duration of a pair against its history
+    SMOOTHING_FACTOR = 0.5
+    # The seconds per byte of input assumed of cases without history when no
+    # pair being predicted has history either
+    DEFAULT_SECONDS_PER_BYTE = 1e-7
+
+    @staticmethod
+    def get_key(solution, case) -> str:
+        """
+        Gets the key under which the duration of solution on case is stored
+        """
+        return json.dumps([solution.solutionWriter,
+            solution.solutionLanguage.name, int(solution.problemNumber),
+            case.get_case_string(), case.caseNumber])
+
+    def get_duration(self, solution, case):
+        """
+        Gets the smoothed wall time of solution on case in previous runs, or
+        None if the pair has never been run
+        """
+        with self._lock:
+            return self._entries.get(self.get_key(solution, case))
+
+    def record_result(self, result):
+        """
+        Records the wall time of a CaseResult. Results without a wall time,
+        such as compile, cached and skipped results, are ignored
+        """
+        if result is None or result.case is None or result.wallTime is None:
+            return
+
+        key = self.get_key(result.solution, result.case)
+        with self._lock:
+            previousDuration = self._entries.get(key)
+            self._entries[key] = result.wallTime if previousDuration is \
+                    None else (self.SMOOTHING_FACTOR * result.wallTime +
+                            (1 - self.SMOOTHING_FACTOR) * previousDuration)
+
+    def predict_durations(self, pairs: list) -> list:
+        """
+        Predicts the wall time of each solution/case pair. Pairs without
+        history are predicted from the size of their input, at the seconds
+        per byte of the pairs with history
+
+        :param pairs: The list of (solution, case) pairs to predict
+        :return: The list of predicted durations, in seconds
+        """
+        durations = [self.get_duration(solution, case) for solution, case in
+                     pairs]
+        sizes = [case.get_input_size() for _, case in pairs]
+
+        knownSize = sum(size for size, duration in zip(sizes, durations) if
+                        not duration is None)
+        knownDuration = sum(duration for duration in durations if not
+                            duration is None)
+        secondsPerByte = (knownDuration / knownSize if knownSize > 0 else
+                          self.DEFAULT_SECONDS_PER_BYTE)
+
+        return [size * secondsPerByte if duration is None else duration for
+                size, duration in zip(sizes, durations)]
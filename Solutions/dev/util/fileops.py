@@ -7,6 +7,7 @@
 ################################################################################
 import os
 import json
+import hashlib
 import shutil
 import csv
 import zipfile
@@ -110,17 +111,87 @@ def write_file(path, contents):
     with open(path, 'w+') as openFile:
         openFile.write(contents)
 
+def copy_file(path, destinationPath):
+    """
+    Copies the file at path to destinationPath, without reading it into memory
+    """
+    shutil.copyfile(path, destinationPath)
+
 def read_file(path):
     contents = ""
     with open(path, 'r') as openFile:
         contents = openFile.read()
     return contents
 
+def get_file_hash(path, blockSize=1 << 20):
+    """
+    Returns the hex sha256 digest of the contents of the file at path
+    """
+    fileHash = hashlib.sha256()
+    with open(path, 'rb') as openFile:
+        for block in iter(lambda: openFile.read(blockSize), b''):
+            fileHash.update(block)
+    return fileHash.hexdigest()
+
+def get_string_hash(contents: str):
+    """
+    Returns the hex sha256 digest of the utf-8 encoding of contents
+    """
+    return hashlib.sha256(contents.encode('utf-8')).hexdigest()
+
 def get_json_string(jsonData):
     """
     Returns a decoded json data chunk
     """
-    return str(json.dumps(jsonData, separators=(',', ':')))
+    return str(json.dumps(jsonData, separators=(',', ':'),
+        default=_get_array_json))
+
+def write_json(openFile, jsonData, chunkLength: int=1 << 16):
+    """
+    Writes the JSON of jsonData to openFile, writing arrays, whether lists or
+    NumPy arrays, chunkLength elements at a time, so that the JSON of a huge
+    array is never built as a single string
+    """
+    if isinstance(jsonData, dict):
+        openFile.write('{')
+        for index, (key, value) in enumerate(jsonData.items()):
+            if index > 0:
+                openFile.write(',')
+            openFile.write(get_json_string(str(key)) + ':')
+            write_json(openFile, value, chunkLength)
+        openFile.write('}')
+    elif isinstance(jsonData, (list, tuple)) or _is_array(jsonData):
+        openFile.write('[')
+        for start in range(0, len(jsonData), chunkLength):
+            if start > 0:
+                openFile.write(',')
+            chunk = jsonData[start:start + chunkLength]
+            if not _is_array(jsonData) and any(isinstance(value, (dict, list,
+                tuple)) or _is_array(value) for value in chunk):
+                for index, value in enumerate(chunk):
+                    if index > 0:
+                        openFile.write(',')
+                    write_json(openFile, value, chunkLength)
+            else:
+                openFile.write(get_json_string(chunk)[1:-1])
+        openFile.write(']')
+    else:
+        openFile.write(get_json_string(jsonData))
+
+def _is_array(jsonData) -> bool:
+    """
+    Whether jsonData is a NumPy array, found without importing NumPy
+    """
+    return hasattr(jsonData, 'tolist') and getattr(jsonData, 'ndim', 0) > 0
+
+def _get_array_json(jsonData):
+    """
+    Converts NumPy arrays and scalars to the lists and numbers of their JSON
+    """
+    if hasattr(jsonData, 'tolist'):
+        return jsonData.tolist()
+    raise TypeError('{} is not JSON serializable'.format(
+        type(jsonData).__name__))
 
 def zipdir(directory, zipfilePath):
     zipf = zipfile.ZipFile(zipfilePath, 'w')
@@ -0,0 +1,174 @@
+################################################################################
+# Filename: util/generator.py
+# Date:     16 October 2026
+#
+# Contains the generators, programs which print the input of a case given a
+# seed, and the per-problem generator configuration of the generators file
+################################################################################
+from util import bulkgen, fileops
+from util.definitions import Definitions
+from util.language import ExecutionError, Languages
+from util.pathmapper import PathMapper
+from util.perror import PyCException
+import json
+
+def get_program_language(path: str):
+    """
+    Gets the language of the program at path from its extension
+
+    :raises PyCException: If the extension is not of a known language
+    """
+    language = Languages.get_language_from_extension(fileops.get_extension(
+        path))
+    if language is None:
+        raise PyCException('Error: {} is not in a known language'.format(path))
+    return language
+
+def compile_program(path: str, verbose: bool=False):
+    """
+    Compiles the program at path, if its language is compiled
+
+    :raises PyCException: If it does not compile
+    """
+    try:
+        get_program_language(path).compile_code(path, verbose=verbose)
+    except ExecutionError as e:
+        raise PyCException('Error: Could not compile {}: {}'.format(path,
+            e.message))
+
+class Generator:
+    """
+    A program that prints the input of a case, in the JSON of a case file's
+    "input" key. The first line of its standard input holds a seed and the
+    second the JSON object of its parameters. Output that is not JSON is
+    taken as a single string input
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.language = get_program_language(path)
+
+    def compile(self, verbose: bool=False):
+        compile_program(self.path, verbose=verbose)
+
+    def generate(self, seed: int, params: dict=None, verbose: bool=False):
+        """
+        Runs the already compiled generator with a seed and parameters
+
+        :return: The JSON value of the input it printed
+        """
+        try:
+            output = self.language.execute_code(self.path, '{}\n{}\n'.format(
+                seed, json.dumps(params or {})), verbose=verbose)
+        except ExecutionError as e:
+            raise PyCException('Error: {} failed with seed {}: {}'.format(
+                self.path, seed, e.message))
+
+        try:
+            return json.loads(output)
+        except ValueError:
+            return output
+
+class GeneratorBlock:
+    """
+    The configuration of a generator of a problem's cases: the generator,
+    the seeds and parameters to run it with, the case type of the cases it
+    makes and, optionally, a reference solution that gives their outputs.
+    Instead of a generator program, a block may name a library generator of
+    util/bulkgen.py, which is run in-process. Seeds are either a list or a
+    count n, meaning the seeds 1 to n. Paths are relative to the root
+    directory
+    """
+    GENERATOR_KEY = 'generator'
+    LIBRARY_KEY = 'library'
+    SEEDS_KEY = 'seeds'
+    PARAMS_KEY = 'params'
+    CASE_TYPE_KEY = 'caseType'
+    REFERENCE_KEY = 'reference'
+
+    DEFAULT_CASE_TYPE = 'generated'
+
+    def __init__(self, generatorPath: str, seeds: list, params: dict=None,
+            caseType: str=DEFAULT_CASE_TYPE, referencePath: str=None,
+            libraryName: str=None):
+        self.generatorPath = generatorPath
+        self.seeds = seeds
+        self.params = params or {}
+        self.caseType = caseType
+        self.referencePath = referencePath
+        self.libraryName = libraryName
+
+    @classmethod
+    def load_from_dict(cls, blockDict: dict):
+        if (cls.GENERATOR_KEY in blockDict) == (cls.LIBRARY_KEY in blockDict):
+            raise PyCException('Error: Generator blocks must name either a {} '
+                    'or a {}'.format(cls.GENERATOR_KEY, cls.LIBRARY_KEY))
+        libraryName = blockDict.get(cls.LIBRARY_KEY)
+        if not libraryName is None and not libraryName in bulkgen.LIBRARY:
+            raise PyCException('Error: {} is not a library generator'.format(
+                libraryName))
+
+        seeds = blockDict.get(cls.SEEDS_KEY, 1)
+        if isinstance(seeds, int):
+            seeds = list(range(1, seeds + 1))
+        generatorPath = blockDict.get(cls.GENERATOR_KEY)
+        referencePath = blockDict.get(cls.REFERENCE_KEY)
+        return GeneratorBlock(
+                None if generatorPath is None else
+                PathMapper.get_mapped_path(generatorPath),
+                seeds, blockDict.get(cls.PARAMS_KEY),
+                blockDict.get(cls.CASE_TYPE_KEY, cls.DEFAULT_CASE_TYPE),
+                None if referencePath is None else
+                PathMapper.get_mapped_path(referencePath), libraryName)
+
+    def get_fingerprint(self) -> list:
+        """
+        Gets everything the cases of the block depend on, so that they are
+        only made again when it changes
+        """
+        if self.libraryName is None:
+            generatorFingerprint = fileops.get_file_hash(self.generatorPath)
+        else:
+            generatorFingerprint = [self.libraryName,
+                    fileops.get_file_hash(bulkgen.__file__)]
+        return [generatorFingerprint, self.seeds, self.params,
+                None if self.referencePath is None else
+                fileops.get_file_hash(self.referencePath)]
+
+class Generators:
+    """
+    Reads the generator blocks of every problem from the generators file,
+    which lives in the config directory and is named by the "generators_file"
+    definition, since definitions.json is a flat dictionary. The file maps
+    each problem number, under "problems", to a list of generator blocks
+    """
+    GENERATORS_FILE_KEY = 'generators_file'
+    PROBLEMS_KEY = 'problems'
+
+    @classmethod
+    def get_generators_filepath(cls):
+        """
+        Gets the filepath of the generators file, or None if definitions.json
+        names none
+        """
+        filename = Definitions.get_value(cls.GENERATORS_FILE_KEY)
+        if filename is None:
+            return None
+        return PathMapper.get_mapped_config_path(filename)
+
+    @classmethod
+    def get_problem_generators(cls) -> dict:
+        """
+        Gets the generator blocks of every problem
+
+        :return: {problem number : [GeneratorBlock]}
+        """
+        filepath = cls.get_generators_filepath()
+        if filepath is None or not fileops.exists(filepath,
+                fileops.FileType.FILE):
+            return {}
+
+        return {int(problemNumber) : [GeneratorBlock.load_from_dict(block)
+                for block in blocks] for problemNumber, blocks in
+                fileops.get_json_dict(filepath).get(cls.PROBLEMS_KEY,
+                    {}).items()}
@@ -0,0 +1,192 @@
+////////////////////////////////////////////////////////////////////////////////
+// Filename: util/harness/JavaHarness.java
+// Date:     16 October 2026
+//
+// The worker process of the Java harness. Runs the main method of a compiled
+// solution once for every case sent over stdin, without restarting the JVM.
+// System.exit is trapped with a security manager, so Java 18 to 23 must be
+// run with -Djava.security.manager=allow, and JVMs without one report the
+// solution as unsupported. Run as
+// $ java -cp <harness classes> JavaHarness <solution directory> <class name>
+////////////////////////////////////////////////////////////////////////////////
+import java.io.BufferedInputStream;
+import java.io.BufferedOutputStream;
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.File;
+import java.io.FileDescriptor;
+import java.io.FileInputStream;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.OutputStream;
+import java.io.PrintStream;
+import java.lang.management.ManagementFactory;
+import java.lang.management.ThreadMXBean;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.net.URL;
+import java.net.URLClassLoader;
+import java.nio.charset.StandardCharsets;
+import java.security.Permission;
+
+public class JavaHarness {
+
+    /** Thrown instead of exiting when a solution calls System.exit */
+    private static class ExitTrappedException extends SecurityException {
+        final int status;
+
+        ExitTrappedException(int status) {
+            this.status = status;
+        }
+    }
+
+    @SuppressWarnings("removal")
+    private static class ExitTrap extends SecurityManager {
+        @Override
+        public void checkPermission(Permission permission) {
+        }
+
+        @Override
+        public void checkExit(int status) {
+            if (caseInProgress) {
+                throw new ExitTrappedException(status);
+            }
+        }
+    }
+
+    private static OutputStream protocolOut;
+    private static volatile boolean caseInProgress = false;
+
+    public static void main(String[] args) throws IOException {
+        InputStream protocolIn = new BufferedInputStream(
+                new FileInputStream(FileDescriptor.in));
+        protocolOut = new BufferedOutputStream(
+                new FileOutputStream(FileDescriptor.out));
+        // Only the protocol may use stdin and stdout, so anything else the
+        // JVM or a solution prints outside of a case goes to stderr
+        System.setIn(new ByteArrayInputStream(new byte[0]));
+        System.setOut(System.err);
+        URL[] classPath = { new File(args[0]).toURI().toURL() };
+        String className = args[1];
+
+        // The solution's static initializers only run within a case
+        try (URLClassLoader loader = newLoader(classPath)) {
+            getMain(loader, className, false);
+        } catch (Throwable t) {
+            respond("UNSUPPORTED", t.toString().getBytes(StandardCharsets.UTF_8));
+            return;
+        }
+        if (!installExitTrap()) {
+            respond("UNSUPPORTED", "System.exit cannot be trapped"
+                    .getBytes(StandardCharsets.UTF_8));
+            return;
+        }
+        respond("READY", new byte[0]);
+
+        byte[] input;
+        while ((input = readRequest(protocolIn)) != null) {
+            ByteArrayOutputStream caseOutput = new ByteArrayOutputStream();
+            PrintStream caseOut = new PrintStream(caseOutput, false, "UTF-8");
+            System.setIn(new ByteArrayInputStream(input));
+            System.setOut(caseOut);
+            caseInProgress = true;
+
+            String status = "OK";
+            ThreadMXBean threads = ManagementFactory.getThreadMXBean();
+            long startCpuTime = threads.getCurrentThreadCpuTime();
+            // A fresh class loader gives every case fresh static state
+            try (URLClassLoader loader = newLoader(classPath)) {
+                getMain(loader, className, true).invoke(null,
+                        (Object) new String[0]);
+            } catch (Throwable t) {
+                // Static initializers may exit too, from within an
+                // ExceptionInInitializerError
+                Integer exitStatus = getExitStatus(t);
+                if (exitStatus == null || exitStatus != 0) {
+                    status = "ERROR";
+                    (t instanceof InvocationTargetException ? t.getCause() : t)
+                            .printStackTrace();
+                }
+            }
+
+            caseInProgress = false;
+            caseOut.flush();
+            System.setOut(System.err);
+            double cpuSeconds = (threads.getCurrentThreadCpuTime() - startCpuTime)
+                    / 1e9;
+            respond(status, status.equals("OK") ? caseOutput.toByteArray()
+                    : new byte[0], " " + cpuSeconds);
+        }
+    }
+
+    private static URLClassLoader newLoader(URL[] classPath) {
+        return new URLClassLoader(classPath,
+                JavaHarness.class.getClassLoader().getParent());
+    }
+
+    private static Method getMain(ClassLoader loader, String className,
+            boolean initialize) throws ReflectiveOperationException {
+        return Class.forName(className, initialize, loader).getMethod("main",
+                String[].class);
+    }
+
+    /**
+     * Traps System.exit with a security manager, returning false if the JVM
+     * does not allow one to be installed.
+     */
+    @SuppressWarnings("removal")
+    private static boolean installExitTrap() {
+        try {
+            System.setSecurityManager(new ExitTrap());
+            return true;
+        } catch (UnsupportedOperationException | SecurityException e) {
+            return false;
+        }
+    }
+
+    private static Integer getExitStatus(Throwable throwable) {
+        for (Throwable cause = throwable; cause != null; cause = cause.getCause()) {
+            if (cause instanceof ExitTrappedException) {
+                return ((ExitTrappedException) cause).status;
+            }
+        }
+        return null;
+    }
+
+    private static byte[] readRequest(InputStream protocolIn) throws IOException {
+        StringBuilder header = new StringBuilder();
+        int character;
+        while ((character = protocolIn.read()) != '\n') {
+            if (character < 0) {
+                return null;
+            }
+            header.append((char) character);
+        }
+
+        byte[] payload = new byte[Integer.parseInt(header.toString().trim())];
+        int offset = 0;
+        while (offset < payload.length) {
+            int read = protocolIn.read(payload, offset, payload.length - offset);
+            if (read < 0) {
+                return null;
+            }
+            offset += read;
+        }
+        return payload;
+    }
+
+    private static void respond(String status, byte[] payload)
+            throws IOException {
+        respond(status, payload, "");
+    }
+
+    /** Responds with any measurements of the case following the length */
+    private static void respond(String status, byte[] payload,
+            String measurements) throws IOException {
+        protocolOut.write((status + " " + payload.length + measurements + "\n")
+                .getBytes(StandardCharsets.UTF_8));
+        protocolOut.write(payload);
+        protocolOut.flush();
+    }
+}
@@ -0,0 +1,225 @@
+################################################################################
+# Filename: util/harness/base.py
+# Date:     16 October 2026
+#
+# Contains the Harness class, which manages a long-lived worker process that
+# runs many cases of a single solution without restarting
+################################################################################
+from util import fileops
+from util.definitions import Definitions
+from util.pathmapper import PathMapper
+from util.language import ExecutionError, ExecutionResult
+from util.limits import Limits
+from util.result import Status
+import os
+import selectors
+import subprocess
+import sys
+import threading
+import time
+
+class HarnessUnsupportedError(Exception):
+    def __init__(self, message):
+        self.message = message
+
+class HarnessTimeoutError(Exception):
+    pass
+
+class Harness:
+    """
+    Manages a worker process which speaks the harness protocol over its stdin
+    and stdout. Every message is a header line followed by a payload:
+
+    request:  "<payload length>\n<payload>"
+    response: "<status> <payload length> [<cpu seconds> [<peak bytes>]]\n<payload>"
+
+    The worker responds to its startup with READY or UNSUPPORTED and to every
+    request with OK (the payload is the output) or ERROR. Workers may report
+    the CPU time and peak memory of the case after the payload length. A
+    worker that crashes or times out is killed and restarted for the next case.
+
+    The worker runs under the memory and process count limits of the
+    solution. Wall time is limited per case, while the CPU time, output size
+    and memory reported for a case are checked once it finishes.
+    """
+    STATUS_READY = 'READY'
+    STATUS_UNSUPPORTED = 'UNSUPPORTED'
+    STATUS_OK = 'OK'
+    STATUS_ERROR = 'ERROR'
+
+    STARTUP_TIMEOUT_SECONDS = 20
+
+    def __init__(self, command: list, limits: Limits=None,
+            verbose: bool=False):
+        self._command = command
+        self._limits = Limits() if limits is None else limits
+        self._verbose = verbose
+        self._process = None
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+
+    def execute(self, inputContents: str) -> str:
+        """
+        Runs a single case in the worker and returns its output, raising an
+        ExecutionError if the case failed
+        """
+        return self.run(inputContents).output
+
+    def run(self, inputContents: str) -> ExecutionResult:
+        """
+        Runs a single case in the worker and returns an ExecutionResult,
+        raising an ExecutionError if the case failed
+        """
+        with self._lock:
+            # Workers may exit on their own, for example a JVM whose solution
+            # called Runtime.halt, so they are restarted when found dead
+            if not self._process is None and not self._process.poll() is None:
+                self._stop()
+            if self._process is None:
+                self._start()
+
+            encodedInput = inputContents.encode('utf-8')
+            startTime = time.monotonic()
+            try:
+                self._process.stdin.write('{}\n'.format(
+                    len(encodedInput)).encode('utf-8') + encodedInput)
+                self._process.stdin.flush()
+                status, payload, measurements = self._read_response(
+                        None if self._limits.wallSeconds is None else
+                        startTime + self._limits.wallSeconds)
+            except HarnessTimeoutError:
+                self._stop()
+                raise ExecutionError.from_verdict(Status.TLE, ExecutionResult(
+                    None, wallTime=time.monotonic() - startTime)) from None
+            except (OSError, EOFError, ValueError):
+                self._stop()
+                raise ExecutionError.from_verdict(Status.RTE, ExecutionResult(
+                    None, wallTime=time.monotonic() - startTime)) from None
+
+        result = ExecutionResult(None, wallTime=time.monotonic() - startTime)
+        if len(measurements) > 0:
+            result.cpuTime = float(measurements[0])
+        if len(measurements) > 1:
+            result.peakMemory = int(measurements[1])
+        verdict = self._limits.get_verdict(not status == self.STATUS_OK,
+                cpuTime=result.cpuTime, peakMemory=result.peakMemory,
+                outputExceeded=(not self._limits.outputBytes is None and
+                    len(payload) > self._limits.outputBytes))
+        if not verdict is None:
+            raise ExecutionError.from_verdict(verdict, result)
+
+        result.output = self._get_decoded_output(payload)
+        return result
+
+    def _get_decoded_output(self, payload: bytes) -> str:
+        """
+        Turns the payload of an OK response into the output of the case
+        """
+        return payload.decode('utf-8', errors='replace')
+
+    def close(self):
+        with self._lock:
+            self._stop()
+
+    def _start(self):
+        """
+        Starts the worker and waits for it to report that it is ready
+        """
+        try:
+            # CPU time adds up over every case, so it is not an rlimit here
+            self._process = subprocess.Popen(self._command,
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                    stderr=(subprocess.DEVNULL if not self._verbose
+                        else sys.stderr),
+                    preexec_fn=self._limits.get_preexec_function(
+                        includeCpu=False))
+        except Exception:
+            self._process = None
+            raise HarnessUnsupportedError('Could not run command {}'.format(
+                self._command[0])) from None
+
+        try:
+            status, payload, _ = self._read_response(time.monotonic() +
+                    self.STARTUP_TIMEOUT_SECONDS)
+        except (HarnessTimeoutError, OSError, EOFError, ValueError):
+            status, payload = self.STATUS_UNSUPPORTED, b'Worker did not start'
+
+        if not status == self.STATUS_READY:
+            self._stop()
+            raise HarnessUnsupportedError(payload.decode('utf-8', 'replace'))
+
+    def _stop(self):
+        """
+        Kills and reaps the worker if it is running
+        """
+        if self._process is None:
+            return
+
+        try:
+            self._process.kill()
+        except OSError:
+            pass
+        self._process.wait()
+        self._process.stdin.close()
+        self._process.stdout.close()
+        self._process = None
+        self._buffer = bytearray()
+
+    def _read_response(self, deadline: float) -> tuple:
+        """
+        Reads a single response from the worker
+
+        :return: (status, payload, list of any reported measurements)
+        """
+        header = self._read_until_newline(deadline).decode('utf-8').split()
+        return (header[0], self._read_exactly(int(header[1]), deadline),
+                header[2:])
+
+    def _read_until_newline(self, deadline: float) -> bytes:
+        while self._buffer.find(b'\n') < 0:
+            self._fill_buffer(deadline)
+        newlineIndex = self._buffer.find(b'\n')
+        line = bytes(self._buffer[:newlineIndex])
+        del self._buffer[:newlineIndex + 1]
+        return line
+
+    def _read_exactly(self, length: int, deadline: float) -> bytes:
+        while len(self._buffer) < length:
+            self._fill_buffer(deadline)
+        data = bytes(self._buffer[:length])
+        del self._buffer[:length]
+        return data
+
+    def _fill_buffer(self, deadline: float):
+        """
+        Reads whatever the worker has written, waiting until the deadline,
+        or forever if it is None
+        """
+        fileDescriptor = self._process.stdout.fileno()
+        with selectors.DefaultSelector() as selector:
+            selector.register(fileDescriptor, selectors.EVENT_READ)
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if not remaining is None and remaining <= 0:
+                raise HarnessTimeoutError()
+            if len(selector.select(remaining)) == 0:
+                raise HarnessTimeoutError()
+
+        data = os.read(fileDescriptor, 1 << 16)
+        if len(data) == 0:
+            raise EOFError()
+        self._buffer.extend(data)
+
+def get_template_data(problemNumber) -> dict:
+    """
+    Gets the template data (argument names and method name) that the template
+    subcommand uses to generate stubs for a problem. Empty if there is none
+    """
+    dataFolder = Definitions.get_value('template_data_directory')
+    if dataFolder is None:
+        return {}
+
+    try:
+        return fileops.get_json_dict(PathMapper.get_mapped_path(dataFolder,
+            'problem{}.json'.format(problemNumber)))
+    except Exception:
+        return {}
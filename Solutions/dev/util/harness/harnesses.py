@@ -0,0 +1,63 @@
+################################################################################
+# Filename: util/harness/harnesses.py
+# Date:     16 October 2026
+#
+# Contains the Harnesses class, which keeps track of the running harness of
+# every solution
+################################################################################
+from util.harness.python import PythonHarness
+from util.harness.java import JavaHarness
+import threading
+
+class Harnesses:
+    """
+    Creates harnesses on demand, keyed by solution path, based on the harness
+    named by the solution's language in languages.json
+    """
+    HARNESS_TYPES = {
+            PythonHarness.NAME : PythonHarness,
+            JavaHarness.NAME   : JavaHarness
+            }
+
+    _harnesses = {} # {solution path : Harness or None if unsupported}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_harness(cls, solution, verbose: bool=False):
+        """
+        Gets the harness of the solution, or None if the solution cannot be
+        run in a harness
+        """
+        with cls._lock:
+            if not solution._path in cls._harnesses:
+                harnessType = cls.HARNESS_TYPES.get(
+                        solution.solutionLanguage.harness)
+                cls._harnesses[solution._path] = (None if harnessType is None
+                        else harnessType.from_solution(solution, verbose))
+
+            return cls._harnesses[solution._path]
+
+    @classmethod
+    def mark_unsupported(cls, solution):
+        """
+        Stops the harness of the solution and runs it without one from now on
+        """
+        with cls._lock:
+            harness = cls._harnesses.get(solution._path)
+            cls._harnesses[solution._path] = None
+
+        if not harness is None:
+            harness.close()
+
+    @classmethod
+    def close_all(cls):
+        """
+        Stops every running harness
+        """
+        with cls._lock:
+            harnesses = [harness for harness in cls._harnesses.values() if
+                         not harness is None]
+            cls._harnesses = {}
+
+        for harness in harnesses:
+            harness.close()
@@ -0,0 +1,140 @@
+################################################################################
+# Filename: util/harness/java.py
+# Date:     16 October 2026
+#
+# Contains the JavaHarness class, which runs every case of a compiled Java
+# solution in a single long-lived JVM
+################################################################################
+from util import fileops
+from util.compilecache import CompileCache
+from util.harness.base import Harness
+from util.language import AppliedLanguage
+import os
+import re
+import subprocess
+import threading
+
+class JavaHarness(Harness):
+    """
+    Runs a compiled Java solution by loading its class in a long-lived JVM
+    and invoking its main method for every case, with System.in and
+    System.out redirected to the case. Each case uses a fresh class loader,
+    so static state does not leak between cases.
+
+    System.exit is trapped with a security manager, which Java 18 deprecated
+    and Java 24 removed. Solutions run by JVMs without one are run in a
+    process per case instead.
+    """
+    NAME = 'java'
+    HARNESS_SOURCE = fileops.join_path(fileops.get_parent_dir(
+        os.path.abspath(__file__)), 'JavaHarness.java')
+    HARNESS_CLASS = 'JavaHarness'
+
+    # The versions from which the security manager must be allowed on the
+    # command line, and from which it cannot be installed at all
+    SECURITY_MANAGER_OPT_IN_VERSION = 18
+    SECURITY_MANAGER_REMOVED_VERSION = 24
+    ALLOW_SECURITY_MANAGER_OPTION = '-Djava.security.manager=allow'
+    VERSION_PATTERN = re.compile(r'version "(\d+)(?:\.(\d+))?')
+
+    _compiledDirectories = {} # {compiler : directory of JavaHarness.class}
+    _jvmOptions = {} # {java command : options, or None if unsupported}
+    _lock = threading.Lock()
+
+    @classmethod
+    def from_solution(cls, solution, verbose: bool=False):
+        """
+        Creates a harness for the solution, or returns None if the harness
+        itself cannot be compiled or the JVM cannot trap System.exit
+        """
+        appliedLanguage = AppliedLanguage.get_applied_language(solution._path,
+                solution.solutionLanguage)
+        jvmOptions = cls.get_jvm_options(appliedLanguage._runCommand)
+        if jvmOptions is None:
+            return None
+        harnessDirectory = cls._get_compiled_harness(
+                appliedLanguage._compileCommand or 'javac')
+        if harnessDirectory is None:
+            return None
+
+        return JavaHarness([appliedLanguage._runCommand] + jvmOptions + ['-cp',
+            harnessDirectory, cls.HARNESS_CLASS,
+            fileops.get_parent_dir(os.path.abspath(solution._path)),
+            fileops.get_basename_less_extension(solution._path)],
+            solution.get_limits(), verbose=verbose)
+
+    @classmethod
+    def get_jvm_options(cls, javaCommand: str):
+        """
+        Gets the options the JVM run by javaCommand needs to install the
+        harness' security manager, found once per command
+
+        :return: A list of options, or None if the JVM's version is unknown or
+                 its security manager was removed
+        """
+        with cls._lock:
+            if not javaCommand in cls._jvmOptions:
+                version = cls._get_java_version(javaCommand)
+                if version is None or version >= \
+                        cls.SECURITY_MANAGER_REMOVED_VERSION:
+                    cls._jvmOptions[javaCommand] = None
+                elif version >= cls.SECURITY_MANAGER_OPT_IN_VERSION:
+                    cls._jvmOptions[javaCommand] = [
+                            cls.ALLOW_SECURITY_MANAGER_OPTION]
+                else:
+                    cls._jvmOptions[javaCommand] = []
+            return cls._jvmOptions[javaCommand]
+
+    @classmethod
+    def _get_java_version(cls, javaCommand: str):
+        """
+        Gets the major version of the JVM, such as 8 for "1.8.0_292" or 21
+        for "21.0.1", from the version it prints, or None if it cannot be run
+        """
+        try:
+            versionProcess = subprocess.run([javaCommand, '-version'],
+                    stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT)
+        except Exception:
+            return None
+
+        match = cls.VERSION_PATTERN.search(versionProcess.stdout.decode(
+            'utf-8', errors='replace'))
+        if match is None:
+            return None
+        if match.group(1) == '1' and not match.group(2) is None:
+            return int(match.group(2))
+        return int(match.group(1))
+
+    @classmethod
+    def _get_compiled_harness(cls, compiler: str):
+        """
+        Compiles JavaHarness.java into the compile cache, once per compiler
+        version, and returns the directory holding the compiled class
+        """
+        with cls._lock:
+            if compiler in cls._compiledDirectories:
+                return cls._compiledDirectories[compiler]
+
+            harnessDirectory = fileops.join_path(CompileCache.get_cache_path(),
+                    cls.NAME, CompileCache.get_key(cls.HARNESS_SOURCE,
+                        [compiler]))
+            if not fileops.exists(fileops.join_path(harnessDirectory,
+                    cls.HARNESS_CLASS + '.class'), fileops.FileType.FILE):
+                fileops.make(harnessDirectory, fileops.FileType.DIRECTORY)
+                try:
+                    compileProcess = subprocess.run([compiler, '-d',
+                        harnessDirectory, cls.HARNESS_SOURCE],
+                        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL)
+                    if not compileProcess.returncode == 0:
+                        harnessDirectory = None
+                except Exception:
+                    harnessDirectory = None
+
+            cls._compiledDirectories[compiler] = harnessDirectory
+            return harnessDirectory
+
+    def _get_decoded_output(self, payload: bytes) -> str:
+        # The payload is everything main printed, as with a subprocess
+        return AppliedLanguage._get_decoded_output(payload)
@@ -0,0 +1,58 @@
+################################################################################
+# Filename: util/harness/python.py
+# Date:     16 October 2026
+#
+# Contains the PythonHarness class, which runs every case of a templated
+# Python solution in a single worker interpreter
+################################################################################
+from util import fileops
+from util.harness.base import Harness, get_template_data
+from util.language import AppliedLanguage
+import os
+import re
+
+class PythonHarness(Harness):
+    """
+    Runs a Python solution generated from a template by importing it once in
+    a worker interpreter and calling the template's method for every case.
+    The method's return value is formatted the way KnownCase formats the
+    expected output, so it is compared with str() of the case's output.
+    """
+    NAME = 'python'
+    WORKER_SCRIPT = fileops.join_path(fileops.get_parent_dir(
+        os.path.abspath(__file__)), 'python_worker.py')
+    CLASS_NAMING = 'Problem{}'
+
+    @classmethod
+    def from_solution(cls, solution, verbose: bool=False):
+        """
+        Creates a harness for the solution, or returns None if the solution
+        does not follow the template
+        """
+        methodName = get_template_data(solution.problemNumber).get('method')
+        className = cls.CLASS_NAMING.format(solution.problemNumber)
+        if methodName is None or not cls.follows_template(solution._path,
+                className, methodName):
+            return None
+
+        interpreter = AppliedLanguage.get_applied_language(solution._path,
+                solution.solutionLanguage)._runCommand
+        return PythonHarness([interpreter, cls.WORKER_SCRIPT, solution._path,
+            className, methodName], solution.get_limits(),
+            verbose=verbose)
+
+    @staticmethod
+    def follows_template(path: str, className: str, methodName: str) -> bool:
+        """
+        Checks whether the source at path defines the templated class and
+        method
+        """
+        try:
+            source = fileops.read_file(path)
+        except (OSError, UnicodeDecodeError):
+            return False
+
+        return (not re.search(r'^class\s+{}\b'.format(re.escape(className)),
+                    source, re.MULTILINE) is None and
+                not re.search(r'\bdef\s+{}\s*\('.format(re.escape(methodName)),
+                    source) is None)
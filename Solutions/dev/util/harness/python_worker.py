@@ -0,0 +1,88 @@
+################################################################################
+# Filename: util/harness/python_worker.py
+# Date:     16 October 2026
+#
+# The worker process of the Python harness. Imports a templated solution once
+# and calls its method for every case sent over stdin. Run as
+# $ python3 python_worker.py <solution path> <class name> <method name>
+#
+# This file is executed by the solution's interpreter, so it must not import
+# anything from util
+################################################################################
+import importlib.util
+import io
+import json
+import os
+import resource
+import sys
+import time
+
+def write_response(protocolOut, status: str, payload: str,
+        measurements: list=[]):
+    encodedPayload = payload.encode('utf-8')
+    header = [status, str(len(encodedPayload))]
+    header.extend(str(measurement) for measurement in measurements)
+    protocolOut.write((' '.join(header) + '\n').encode('utf-8') +
+            encodedPayload)
+    protocolOut.flush()
+
+def get_peak_memory() -> int:
+    # ru_maxrss is in kilobytes, except on macOS where it is in bytes
+    peakMemory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peakMemory if sys.platform == 'darwin' else peakMemory * 1024
+
+def read_request(protocolIn):
+    """
+    Reads a single request, returning None once the harness closes stdin
+    """
+    header = protocolIn.readline()
+    if len(header) == 0:
+        return None
+    return protocolIn.read(int(header)).decode('utf-8')
+
+def load_method(solutionPath: str, className: str, methodName: str):
+    """
+    Imports the solution without running its main block and returns the
+    bound method that solves the problem
+    """
+    spec = importlib.util.spec_from_file_location('pyc_solution',
+            solutionPath)
+    solutionModule = importlib.util.module_from_spec(spec)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(solutionPath)))
+    spec.loader.exec_module(solutionModule)
+    return getattr(getattr(solutionModule, className)(), methodName)
+
+def main(arguments):
+    # Keep the real stdout for the protocol and send anything the solution
+    # prints to stderr instead
+    protocolIn = os.fdopen(os.dup(0), 'rb')
+    protocolOut = os.fdopen(os.dup(1), 'wb')
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    sys.stdin = io.StringIO('')
+
+    try:
+        method = load_method(*arguments)
+    except BaseException as e:
+        write_response(protocolOut, 'UNSUPPORTED', repr(e))
+        return 1
+    write_response(protocolOut, 'READY', '')
+
+    while True:
+        inputContents = read_request(protocolIn)
+        if inputContents is None:
+            return 0
+
+        sys.stdin = io.StringIO(inputContents)
+        startTime = time.process_time()
+        try:
+            # Format the result the same way KnownCase stores expected output
+            result = str(method(*json.loads(inputContents)))
+        except BaseException as e:
+            write_response(protocolOut, 'ERROR', repr(e))
+            continue
+        write_response(protocolOut, 'OK', result,
+                [time.process_time() - startTime, get_peak_memory()])
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
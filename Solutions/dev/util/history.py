@@ -0,0 +1,276 @@
+################################################################################
+# Filename: util/history.py
+# Date:     16 October 2026
+#
+# Contains the ResultHistory class, which keeps every execution of every test
+# run in a SQLite database so that timings can be followed across runs
+################################################################################
+from util import fileops
+from util.definitions import Definitions
+from util.pathmapper import PathMapper
+import socket
+import sqlite3
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    hostname TEXT,
+    job_count INTEGER,
+    engine TEXT
+);
+CREATE TABLE IF NOT EXISTS executions (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    writer TEXT NOT NULL,
+    problem INTEGER NOT NULL,
+    language TEXT NOT NULL,
+    case_type TEXT NOT NULL,
+    case_number INTEGER NOT NULL,
+    solution_hash TEXT NOT NULL,
+    case_hash TEXT NOT NULL,
+    status TEXT NOT NULL,
+    cpu_time REAL,
+    wall_time REAL,
+    peak_memory INTEGER
+);
+CREATE INDEX IF NOT EXISTS executions_run ON executions (run_id);
+CREATE INDEX IF NOT EXISTS executions_solution ON executions
+    (problem, writer, language);
+"""
+
+class ResultHistory:
+    """
+    A SQLite database of test runs and the executions of every solution/case
+    pair within them. Results are added like those of a ResultSink and are
+    inserted in batches of BATCH_SIZE, each in a single transaction, so that
+    recording costs little even for runs of many cases
+    """
+    DATABASE_FILE_KEY = 'history_database_file'
+    DEFAULT_DATABASE_FILE = '.cache/history.db'
+    BATCH_SIZE = 1000
+
+    def __init__(self, path: str):
+        self._path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(SCHEMA)
+        self._runId = None
+        self._pendingRows = []
+
+    @classmethod
+    def get_database_path(cls) -> str:
+        """
+        Gets the path of the database from the definitions file
+        """
+        databaseFile = Definitions.get_value(cls.DATABASE_FILE_KEY)
+        return PathMapper.get_mapped_path(databaseFile if not databaseFile is
+                None else cls.DEFAULT_DATABASE_FILE)
+
+    @classmethod
+    def open(cls, path: str=None):
+        """
+        Opens the database at path, or at the definitions-defined database
+        file, creating it if it does not exist
+        """
+        path = path if not path is None else cls.get_database_path()
+        parentDir = fileops.get_parent_dir(path)
+        if len(parentDir) > 0:
+            fileops.make(parentDir, fileops.FileType.DIRECTORY)
+        return ResultHistory(path)
+
+    def start_run(self, jobCount: int=None, engine: str=None) -> int:
+        """
+        Records the start of a test run, which the results added after it
+        belong to
+
+        :return: The id of the run
+        """
+        with self._connection:
+            cursor = self._connection.execute('INSERT INTO runs (started_at, '
+                    'hostname, job_count, engine) VALUES (?, ?, ?, ?)',
+                    (time.time(), socket.gethostname(), jobCount, engine))
+        self._runId = cursor.lastrowid
+        return self._runId
+
+    def add(self, result):
+        """
+        Adds the executions of a CaseResult to the current run, one for every
+        sample of results with repeated runs. Results that are not
+        executions, such as compile, cached and skipped results, are ignored
+        """
+        if result is None or result.case is None or result.cached or \
+                result.skipped():
+            return
+
+        solution = result.solution
+        case = result.case
+        samples = result.samples if not result.samples is None else [
+                (result.cpuTime, result.wallTime, result.peakMemory)]
+        for cpuTime, wallTime, peakMemory in samples:
+            self._pendingRows.append((self._runId, solution.solutionWriter,
+                int(solution.problemNumber), solution.solutionLanguage.name,
+                result.get_case_string(), case.caseNumber,
+                solution.get_source_hash(), case.get_content_hash(),
+                result.status, cpuTime, wallTime, peakMemory))
+        if len(self._pendingRows) >= self.BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        """
+        Inserts every execution added since the last flush
+        """
+        if len(self._pendingRows) == 0:
+            return
+
+        with self._connection:
+            self._connection.executemany('INSERT INTO executions VALUES '
+                    '(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', self._pendingRows)
+        self._pendingRows = []
+
+    def close(self):
+        """
+        Inserts the remaining executions, records the end of the current run,
+        if any, and closes the database
+        """
+        self.flush()
+        if not self._runId is None:
+            with self._connection:
+                self._connection.execute('UPDATE runs SET finished_at = ? '
+                        'WHERE id = ?', (time.time(), self._runId))
+        self._connection.close()
+
+    def has_run(self, runId: int) -> bool:
+        return not self._connection.execute('SELECT id FROM runs WHERE id = ?',
+                (runId,)).fetchone() is None
+
+    def get_run_cpu_samples(self, runId: int) -> dict:
+        """
+        Gets the CPU times of the correct executions of a run
+
+        :return: {(writer, problem, language, case hash) : [CPU time]}
+        """
+        samples = {}
+        for writer, problem, language, caseHash, cpuTime in \
+                self._connection.execute("""
+                SELECT writer, problem, language, case_hash, cpu_time
+                FROM executions
+                WHERE run_id = ? AND status IN ('PASS', 'REGRESSION') AND
+                      cpu_time IS NOT NULL
+                """, (runId,)):
+            samples.setdefault((writer, problem, language, caseHash),
+                    []).append(cpuTime)
+        return samples
+
+    def get_latest_cpu_samples(self, writerNames: list=None,
+            languageNames: list=None, problemNumbers: list=None) -> dict:
+        """
+        Gets the CPU times of the correct executions of every solution in the
+        last run that ran it
+
+        :return: {(writer, problem, language, case hash) : [CPU time]}
+        """
+        clause, parameters = self._get_filter(writerNames, languageNames,
+                problemNumbers)
+        samples = {}
+        for writer, problem, language, caseHash, cpuTime in \
+                self._connection.execute("""
+                SELECT writer, problem, language, case_hash, cpu_time
+                FROM (SELECT executions.*, DENSE_RANK() OVER (
+                          PARTITION BY writer, problem, language
+                          ORDER BY run_id DESC) AS recency
+                      FROM executions
+                      WHERE 1 {})
+                WHERE recency = 1 AND status IN ('PASS', 'REGRESSION') AND
+                      cpu_time IS NOT NULL
+                """.format(clause), parameters):
+            samples.setdefault((writer, problem, language, caseHash),
+                    []).append(cpuTime)
+        return samples
+
+    @staticmethod
+    def get_sample_key(solution, case) -> tuple:
+        """
+        Gets the key of the samples of solution on case given by
+        get_latest_cpu_samples
+        """
+        return (solution.solutionWriter, int(solution.problemNumber),
+                solution.solutionLanguage.name, case.get_content_hash())
+
+    def _get_filter(self, writerNames: list, languageNames: list,
+            problemNumbers: list) -> tuple:
+        """
+        Builds the WHERE clause that limits executions to the given writers,
+        languages and problems. Empty or None lists do not limit anything
+
+        :return: (clause, parameters)
+        """
+        conditions = []
+        parameters = []
+        for column, values in [('writer', writerNames),
+                ('language', languageNames), ('problem', problemNumbers)]:
+            if values is None or len(values) == 0:
+                continue
+            conditions.append('{} IN ({})'.format(column, ', '.join(
+                ['?'] * len(values))))
+            parameters.extend(values)
+
+        clause = '' if len(conditions) == 0 else 'AND ' + ' AND '.join(
+                conditions)
+        return clause, parameters
+
+    def get_solution_trends(self, runCount: int, writerNames: list=None,
+            languageNames: list=None, problemNumbers: list=None) -> list:
+        """
+        Gets the timings of every solution in each of the last runCount runs
+        that ran it
+
+        :return: [(writer, problem, language, run id, run start time,
+                  solution hash, execution count, failure count, total CPU
+                  time, max CPU time, total wall time)], ordered by solution
+                  and then by run
+        """
+        clause, parameters = self._get_filter(writerNames, languageNames,
+                problemNumbers)
+        return self._connection.execute("""
+            SELECT writer, problem, language, run_id, started_at,
+                   solution_hash, COUNT(*), SUM(status != 'PASS'),
+                   SUM(cpu_time), MAX(cpu_time), SUM(wall_time)
+            FROM (SELECT executions.*, runs.started_at, DENSE_RANK() OVER (
+                      PARTITION BY writer, problem, language
+                      ORDER BY run_id DESC) AS recency
+                  FROM executions JOIN runs ON runs.id = executions.run_id
+                  WHERE 1 {})
+            WHERE recency <= ?
+            GROUP BY writer, problem, language, run_id
+            ORDER BY problem, writer, language, run_id
+            """.format(clause), parameters + [runCount]).fetchall()
+
+    def get_slowest_cases(self, caseCount: int, writerNames: list=None,
+            languageNames: list=None, problemNumbers: list=None) -> list:
+        """
+        Gets the caseCount cases of each problem whose executions took the
+        most CPU time on average over every recorded run
+
+        :return: [(problem, case type, case number, execution count, average
+                  CPU time, max CPU time, average wall time)], ordered by
+                  problem and then slowest first
+        """
+        clause, parameters = self._get_filter(writerNames, languageNames,
+                problemNumbers)
+        return self._connection.execute("""
+            SELECT problem, case_type, case_number, executions, average_cpu,
+                   max_cpu, average_wall
+            FROM (SELECT problem, case_type, case_number,
+                         COUNT(*) AS executions,
+                         AVG(cpu_time) AS average_cpu,
+                         MAX(cpu_time) AS max_cpu,
+                         AVG(wall_time) AS average_wall,
+                         ROW_NUMBER() OVER (PARTITION BY problem
+                             ORDER BY AVG(cpu_time) DESC) AS slowness
+                  FROM executions
+                  WHERE cpu_time IS NOT NULL {}
+                  GROUP BY problem, case_type, case_number)
+            WHERE slowness <= ?
+            ORDER BY problem, slowness
+            """.format(clause), parameters + [caseCount]).fetchall()
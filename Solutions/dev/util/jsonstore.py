@@ -0,0 +1,61 @@
+################################################################################
+# Filename: util/jsonstore.py
+# Date:     16 October 2026
+#
+# Contains the JsonStore class, the persistent JSON dictionary that the
+# result and duration stores build on
+################################################################################
+from util import fileops
+from util.definitions import Definitions
+from util.pathmapper import PathMapper
+import json
+import os
+import threading
+
+class JsonStore:
+    """
+    A dictionary kept in a JSON file whose path is named by the definitions
+    file. Subclasses set STORE_FILE_KEY and DEFAULT_STORE_FILE and keep their
+    entries in self._entries, guarded by self._lock
+    """
+    STORE_FILE_KEY = None
+    DEFAULT_STORE_FILE = None
+
+    def __init__(self, path):
+        self._path = path
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_store_path(cls) -> str:
+        """
+        Gets the path of the store file from the definitions file
+        """
+        storeFile = Definitions.get_value(cls.STORE_FILE_KEY)
+        return PathMapper.get_mapped_path(storeFile if not storeFile is None
+                else cls.DEFAULT_STORE_FILE)
+
+    @classmethod
+    def load(cls, path=None):
+        """
+        Loads the store from path, or from the definitions-defined store file.
+        A missing or unreadable store file results in an empty store
+        """
+        store = cls(path if not path is None else cls.get_store_path())
+        try:
+            store._entries = fileops.get_json_dict(store._path)
+        except Exception:
+            store._entries = {}
+        return store
+
+    def save(self):
+        """
+        Writes the store to its file, replacing the file atomically
+        """
+        fileops.make(fileops.get_parent_dir(self._path),
+                fileops.FileType.DIRECTORY)
+        with self._lock:
+            contents = json.dumps(self._entries, separators=(',', ':'))
+        temporaryPath = '{}.{}.tmp'.format(self._path, os.getpid())
+        fileops.write_file(temporaryPath, contents)
+        os.replace(temporaryPath, self._path)
@@ -9,12 +9,71 @@
 from util import fileops
 from util.pathmapper import PathMapper
 from util.variables import Variables
+from util.compilecache import CompileCache, get_directory_snapshot, get_changed_files
+from util.process import InputFile, run_process, run_process_async
+from util.limits import Limits
+from util.zygote import Zygotes
+from util.result import Status
+import asyncio
+import functools
 import subprocess
 import io, os, sys
 
+class ExecutionResult:
+    """
+    The output of a single execution of code and the resources it used. Times
+    are in seconds and memory is in bytes. Measurements which could not be
+    taken are None
+    """
+    def __init__(self, output: str, cpuTime: float=None, wallTime: float=None,
+            peakMemory: int=None, matched: bool=None,
+            expectedOutput: str=None):
+        self.output = output
+        self.cpuTime = cpuTime
+        self.wallTime = wallTime
+        self.peakMemory = peakMemory
+        # Whether a Comparator found the output to match, or None if the
+        # output was not checked. Wrong output is then only a window, which
+        # is compared with the window of the expected output
+        self.matched = matched
+        self.expectedOutput = expectedOutput
+
 class ExecutionError(Exception):
-    def __init__(self, message):
+    def __init__(self, message, result: ExecutionResult=None, verdict=None):
         self.message = message
+        # The measurements of the failed execution, if it got to run
+        self.result = result
+        # The Status naming how the execution failed, if it is known
+        self.verdict = verdict
+
+    @classmethod
+    def from_verdict(cls, verdict, result: ExecutionResult=None):
+        return ExecutionError(Status.MESSAGES[verdict], result, verdict)
+
+class CompileError(ExecutionError):
+    def __init__(self, message, log):
+        super().__init__(message)
+        self.log = log
+
+class ExecutionEngine:
+    """
+    The ways in which code may be executed. The blocking engine runs one
+    process per calling thread, while the async engine runs many processes
+    from a single asyncio event loop
+    """
+    BLOCKING = 'blocking'
+    ASYNC = 'async'
+
+    ALL = [BLOCKING, ASYNC]
+
+def _get_process_input(inputContents):
+    """
+    Encodes string input for a process, leaving InputFiles to be opened as
+    its standard input
+    """
+    if isinstance(inputContents, InputFile):
+        return inputContents
+    return inputContents.encode('utf-8')
         
 
 class Language:
@@ -25,11 +84,20 @@ class Language:
     RUN_EXTENSION_KEY = 'runExtension'
     RUN_COMMAND_KEY = 'runCommand'
     RUN_ARGS_KEY = 'runArguments'
+    HARNESS_KEY = 'harness'
+    LAUNCHER_KEY = 'launcher'
+    # Limits are set with flat keys such as "memoryBytesLimit"
+    LIMIT_KEY_SUFFIX = 'Limit'
 
     def __init__(self, languageName, compileExtension=None, compileCommand=None,
             compileArguments=None, runExtension=None, runCommand=None, 
-            runArguments=None):
+            runArguments=None, harness=None, limits=None, launcher=None):
         self.name = languageName
+        self.harness = harness
+        # The kind of zygote that runs the language's code, see Zygotes
+        self.launcher = launcher
+        # The limits block of the language, see Limits
+        self.limits = limits
         self._compileExtension = compileExtension
         self._compileCommand = compileCommand
         self._compileArguments = compileArguments
@@ -43,6 +111,16 @@ class Language:
     def __eq__(self, other):
         return self.name == self.other
 
+    def get_config_hash(self) -> str:
+        """
+        Returns the sha256 of the language's configuration, which identifies
+        how its solutions are compiled and run
+        """
+        return fileops.get_string_hash(fileops.get_json_string([self.name,
+            self._compileExtension, self._compileCommand, 
+            self._compileArguments, self._runExtension, self._runCommand,
+            self._runArguments]))
+
     def get_extension(self):
         if not self._compileExtension is None:
             return self._compileExtension
@@ -70,14 +148,48 @@ class Language:
                 runCommand=(languageBlockDict[cls.RUN_COMMAND_KEY]
                     if cls.RUN_COMMAND_KEY in languageBlockDict else None),
                 runArguments=(languageBlockDict[cls.RUN_ARGS_KEY]
-                    if cls.RUN_ARGS_KEY in languageBlockDict else None))
+                    if cls.RUN_ARGS_KEY in languageBlockDict else None),
+                harness=(languageBlockDict[cls.HARNESS_KEY]
+                    if cls.HARNESS_KEY in languageBlockDict else None),
+                limits=cls._get_limits_from_dict(languageBlockDict),
+                launcher=languageBlockDict.get(cls.LAUNCHER_KEY))
 
         return languageObject
 
+    @classmethod
+    def _get_limits_from_dict(cls, languageBlockDict: dict):
+        """
+        Gathers the limits set in a language block into a limits block, or
+        returns None if the language sets none
+        """
+        limits = {}
+        for limitKey in Limits.ALL_KEYS:
+            if limitKey + cls.LIMIT_KEY_SUFFIX in languageBlockDict:
+                limits[limitKey] = languageBlockDict[limitKey + 
+                        cls.LIMIT_KEY_SUFFIX]
+
+        return limits if len(limits) > 0 else None
+
     def execute_code(self, codePath, inputContents, verbose=False):
         return AppliedLanguage.get_applied_language(codePath, self).execute_code(inputContents, 
                 verbose=verbose)
 
+    async def execute_code_async(self, codePath, inputContents, verbose=False):
+        return await AppliedLanguage.get_applied_language(codePath, 
+                self).execute_code_async(inputContents, verbose=verbose)
+
+    def run_code(self, codePath, inputContents, verbose=False, limits=None,
+            comparator=None):
+        return AppliedLanguage.get_applied_language(codePath, self).run_code(
+                inputContents, verbose=verbose, limits=limits,
+                comparator=comparator)
+
+    async def run_code_async(self, codePath, inputContents, verbose=False,
+            limits=None, comparator=None):
+        return await AppliedLanguage.get_applied_language(codePath,
+                self).run_code_async(inputContents, verbose=verbose,
+                        limits=limits, comparator=comparator)
+
     def compile_code(self, codePath, verbose=False):
         AppliedLanguage.get_applied_language(codePath, self)._compile_code(verbose=verbose)
 
@@ -87,10 +199,12 @@ class AppliedLanguage(Language):
 
     def __init__(self, languageName, compileExtension=None, compileCommand=None,
             compileArguments=None, runExtension=None, runCommand=None, 
-            runArguments=None, path=None):
+            runArguments=None, path=None, launcher=None):
         super().__init__(languageName, compileExtension, compileCommand,
-                compileArguments, runExtension, runCommand, runArguments)
+                compileArguments, runExtension, runCommand, runArguments,
+                launcher=launcher)
         self._path = path
+        self._sourcePath = path
 
     @classmethod
     def get_applied_language(cls, solutionPath, solutionLanguage):
@@ -110,7 +224,7 @@ class AppliedLanguage(Language):
                 cls._get_formatted_str_rec(variableDictionary, solutionLanguage._runExtension),
                 cls._get_formatted_str_rec(variableDictionary, solutionLanguage._runCommand),
                 cls._get_formatted_str_rec(variableDictionary, solutionLanguage._runArguments),
-                solutionPath)
+                solutionPath, launcher=solutionLanguage.launcher)
 
         return cls._appliedLanguages[solutionPath]
 
@@ -136,21 +250,72 @@ class AppliedLanguage(Language):
 
         compileCommand = [self._compileCommand]
         compileCommand.extend(self._compileArguments)
+        if not CompileCache.is_enabled():
+            self._run_compiler(compileCommand, verbose)
+            return self._get_compiled_path()
+
+        directory = fileops.get_parent_dir(self._sourcePath)
+        try:
+            cacheKey = CompileCache.get_key(self._sourcePath, compileCommand)
+        except OSError:
+            raise ExecutionError('Could not read {}'.format(
+                self._sourcePath)) from None
+
+        with CompileCache.get_directory_lock(directory):
+            cacheEntry = CompileCache.get_entry(cacheKey)
+            if not cacheEntry is None:
+                if verbose and cacheEntry.log:
+                    sys.stderr.write(cacheEntry.log)
+                if not cacheEntry.succeeded:
+                    raise ExecutionError('Failed to compile')
+                try:
+                    cacheEntry.restore(directory)
+                    return self._get_compiled_path()
+                except OSError:
+                    # Fall back to compiling if the entry cannot be restored
+                    pass
+
+            snapshot = get_directory_snapshot(directory)
+            try:
+                compileLog = self._run_compiler(compileCommand, verbose)
+            except CompileError as e:
+                CompileCache.store_entry(cacheKey, False, directory, [], e.log)
+                raise
+            CompileCache.store_entry(cacheKey, True, directory,
+                    get_changed_files(snapshot, get_directory_snapshot(directory)),
+                    compileLog)
+
+        return self._get_compiled_path()
+
+    def _run_compiler(self, compileCommand: list, verbose=False):
+        """
+        Runs the compile command and returns the compiler's messages. Raises
+        a CompileError if the compiler reported a failure and an 
+        ExecutionError if it could not be run
+        """
         try:
-            if not subprocess.call(compileCommand, stderr = (open(os.devnull, 'w')
-                if not verbose else sys.stderr)) == 0:
-                raise ExecutionError('Failed to compile')
+            compileProcess = subprocess.run(compileCommand, 
+                    stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE)
         except Exception:
             raise ExecutionError('Could not run command {}'.format(
                 compileCommand[0])) from None
 
-        return fileops.get_path_with_changed_extension(self._path, 
+        compileLog = compileProcess.stderr.decode('utf-8', 'replace')
+        if verbose:
+            sys.stderr.write(compileLog)
+        if not compileProcess.returncode == 0:
+            raise CompileError('Failed to compile', compileLog)
+
+        return compileLog
+
+    def _get_compiled_path(self) -> str:
+        return fileops.get_path_with_changed_extension(self._sourcePath, 
                 self._runExtension)
 
-    def execute_code(self, inputContents, verbose=False):
+    def _get_run_command(self) -> list:
         """
-        Executes the code by first compiling it (if necessary), then running it,
-        then returning the output or an ExecutionError if one occurred
+        Returns the command, as a list of arguments, used to run the code
         """
         if not self._compileCommand is None:
             self._path = fileops.get_path_with_changed_extension(self._path,
@@ -158,22 +323,137 @@ class AppliedLanguage(Language):
 
         runCommand = [self._runCommand]
         runCommand.extend(self._runArguments)
+        return runCommand
+
+    @staticmethod
+    def _get_decoded_output(output: bytes) -> str:
+        """
+        Decodes the raw output of the code and strips its trailing newline.
+        Output that is not UTF-8 is kept with its invalid bytes replaced, as
+        the comparators show it
+        """
+        return output.decode('utf-8', errors='replace').replace('\r', '')[:-1]
+
+    def execute_code(self, inputContents, verbose=False):
+        """
+        Executes the code by first compiling it (if necessary), then running it,
+        then returning the output or an ExecutionError if one occurred
+        """
+        return self.run_code(inputContents, verbose=verbose).output
+
+    async def execute_code_async(self, inputContents, verbose=False):
+        """
+        Executes the code on the running asyncio event loop and returns the
+        output, raising an ExecutionError if one occurred
+        """
+        return (await self.run_code_async(inputContents, 
+            verbose=verbose)).output
+
+    def run_code(self, inputContents, verbose=False, limits=None,
+            comparator=None) -> ExecutionResult:
+        """
+        Runs the code within its Limits and returns an ExecutionResult holding
+        its output and the CPU time, wall time and peak memory of the process,
+        raising an ExecutionError if one occurred. Given a Comparator, the
+        output is checked as it is written and the code is stopped as soon as
+        it is wrong
+        """
+        limits = Limits() if limits is None else limits
+        runCommand = self._get_run_command()
         try:
-            encodedInput = inputContents.encode('utf-8')
-            output = subprocess.check_output(runCommand, input=encodedInput, 
-                stderr = (open(os.devnull, 'w') if not verbose else sys.stderr),
-                timeout=20).decode('utf-8')
-            if not output is None:
-                output = output.replace('\r','')
-        except subprocess.CalledProcessError as e:
-            raise ExecutionError('Runtime Error')
-        except subprocess.TimeoutExpired as e:
-            raise ExecutionError('Timeout Expired')
+            if self._uses_zygote(runCommand):
+                processResult = self._run_in_zygote(runCommand, inputContents,
+                        verbose, limits, comparator)
+            else:
+                processResult = run_process(runCommand, 
+                        _get_process_input(inputContents), limits.wallSeconds,
+                        stderr=(subprocess.DEVNULL if not verbose else
+                            sys.stderr),
+                        preexecFunction=limits.get_preexec_function(),
+                        outputLimit=limits.outputBytes,
+                        comparator=comparator)
         except Exception:
             raise ExecutionError('Could not run command {}'.format(
                 runCommand[0])) from None
 
-        return output[:-1]
+        return self._get_execution_result(processResult, limits,
+                comparator)
+
+    async def run_code_async(self, inputContents, verbose=False,
+            limits=None, comparator=None) -> ExecutionResult:
+        """
+        Runs the code within its Limits on the running asyncio event loop and
+        returns an ExecutionResult, raising an ExecutionError if one occurred.
+        The child process is killed and reaped if it times out or the caller
+        is cancelled.
+        """
+        limits = Limits() if limits is None else limits
+        runCommand = self._get_run_command()
+        try:
+            if self._uses_zygote(runCommand):
+                # Zygotes block, so they are run on the loop's thread pool,
+                # each thread with its own zygote
+                processResult = await asyncio.get_running_loop(
+                        ).run_in_executor(None, functools.partial(
+                            self._run_in_zygote, runCommand, inputContents,
+                            verbose, limits, comparator))
+            else:
+                processResult = await run_process_async(runCommand,
+                        _get_process_input(inputContents), limits.wallSeconds,
+                        stderr=(subprocess.DEVNULL if not verbose else None),
+                        preexecFunction=limits.get_preexec_function(),
+                        outputLimit=limits.outputBytes,
+                        comparator=comparator)
+        except Exception:
+            raise ExecutionError('Could not run command {}'.format(
+                runCommand[0])) from None
+
+        return self._get_execution_result(processResult, limits,
+                comparator)
+
+    def _uses_zygote(self, runCommand: list) -> bool:
+        return Zygotes.is_enabled() and Zygotes.supports(self.launcher,
+                runCommand)
+
+    def _run_in_zygote(self, runCommand: list, inputContents, verbose: bool,
+            limits: Limits, comparator=None):
+        """
+        Runs the code in a child of the calling thread's zygote and returns
+        its ProcessResult
+        """
+        return Zygotes.run_process(self.launcher, runCommand,
+                _get_process_input(inputContents), limits.wallSeconds,
+                stderr=(subprocess.DEVNULL if not verbose else sys.stderr),
+                rlimits=limits.get_rlimits(), outputLimit=limits.outputBytes,
+                comparator=comparator)
+
+    def _get_execution_result(self, processResult, limits,
+            comparator=None) -> ExecutionResult:
+        """
+        Turns the ProcessResult of a run into an ExecutionResult, raising an
+        ExecutionError carrying the measurements and verdict if the run failed
+        or exceeded its limits
+        """
+        result = ExecutionResult(None, processResult.cpuTime,
+                processResult.wallTime, processResult.peakMemory)
+        # Code killed for wrong output did not fail, its output was wrong
+        killedForOutput = processResult.outputMismatched
+        verdict = limits.get_verdict(not killedForOutput and
+                not processResult.returnCode == 0,
+                timedOut=processResult.timedOut, cpuTime=processResult.cpuTime,
+                peakMemory=processResult.peakMemory,
+                outputExceeded=processResult.outputExceeded,
+                returnCode=None if killedForOutput else processResult.returnCode)
+        if not verdict is None:
+            raise ExecutionError.from_verdict(verdict, result)
+
+        if comparator is None:
+            result.output = self._get_decoded_output(processResult.output)
+        else:
+            result.matched = comparator.finish()
+            result.output = comparator.get_output()
+            result.expectedOutput = comparator.get_expected_output()
+        return result
 
 class Languages:
     LANGUAGES_FILE = 'languages.json'
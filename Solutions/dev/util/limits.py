@@ -0,0 +1,267 @@
+################################################################################
+# Filename: util/limits.py
+# Date:     16 October 2026
+#
+# Contains the Limits object, which holds the resources a single run of a
+# solution may use, and the logic for reading them from the config files
+################################################################################
+from util import fileops
+from util.definitions import Definitions
+from util.pathmapper import PathMapper
+from util.result import Status
+from util.perror import PyCException
+import json
+import resource
+import signal
+
+class Limits:
+    """
+    The resources a single run of a solution may use. Limits are read from,
+    in increasing order of precedence:
+
+    - the *_limit values of definitions.json
+    - the *Limit values of the solution's language in languages.json, such
+      as "memoryBytesLimit"
+    - the block of the solution's problem in the "problems" block of the
+      problem limits file named by definitions.json
+    - the block of the solution's language in the "languages" block of that
+      problem block
+
+    Each block may set any of the keys below. A limit set to null is
+    unlimited, while a limit that is left out is inherited. Only the wall
+    time is limited by default.
+
+    CPU time, memory and process count are applied with setrlimit in a
+    pre-exec hook, which Python documents as unsafe while other threads run.
+    Runs with --jobs may therefore stall in rare cases when these limits are
+    set, unless cases are started from zygotes with --zygote.
+
+    The process count is enforced with RLIMIT_NPROC, which counts every
+    process of the user running the solution rather than those of the run
+    alone. It therefore only suits a dedicated user: on a busy machine, or
+    with --jobs, runs may fail to start threads or processes they are
+    entitled to.
+    """
+    CPU_SECONDS_KEY = 'cpuSeconds'
+    WALL_SECONDS_KEY = 'wallSeconds'
+    MEMORY_BYTES_KEY = 'memoryBytes'
+    OUTPUT_BYTES_KEY = 'outputBytes'
+    PROCESS_COUNT_KEY = 'processCount'
+    ALL_KEYS = [CPU_SECONDS_KEY, WALL_SECONDS_KEY, MEMORY_BYTES_KEY,
+                OUTPUT_BYTES_KEY, PROCESS_COUNT_KEY]
+
+    # definitions.json is a flat dictionary, so defaults have their own keys
+    DEFINITION_KEYS = {
+            CPU_SECONDS_KEY   : 'cpu_seconds_limit',
+            WALL_SECONDS_KEY  : 'wall_seconds_limit',
+            MEMORY_BYTES_KEY  : 'memory_bytes_limit',
+            OUTPUT_BYTES_KEY  : 'output_bytes_limit',
+            PROCESS_COUNT_KEY : 'process_count_limit'
+            }
+    PROBLEM_LIMITS_FILE_KEY = 'problem_limits_file'
+    PROBLEMS_KEY = 'problems'
+    LANGUAGES_KEY = 'languages'
+
+    DEFAULT_WALL_SECONDS = 20
+
+    # Processes that fail after using at least this fraction of their memory
+    # limit are assumed to have failed to allocate more. The limit is on
+    # address space while only the peak resident size is measured, so this
+    # is a best-effort guess: address space may run out well before the
+    # resident size reaches it
+    MEMORY_VERDICT_RATIO = 0.5
+
+    def __init__(self, cpuSeconds: float=None,
+            wallSeconds: float=DEFAULT_WALL_SECONDS, memoryBytes: int=None,
+            outputBytes: int=None, processCount: int=None):
+        self.cpuSeconds = cpuSeconds
+        self.wallSeconds = wallSeconds
+        self.memoryBytes = memoryBytes
+        self.outputBytes = outputBytes
+        self.processCount = processCount
+
+    def __eq__(self, other):
+        return isinstance(other, Limits) and self.to_dict() == other.to_dict()
+
+    @classmethod
+    def load_from_dict(cls, limitsDict: dict, baseLimits=None):
+        """
+        Loads a limits object from a limits block, inheriting every limit the
+        block leaves out from baseLimits
+
+        :param limitsDict: A dictionary following the format of a limits block
+        :param baseLimits: The Limits to inherit from, or the defaults if None
+        """
+        limitValues = (Limits() if baseLimits is None else baseLimits).to_dict()
+        for key in cls.ALL_KEYS:
+            if key in limitsDict:
+                limitValues[key] = limitsDict[key]
+
+        return Limits(**limitValues)
+
+    @classmethod
+    def get_limits(cls, problemNumber, language):
+        """
+        Gets the limits of a solution to the problem written in the language
+
+        :param problemNumber: The number of the problem the solution solves
+        :param language: The Language of the solution, or None
+        """
+        limits = cls.load_from_dict({key : Definitions.get_value(definitionKey)
+            for key, definitionKey in cls.DEFINITION_KEYS.items() if
+            Definitions.has_value(definitionKey)})
+        if not language is None and not language.limits is None:
+            limits = cls.load_from_dict(language.limits, limits)
+
+        problemLimits = cls.get_problem_limits_dict().get(str(problemNumber),
+                {})
+        limits = cls.load_from_dict(problemLimits, limits)
+        if not language is None:
+            limits = cls.load_from_dict(problemLimits.get(cls.LANGUAGES_KEY,
+                {}).get(language.name, {}), limits)
+
+        return limits
+
+    @classmethod
+    def get_problem_limits_filepath(cls):
+        """
+        Gets the filepath of the problem limits file, which lives in the
+        config directory, or None if definitions.json names none
+        """
+        filename = Definitions.get_value(cls.PROBLEM_LIMITS_FILE_KEY)
+        if filename is None:
+            return None
+        return PathMapper.get_mapped_config_path(filename)
+
+    @classmethod
+    def get_problem_limits_dict(cls) -> dict:
+        """
+        Gets the limits blocks of every problem from the problem limits file
+
+        Return:
+        {problem number : limits block}
+        """
+        filepath = cls.get_problem_limits_filepath()
+        if filepath is None or not fileops.exists(filepath,
+                fileops.FileType.FILE):
+            return {}
+
+        return fileops.get_json_dict(filepath).get(cls.PROBLEMS_KEY, {})
+
+    @classmethod
+    def set_problem_language_limits(cls, problemNumber, languageName: str,
+            limitsDict: dict):
+        """
+        Sets limits of a problem for a single language in the problem limits
+        file, keeping every other limit in the file
+
+        :param limitsDict: The limits block to merge into the existing one
+        """
+        filepath = cls.get_problem_limits_filepath()
+        if filepath is None:
+            raise PyCException('Error: {} is not defined'.format(
+                cls.PROBLEM_LIMITS_FILE_KEY))
+
+        problemLimitsDict = cls.get_problem_limits_dict()
+        languageLimits = problemLimitsDict.setdefault(str(problemNumber),
+                {}).setdefault(cls.LANGUAGES_KEY, {}).setdefault(languageName,
+                        {})
+        languageLimits.update(limitsDict)
+        fileops.write_file(filepath, json.dumps({cls.PROBLEMS_KEY :
+            problemLimitsDict}, indent='\t', sort_keys=True) + '\n')
+
+    def to_dict(self) -> dict:
+        return {
+                self.CPU_SECONDS_KEY   : self.cpuSeconds,
+                self.WALL_SECONDS_KEY  : self.wallSeconds,
+                self.MEMORY_BYTES_KEY  : self.memoryBytes,
+                self.OUTPUT_BYTES_KEY  : self.outputBytes,
+                self.PROCESS_COUNT_KEY : self.processCount
+               }
+
+    def get_hash(self) -> str:
+        """
+        Returns the sha256 of the limits
+        """
+        return fileops.get_string_hash(fileops.get_json_string(self.to_dict()))
+
+    def get_rlimits(self, includeCpu: bool=True) -> list:
+        """
+        Returns the rlimits that enforce the limits in a child process
+
+        :param includeCpu: Whether to limit the CPU time of the process
+        :return: [(resource, (soft limit, hard limit))]
+        """
+        rlimits = []
+        if includeCpu and not self.cpuSeconds is None:
+            # The soft limit sends SIGXCPU, the hard limit a second later kills
+            cpuSeconds = max(1, int(self.cpuSeconds + 0.999))
+            rlimits.append(_get_rlimit(resource.RLIMIT_CPU, cpuSeconds,
+                cpuSeconds + 1))
+        if not self.memoryBytes is None:
+            rlimits.append(_get_rlimit(resource.RLIMIT_AS,
+                int(self.memoryBytes), int(self.memoryBytes)))
+        if not self.processCount is None:
+            rlimits.append(_get_rlimit(resource.RLIMIT_NPROC,
+                int(self.processCount), int(self.processCount)))
+
+        return rlimits
+
+    def get_preexec_function(self, includeCpu: bool=True):
+        """
+        Returns a function which applies the rlimits when called in a child
+        process before it runs its command, or None if there are none
+
+        :param includeCpu: Whether to limit the CPU time of the process
+        """
+        rlimits = self.get_rlimits(includeCpu)
+        if len(rlimits) == 0:
+            return None
+
+        def apply_rlimits():
+            for rlimit, values in rlimits:
+                resource.setrlimit(rlimit, values)
+
+        return apply_rlimits
+
+    def get_verdict(self, failed: bool, timedOut: bool=False,
+            cpuTime: float=None, peakMemory: int=None,
+            outputExceeded: bool=False, returnCode: int=None):
+        """
+        Decides which limit, if any, a run exceeded. A failed run is only
+        judged MLE from its peak resident size, see MEMORY_VERDICT_RATIO, so
+        memory verdicts are best-effort. A successful run is never judged MLE
+
+        :param failed: Whether the run exited unsuccessfully
+        :param returnCode: The Popen return code of the process, if it was one
+        :return: Status.TLE, MLE, OLE or RTE, or None if the run succeeded
+                 within its limits
+        """
+        if timedOut or returnCode == -signal.SIGXCPU or (
+                not self.cpuSeconds is None and not cpuTime is None and
+                cpuTime >= self.cpuSeconds):
+            return Status.TLE
+        if outputExceeded:
+            return Status.OLE
+        # A run that succeeded stayed within its address space, whatever its
+        # measured peak
+        if failed and not self.memoryBytes is None and not peakMemory is None \
+                and peakMemory >= self.memoryBytes * self.MEMORY_VERDICT_RATIO:
+            return Status.MLE
+        if failed:
+            return Status.RTE
+
+        return None
+
+def _get_rlimit(rlimit, soft: int, hard: int) -> tuple:
+    """
+    Returns the rlimit lowered to the hard limit of this process, which a
+    child is not allowed to raise
+
+    :return: (resource, (soft limit, hard limit))
+    """
+    _, currentHard = resource.getrlimit(rlimit)
+    if not currentHard == resource.RLIM_INFINITY:
+        soft = min(soft, currentHard)
+        hard = min(hard, currentHard)
+    return (rlimit, (soft, hard))
@@ -0,0 +1,739 @@
+################################################################################
+# Filename: util/process.py
+# Date:     16 October 2026
+#
+# Contains functions for running a single child process with its input and
+# output piped, or passed as files, measuring its CPU time, wall time and peak
+# memory
+################################################################################
+import asyncio
+import mmap
+import os
+import resource
+import select
+import selectors
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import weakref
+
+CHUNK_SIZE = 1 << 16
+EXIT_POLL_SECONDS = 0.001
+MEMORY_POLL_SECONDS = 0.01
+
+# Files of inputs are kept here, in memory, where the system has it
+SHARED_MEMORY_DIRECTORY = '/dev/shm'
+
+class IOMode:
+    """
+    The ways in which processes are given their input and have their output
+    read. Pipe mode streams both through pipes, so that wrong output stops a
+    process as soon as it is written. File mode opens the input from a file as
+    the standard input of the process and has it write its output into an
+    in-memory file, which is mapped and compared once the process exits, so
+    that neither is copied through this process on the way
+    """
+    PIPE = 'pipe'
+    FILE = 'file'
+
+    ALL = [PIPE, FILE]
+
+    _mode = PIPE
+
+    @classmethod
+    def set_mode(cls, mode: str):
+        cls._mode = mode
+
+    @classmethod
+    def get_mode(cls) -> str:
+        return cls._mode
+
+class InputFile:
+    """
+    The input of a process kept in a file, which is opened as the standard
+    input of the process so that its contents are never read into memory
+    here. Its length is the size of the file
+    """
+
+    def __init__(self, path: str, size: int=None):
+        self.path = path
+        self.size = os.path.getsize(path) if size is None else size
+
+    def __len__(self):
+        return self.size
+
+def _get_io_directory():
+    """
+    Gets the directory to keep the files of inputs in, or None for the
+    default temporary directory where there is no shared memory
+    """
+    if os.path.isdir(SHARED_MEMORY_DIRECTORY) and os.access(
+            SHARED_MEMORY_DIRECTORY, os.W_OK):
+        return SHARED_MEMORY_DIRECTORY
+    return None
+
+def _remove_file(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def materialize_input(inputContents: bytes) -> InputFile:
+    """
+    Writes the input to a file, in shared memory where there is some, which is
+    removed once the returned InputFile is no longer used
+    """
+    fd, path = tempfile.mkstemp(prefix='pyc-input-', dir=_get_io_directory())
+    with os.fdopen(fd, 'wb') as inputFile:
+        inputFile.write(inputContents)
+    materializedInput = InputFile(path, len(inputContents))
+    weakref.finalize(materializedInput, _remove_file, path)
+    return materializedInput
+
+def open_output_file() -> int:
+    """
+    Opens an anonymous in-memory file for a process to write its output into
+
+    :return: The descriptor of the file
+    """
+    if hasattr(os, 'memfd_create'):
+        try:
+            return os.memfd_create('pyc-output', os.MFD_CLOEXEC)
+        except OSError:
+            pass
+    fd, path = tempfile.mkstemp(prefix='pyc-output-', dir=_get_io_directory())
+    os.remove(path)
+    return fd
+
+# The processes being run, which kill_running_processes may cut short
+_runningProcesses = set()
+_runningProcessesLock = threading.Lock()
+
+class ProcessResult:
+    """
+    The outcome of running a child process. Times are in seconds and memory
+    is in bytes. A process killed for exceeding its output limit keeps only
+    the output read up to that point, and a process whose output was given to
+    a Comparator keeps none of it
+    """
+
+    def __init__(self, returnCode, output: bytes, cpuTime: float,
+            wallTime: float, peakMemory: int, timedOut: bool=False,
+            outputExceeded: bool=False, outputMismatched: bool=False):
+        self.returnCode = returnCode
+        self.output = output
+        self.cpuTime = cpuTime
+        self.wallTime = wallTime
+        self.peakMemory = peakMemory
+        self.timedOut = timedOut
+        self.outputExceeded = outputExceeded
+        # Whether the process was killed for writing wrong output
+        self.outputMismatched = outputMismatched
+
+def _open_pidfd(pid: int):
+    """
+    Opens a descriptor that becomes readable when the process exits, or
+    returns None where that is not supported
+    """
+    if not hasattr(os, 'pidfd_open'):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except OSError:
+        return None
+
+def _get_peak_memory(rusage) -> int:
+    # ru_maxrss is in kilobytes, except on macOS where it is in bytes
+    if sys.platform == 'darwin':
+        return rusage.ru_maxrss
+    return rusage.ru_maxrss * 1024
+
+class MemoryMonitor:
+    """
+    Measures the peak memory of a child process. Linux carries the peak
+    resident size of the process that starts a child into the child's
+    ru_maxrss when it execs, so ru_maxrss only measures children that grow
+    larger than this process. The peak of smaller children is instead the
+    high-water mark of their own memory in /proc/<pid>/status, which a
+    background thread samples every MEMORY_POLL_SECONDS while they run, so
+    growth in their last moments may be missed
+    """
+    STATUS_PATH_FORMAT = '/proc/{}/status'
+    PEAK_MEMORY_FIELD = b'VmHWM:'
+
+    _monitors = set()
+    _condition = threading.Condition()
+    _samplerThread = None
+
+    def __init__(self, pid: int):
+        self._pid = pid
+        self._statusPath = self.STATUS_PATH_FORMAT.format(pid)
+        # The most the child may have carried over from this process. Popen
+        # only returns once the child has exec'd, so it is already fixed
+        self._inheritedPeak = _get_peak_memory(resource.getrusage(
+            resource.RUSAGE_SELF))
+        self._sampledPeak = None
+        # Held while sampling and reaping, so that a reaped pid, which may
+        # already belong to another process, is never sampled
+        self._lock = threading.Lock()
+        self._exited = False
+        if os.path.isfile(self.STATUS_PATH_FORMAT.format('self')):
+            self._sampledPeak = 0
+            self._sample()
+            MemoryMonitor._watch(self)
+
+    @classmethod
+    def _watch(cls, monitor):
+        """
+        Has the background thread sample the monitor until it is reaped
+        """
+        with cls._condition:
+            cls._monitors.add(monitor)
+            if cls._samplerThread is None:
+                cls._samplerThread = threading.Thread(
+                        target=cls._sample_running, daemon=True)
+                cls._samplerThread.start()
+            cls._condition.notify()
+
+    @classmethod
+    def _sample_running(cls):
+        while True:
+            with cls._condition:
+                while len(cls._monitors) == 0:
+                    cls._condition.wait()
+                monitors = list(cls._monitors)
+            for monitor in monitors:
+                # Processes being reaped are skipped rather than waited for
+                if monitor._lock.acquire(blocking=False):
+                    try:
+                        if not monitor._exited:
+                            monitor._sample()
+                    finally:
+                        monitor._lock.release()
+            time.sleep(MEMORY_POLL_SECONDS)
+
+    def _sample(self):
+        try:
+            with open(self._statusPath, 'rb') as statusFile:
+                for line in statusFile:
+                    if line.startswith(self.PEAK_MEMORY_FIELD):
+                        self._sampledPeak = max(self._sampledPeak,
+                                int(line.split()[1]) * 1024)
+                        return
+        except (OSError, ValueError, IndexError):
+            pass
+
+    def wait(self, options: int) -> tuple:
+        """
+        Waits for the process like os.wait4, and stops sampling it once it
+        has been reaped
+        """
+        with self._lock:
+            result = os.wait4(self._pid, options)
+            if not result[0] == 0:
+                self._exited = True
+        if self._exited:
+            with MemoryMonitor._condition:
+                MemoryMonitor._monitors.discard(self)
+        return result
+
+    def get_peak_memory(self, rusage) -> int:
+        """
+        Returns the peak memory of the reaped process, in bytes
+
+        :param rusage: The rusage the process was reaped with
+        """
+        peakMemory = _get_peak_memory(rusage)
+        if self._sampledPeak is None or peakMemory > self._inheritedPeak:
+            return peakMemory
+        return self._sampledPeak
+
+def _reap(process, block: bool=True):
+    """
+    Reaps the process with wait4, returning its rusage, or None if the process
+    has not exited and block is False
+    """
+    pid, status, rusage = process.memoryMonitor.wait(0 if block else
+            os.WNOHANG)
+    if pid == 0:
+        return None
+
+    # Popen must never reap the process itself, so it is told the exit code
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return rusage
+
+def _kill(process):
+    # Popen.kill polls the process first, which would reap it if it has just
+    # exited, so the signal is sent directly unless _reap already reaped it
+    if not getattr(process, 'returncode', None) is None:
+        return
+    try:
+        os.kill(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+def _get_result(process, rusage, output: bytearray, startTime: float,
+        timedOut: bool, outputExceeded: bool,
+        outputMismatched: bool, endTime: float=None) -> ProcessResult:
+    return ProcessResult(process.returncode, bytes(output),
+            rusage.ru_utime + rusage.ru_stime, (time.monotonic() if endTime is
+                None else endTime) - startTime,
+            process.memoryMonitor.get_peak_memory(rusage), timedOut=timedOut,
+            outputExceeded=outputExceeded, outputMismatched=outputMismatched)
+
+def _spawn(command: list, inputContents, stderr, preexecFunction,
+        stdout=subprocess.PIPE):
+    """
+    Starts the command with its standard input piped, or opened from the file
+    of an InputFile, in which case process.stdin is None
+    """
+    if isinstance(inputContents, InputFile):
+        with open(inputContents.path, 'rb') as inputFile:
+            process = subprocess.Popen(command, stdin=inputFile,
+                    stdout=stdout, stderr=stderr,
+                    preexec_fn=preexecFunction)
+    else:
+        process = subprocess.Popen(command, stdin=subprocess.PIPE,
+                stdout=stdout, stderr=stderr,
+                preexec_fn=preexecFunction)
+    process.memoryMonitor = MemoryMonitor(process.pid)
+    track_process(process)
+    return process
+
+def track_process(process):
+    """
+    Adds a process, or anything with a kill method, to the processes that
+    kill_running_processes kills
+    """
+    with _runningProcessesLock:
+        _runningProcesses.add(process)
+
+def forget_process(process):
+    """
+    Removes a process from the processes that kill_running_processes kills
+    """
+    with _runningProcessesLock:
+        _runningProcesses.discard(process)
+
+def kill_running_processes():
+    """
+    Kills every process currently being run by run_process or
+    run_process_async, from any thread. Their runs still return, with the
+    results of killed processes
+    """
+    with _runningProcessesLock:
+        processes = list(_runningProcesses)
+    for process in processes:
+        # Popen.kill may reap the process, so Popens are killed with _kill
+        if isinstance(process, subprocess.Popen):
+            _kill(process)
+        else:
+            process.kill()
+
+def _is_output_exceeded(outputSize: int, outputLimit: int) -> bool:
+    return not outputLimit is None and outputSize > outputLimit
+
+def _add_output(output: bytearray, data: bytes, comparator) -> bool:
+    """
+    Keeps the data read from the process, or gives it to the Comparator if
+    there is one
+
+    :return: False if the output is known to be wrong
+    """
+    if comparator is None:
+        output.extend(data)
+        return True
+    return comparator.feed(data)
+
+def run_process(command: list, inputContents, timeout: float=None,
+        stderr=subprocess.DEVNULL, preexecFunction=None,
+        outputLimit: int=None, comparator=None) -> ProcessResult:
+    """
+    Runs the command, feeding it inputContents, bytes or an InputFile, and
+    collecting its output, and returns a ProcessResult. The process is killed if it runs for longer
+    than timeout seconds or writes more than outputLimit bytes. Either may be
+    None for no limit.
+
+    :param preexecFunction: Called in the child before the command is run
+    :param comparator: A Comparator to stream the output into instead of
+                       collecting it. The process is killed as soon as its
+                       output is wrong
+    :raises OSError: If the command could not be run
+    """
+    if IOMode.get_mode() == IOMode.FILE:
+        return _run_process_with_files(command, inputContents, timeout,
+                stderr, preexecFunction, outputLimit, comparator)
+
+    startTime = time.monotonic()
+    deadline = None if timeout is None else startTime + timeout
+    process = _spawn(command, inputContents, stderr, preexecFunction)
+    output = bytearray()
+    outputSize = 0
+    inputOffset = 0
+    timedOut = False
+    outputExceeded = False
+    outputMismatched = False
+    rusage = None
+    pidfd = _open_pidfd(process.pid)
+
+    selector = selectors.DefaultSelector()
+    try:
+        if not process.stdin is None and len(inputContents) > 0:
+            # Writes must not block while the child waits for its output to
+            # be read
+            os.set_blocking(process.stdin.fileno(), False)
+            selector.register(process.stdin, selectors.EVENT_WRITE)
+        elif not process.stdin is None:
+            process.stdin.close()
+        selector.register(process.stdout, selectors.EVENT_READ)
+        if not pidfd is None:
+            selector.register(pidfd, selectors.EVENT_READ)
+
+        while len(selector.get_map()) > 0 and not outputExceeded and \
+                not outputMismatched:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if not remaining is None and remaining <= 0:
+                timedOut = True
+                break
+
+            for key, _ in selector.select(remaining):
+                if key.fileobj is process.stdin:
+                    try:
+                        inputOffset += os.write(process.stdin.fileno(),
+                            inputContents[inputOffset:inputOffset + CHUNK_SIZE])
+                    except BlockingIOError:
+                        continue
+                    except BrokenPipeError:
+                        inputOffset = len(inputContents)
+                    if inputOffset >= len(inputContents):
+                        selector.unregister(process.stdin)
+                        process.stdin.close()
+                elif key.fileobj is process.stdout:
+                    data = os.read(process.stdout.fileno(), CHUNK_SIZE)
+                    if len(data) == 0:
+                        selector.unregister(process.stdout)
+                    else:
+                        outputSize += len(data)
+                        outputMismatched = not _add_output(output, data,
+                                comparator)
+                        outputExceeded = _is_output_exceeded(outputSize,
+                                outputLimit)
+                        if outputMismatched or outputExceeded:
+                            break
+                else:
+                    selector.unregister(pidfd)
+
+            # Without a pidfd, poll for the exit once output has ended
+            if pidfd is None and len(selector.get_map()) == 0:
+                while rusage is None and (deadline is None or
+                        time.monotonic() < deadline):
+                    rusage = _reap(process, block=False)
+                    if rusage is None:
+                        time.sleep(EXIT_POLL_SECONDS)
+                timedOut = rusage is None
+    finally:
+        selector.close()
+        if rusage is None:
+            rusage = _reap(process, block=False)
+        if rusage is None:
+            _kill(process)
+            rusage = _reap(process)
+        forget_process(process)
+        if not process.stdin is None:
+            process.stdin.close()
+        process.stdout.close()
+        if not pidfd is None:
+            os.close(pidfd)
+
+    return _get_result(process, rusage, output, startTime, timedOut,
+            outputExceeded, outputMismatched)
+
+async def run_process_async(command: list, inputContents,
+        timeout: float=None, stderr=subprocess.DEVNULL, preexecFunction=None,
+        outputLimit: int=None, comparator=None) -> ProcessResult:
+    """
+    Runs the command on the running asyncio event loop, feeding it
+    inputContents, bytes or an InputFile, and collecting its output, and
+    returns a ProcessResult.
+    The process is killed if it runs for longer than timeout seconds, writes
+    more than outputLimit bytes, writes wrong output or the caller is
+    cancelled.
+
+    :param preexecFunction: Called in the child before the command is run
+    :param comparator: A Comparator to stream the output into instead of
+                       collecting it
+    :raises OSError: If the command could not be run
+    """
+    if IOMode.get_mode() == IOMode.FILE:
+        return await _run_process_with_files_async(command, inputContents,
+                timeout, stderr, preexecFunction, outputLimit, comparator)
+
+    loop = asyncio.get_running_loop()
+    startTime = time.monotonic()
+    process = _spawn(command, inputContents, stderr, preexecFunction)
+    pidfd = _open_pidfd(process.pid)
+    output = bytearray()
+    finished = loop.create_future()
+    state = {'inputOffset' : 0, 'stdoutOpen' : True, 'exited' : False,
+             'rusage' : None, 'outputSize' : 0, 'outputExceeded' : False,
+             'outputMismatched' : False}
+    stdoutFd = process.stdout.fileno()
+    os.set_blocking(stdoutFd, False)
+    if not process.stdin is None:
+        stdinFd = process.stdin.fileno()
+        os.set_blocking(stdinFd, False)
+
+    def finish_if_done():
+        if not state['stdoutOpen'] and state['exited'] and not finished.done():
+            finished.set_result(None)
+
+    def on_stdin_writable():
+        try:
+            state['inputOffset'] += os.write(stdinFd, inputContents[
+                state['inputOffset']:state['inputOffset'] + CHUNK_SIZE])
+        except BlockingIOError:
+            return
+        except BrokenPipeError:
+            state['inputOffset'] = len(inputContents)
+        if state['inputOffset'] >= len(inputContents):
+            loop.remove_writer(stdinFd)
+            process.stdin.close()
+
+    def on_stdout_readable():
+        try:
+            data = os.read(stdoutFd, CHUNK_SIZE)
+        except BlockingIOError:
+            return
+        if len(data) == 0:
+            loop.remove_reader(stdoutFd)
+            state['stdoutOpen'] = False
+            finish_if_done()
+        else:
+            state['outputSize'] += len(data)
+            state['outputMismatched'] = not _add_output(output, data,
+                    comparator)
+            state['outputExceeded'] = _is_output_exceeded(state['outputSize'],
+                    outputLimit)
+            if state['outputMismatched'] or state['outputExceeded']:
+                loop.remove_reader(stdoutFd)
+                if not finished.done():
+                    finished.set_result(None)
+
+    def on_exit():
+        loop.remove_reader(pidfd)
+        state['exited'] = True
+        finish_if_done()
+
+    async def wait_for_exit():
+        # Used where there is no pidfd to be notified of the exit with
+        while state['rusage'] is None:
+            if not state['stdoutOpen']:
+                state['rusage'] = _reap(process, block=False)
+            if state['rusage'] is None:
+                await asyncio.sleep(EXIT_POLL_SECONDS)
+        state['exited'] = True
+        finish_if_done()
+
+    if not process.stdin is None and len(inputContents) > 0:
+        loop.add_writer(stdinFd, on_stdin_writable)
+    elif not process.stdin is None:
+        process.stdin.close()
+    loop.add_reader(stdoutFd, on_stdout_readable)
+    exitPoller = None
+    if not pidfd is None:
+        loop.add_reader(pidfd, on_exit)
+    else:
+        exitPoller = asyncio.ensure_future(wait_for_exit())
+
+    timedOut = False
+    try:
+        await asyncio.wait_for(asyncio.shield(finished), timeout)
+    except asyncio.TimeoutError:
+        timedOut = True
+    finally:
+        if not process.stdin is None and not process.stdin.closed:
+            loop.remove_writer(stdinFd)
+            process.stdin.close()
+        loop.remove_reader(stdoutFd)
+        if not pidfd is None:
+            loop.remove_reader(pidfd)
+            os.close(pidfd)
+        if not exitPoller is None:
+            exitPoller.cancel()
+        rusage = state['rusage']
+        if rusage is None:
+            rusage = _reap(process, block=False)
+        if rusage is None:
+            _kill(process)
+            rusage = _reap(process)
+        forget_process(process)
+        process.stdout.close()
+
+    return _get_result(process, rusage, output, startTime, timedOut,
+            state['outputExceeded'], state['outputMismatched'])
+
+def _get_output_limiting_function(preexecFunction, outputLimit: int):
+    """
+    Returns a function which also limits the size of the files a child process
+    writes to one byte past outputLimit, so that the system stops a process
+    writing its output into a file as soon as it writes too much
+    """
+    if outputLimit is None:
+        return preexecFunction
+
+    def limit_output():
+        if not preexecFunction is None:
+            preexecFunction()
+        _, hard = resource.getrlimit(resource.RLIMIT_FSIZE)
+        soft = outputLimit + 1
+        if not hard == resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_FSIZE, (soft, hard))
+
+    return limit_output
+
+def read_output_file(outputFd: int, output: bytearray, comparator,
+        outputLimit: int) -> bool:
+    """
+    Maps the file a process wrote its output into and gives it to the
+    Comparator, chunk by chunk, or keeps it in output if there is none
+
+    :return: Whether the output exceeded outputLimit
+    """
+    outputSize = os.fstat(outputFd).st_size
+    if _is_output_exceeded(outputSize, outputLimit):
+        return True
+    if outputSize == 0:
+        return False
+
+    with mmap.mmap(outputFd, outputSize, access=mmap.ACCESS_READ) as \
+            outputMap:
+        for offset in range(0, outputSize, CHUNK_SIZE):
+            if not _add_output(output, outputMap[offset:offset + CHUNK_SIZE],
+                    comparator):
+                break
+    return False
+
+def _wait_for_exit(process, pidfd, deadline: float):
+    """
+    Waits for the process to exit until deadline, if it is not None
+
+    :return: The rusage of the process, or None if it did not exit in time
+    """
+    while True:
+        rusage = _reap(process, block=False)
+        if not rusage is None:
+            return rusage
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if not remaining is None and remaining <= 0:
+            return None
+        if pidfd is None:
+            time.sleep(EXIT_POLL_SECONDS if remaining is None else
+                    min(EXIT_POLL_SECONDS, remaining))
+        else:
+            select.select([pidfd], [], [], remaining)
+
+async def _wait_for_exit_async(process, pidfd):
+    """
+    Waits for the process to exit on the running asyncio event loop
+
+    :return: The rusage of the process
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        rusage = _reap(process, block=False)
+        if not rusage is None:
+            return rusage
+        if pidfd is None:
+            await asyncio.sleep(EXIT_POLL_SECONDS)
+            continue
+
+        exited = loop.create_future()
+        loop.add_reader(pidfd, lambda: exited.done() or
+                exited.set_result(None))
+        try:
+            await exited
+        finally:
+            loop.remove_reader(pidfd)
+
+def _run_process_with_files(command: list, inputContents, timeout: float,
+        stderr, preexecFunction, outputLimit: int,
+        comparator) -> ProcessResult:
+    """
+    Runs the command like run_process, in IOMode.FILE. Inputs that are not
+    already InputFiles are written to a file first
+    """
+    if not isinstance(inputContents, InputFile):
+        inputContents = materialize_input(inputContents)
+    startTime = time.monotonic()
+    deadline = None if timeout is None else startTime + timeout
+    outputFd = open_output_file()
+    try:
+        process = _spawn(command, inputContents, stderr,
+                _get_output_limiting_function(preexecFunction, outputLimit),
+                stdout=outputFd)
+        pidfd = _open_pidfd(process.pid)
+        rusage = None
+        try:
+            rusage = _wait_for_exit(process, pidfd, deadline)
+        finally:
+            endTime = time.monotonic()
+            timedOut = rusage is None
+            if rusage is None:
+                _kill(process)
+                rusage = _reap(process)
+            forget_process(process)
+            if not pidfd is None:
+                os.close(pidfd)
+
+        output = bytearray()
+        outputExceeded = read_output_file(outputFd, output, comparator,
+                outputLimit)
+    finally:
+        os.close(outputFd)
+
+    return _get_result(process, rusage, output, startTime, timedOut,
+            outputExceeded, False, endTime=endTime)
+
+async def _run_process_with_files_async(command: list, inputContents,
+        timeout: float, stderr, preexecFunction, outputLimit: int,
+        comparator) -> ProcessResult:
+    """
+    Runs the command like run_process_async, in IOMode.FILE
+    """
+    if not isinstance(inputContents, InputFile):
+        inputContents = materialize_input(inputContents)
+    startTime = time.monotonic()
+    outputFd = open_output_file()
+    try:
+        process = _spawn(command, inputContents, stderr,
+                _get_output_limiting_function(preexecFunction, outputLimit),
+                stdout=outputFd)
+        pidfd = _open_pidfd(process.pid)
+        rusage = None
+        try:
+            rusage = await asyncio.wait_for(_wait_for_exit_async(process,
+                pidfd), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            endTime = time.monotonic()
+            timedOut = rusage is None
+            if rusage is None:
+                _kill(process)
+                rusage = _reap(process)
+            forget_process(process)
+            if not pidfd is None:
+                os.close(pidfd)
+
+        output = bytearray()
+        outputExceeded = read_output_file(outputFd, output, comparator,
+                outputLimit)
+    finally:
+        os.close(outputFd)
+
+    return _get_result(process, rusage, output, startTime, timedOut,
+            outputExceeded, False, endTime=endTime)
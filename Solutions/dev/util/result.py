@@ -0,0 +1,214 @@
+################################################################################
+# Filename: util/result.py
+# Date:     16 October 2026
+#
+# Contains the CaseResult object, which stores the outcome of testing a single
+# solution against a single case, and the TimingSummary, which aggregates the
+# measurements of many results
+################################################################################
+import statistics
+
+class Status:
+    """
+    The possible verdicts of a single solution/case test. FAIL covers wrong
+    output and compile errors, while the others name the way a run failed.
+    SKIP marks cases that were not run at all, and REGRESSION correct runs
+    that were significantly slower than a baseline
+    """
+    PASS = 'PASS'
+    FAIL = 'FAIL'
+    TLE = 'TLE'
+    MLE = 'MLE'
+    OLE = 'OLE'
+    RTE = 'RTE'
+    SKIP = 'SKIP'
+    REGRESSION = 'REGRESSION'
+
+    MESSAGES = {
+            TLE : 'Time Limit Exceeded',
+            MLE : 'Memory Limit Exceeded',
+            OLE : 'Output Limit Exceeded',
+            RTE : 'Runtime Error'
+            }
+
+class CaseResult:
+    """
+    Stores the outcome of running a solution against a case. A result without
+    a case corresponds to the compilation of the solution.
+    """
+    COMPILE_STRING = 'COMPILE'
+
+    WRITER_KEY = 'writer'
+    PROBLEM_KEY = 'problem'
+    LANGUAGE_KEY = 'language'
+    CASE_TYPE_KEY = 'caseType'
+    CASE_NUMBER_KEY = 'caseNumber'
+    STATUS_KEY = 'status'
+    MESSAGE_KEY = 'message'
+    CACHED_KEY = 'cached'
+    CPU_TIME_KEY = 'cpuTime'
+    WALL_TIME_KEY = 'wallTime'
+    PEAK_MEMORY_KEY = 'peakMemory'
+
+    def __init__(self, solution, case, status, message, output=None,
+            cached=False, cpuTime=None, wallTime=None, peakMemory=None,
+            expectedOutput=None, diff=None):
+        self.solution = solution
+        self.case = case
+        self.status = status
+        self.message = message
+        self.output = output
+        # The part of the case's output that output is compared with, if
+        # output is only a window of the solution's output
+        self.expectedOutput = expectedOutput
+        # The lines of the diff of output with the expected output, if found
+        self.diff = diff
+        self.cached = cached
+        self.cpuTime = cpuTime
+        self.wallTime = wallTime
+        self.peakMemory = peakMemory
+        # The (CPU time, wall time, peak memory) of every run of a case that
+        # was run repeatedly, or None
+        self.samples = None
+
+    def set_measurements(self, executionResult):
+        """
+        Copies the CPU time, wall time and peak memory of an ExecutionResult
+        into the result. None is ignored
+        """
+        if executionResult is None:
+            return self
+
+        self.cpuTime = executionResult.cpuTime
+        self.wallTime = executionResult.wallTime
+        self.peakMemory = executionResult.peakMemory
+        return self
+
+    def set_samples(self, executionResults: list):
+        """
+        Keeps the measurements of repeated runs of the case, setting the
+        times of the result to their medians and its memory to their maximum
+        """
+        self.samples = [(executionResult.cpuTime, executionResult.wallTime,
+                         executionResult.peakMemory) for executionResult in
+                        executionResults]
+        self.cpuTime = statistics.median(sample[0] for sample in self.samples)
+        self.wallTime = statistics.median(sample[1] for sample in self.samples)
+        self.peakMemory = max(sample[2] for sample in self.samples)
+        return self
+
+    def get_cpu_samples(self) -> list:
+        """
+        Returns the CPU time of every run of the case
+        """
+        if self.samples is None:
+            return [] if self.cpuTime is None else [self.cpuTime]
+        return [sample[0] for sample in self.samples]
+
+    def passed(self) -> bool:
+        return self.status == Status.PASS
+
+    def skipped(self) -> bool:
+        return self.status == Status.SKIP
+
+    def regressed(self) -> bool:
+        return self.status == Status.REGRESSION
+
+    def failed(self) -> bool:
+        # Regressions produced the correct output, so they are reported
+        # separately rather than as failures
+        return not self.passed() and not self.skipped() and \
+                not self.regressed()
+
+    def get_case_string(self) -> str:
+        """
+        Returns the readable type of the case, or COMPILE for compile results
+        """
+        if self.case is None:
+            return self.COMPILE_STRING
+        return self.case.get_case_string()
+
+    def get_case_number(self):
+        """
+        Returns the number of the case, or COMPILE for compile results
+        """
+        if self.case is None:
+            return self.COMPILE_STRING
+        return self.case.caseNumber
+
+    def to_dict(self) -> dict:
+        """
+        Returns the result as a dictionary of plain values, with times in
+        seconds and memory in bytes
+        """
+        return {
+                self.WRITER_KEY      : self.solution.solutionWriter,
+                self.PROBLEM_KEY     : int(self.solution.problemNumber),
+                self.LANGUAGE_KEY    : self.solution.solutionLanguage.name,
+                self.CASE_TYPE_KEY   : self.get_case_string(),
+                self.CASE_NUMBER_KEY : self.get_case_number(),
+                self.STATUS_KEY      : self.status,
+                self.MESSAGE_KEY     : self.message,
+                self.CACHED_KEY      : self.cached,
+                self.CPU_TIME_KEY    : self.cpuTime,
+                self.WALL_TIME_KEY   : self.wallTime,
+                self.PEAK_MEMORY_KEY : self.peakMemory
+               }
+
+    def get_expected_output(self) -> str:
+        """
+        Returns the output of the case that the result's output should match
+        """
+        if not self.expectedOutput is None:
+            return self.expectedOutput
+        return self.case.outputContents
+
+class TimingSummary:
+    """
+    Collects the measurements of every result of a run and summarizes them
+    per problem. Each solution contributes its slowest case, and the summary
+    gives the min, median and max of those across writers and languages
+    """
+    MEASUREMENTS = ['cpuTime', 'wallTime', 'peakMemory']
+
+    def __init__(self):
+        # {problem number : {solution path : {measurement : worst value}}}
+        self._worstValues = {}
+
+    def add(self, result):
+        """
+        Adds a single result to the summary. Results without measurements,
+        such as compile, cached and skipped results, are ignored
+        """
+        if result is None or result.case is None or result.cached or \
+                result.skipped():
+            return
+
+        solution = result.solution
+        worstValues = self._worstValues.setdefault(str(solution.problemNumber),
+                {}).setdefault(solution._path, {})
+        for measurement in self.MEASUREMENTS:
+            value = getattr(result, measurement)
+            if not value is None:
+                worstValues[measurement] = max(value, 
+                        worstValues.get(measurement, value))
+
+    def get_summary(self) -> dict:
+        """
+        Returns the summary of every problem
+
+        Return:
+        {problem number : {measurement : (min, median, max, solution count)}}
+        """
+        summary = {}
+        for problemNumber, solutionValues in self._worstValues.items():
+            problemSummary = {}
+            for measurement in self.MEASUREMENTS:
+                values = [worstValues[measurement] for worstValues in 
+                          solutionValues.values() if measurement in worstValues]
+                if len(values) > 0:
+                    problemSummary[measurement] = (min(values),
+                            statistics.median(values), max(values), len(values))
+            summary[problemNumber] = problemSummary
+
+        return summary
@@ -0,0 +1,155 @@
+################################################################################
+# Filename: util/resultsink.py
+# Date:     16 October 2026
+#
+# Contains the result sinks, which stream the result of every case of a test
+# run to a machine-readable file as the case completes
+################################################################################
+from util import fileops
+from util.definitions import Definitions
+from util.pathmapper import PathMapper
+from xml.sax.saxutils import escape, quoteattr
+import json
+import time
+
+class ResultSink:
+    """
+    Writes CaseResults to a file, one record per result, in the order they
+    are added. Writes are buffered, but flushed at least every FLUSH_SECONDS
+    so that the file can be read while the run goes on.
+
+    Subclasses implement _write_header, _write_result and _write_footer.
+    """
+    BUFFER_BYTES = 1 << 20
+    FLUSH_SECONDS = 1
+
+    def __init__(self, path: str):
+        self._path = path
+        parentDir = fileops.get_parent_dir(path)
+        if len(parentDir) > 0:
+            fileops.make(parentDir, fileops.FileType.DIRECTORY)
+        self._file = open(path, 'w', encoding='utf-8',
+                buffering=self.BUFFER_BYTES)
+        self._lastFlushTime = time.monotonic()
+        self._write_header()
+
+    def add(self, result):
+        """
+        Writes a single result. None results are ignored
+        """
+        if result is None:
+            return
+
+        self._write_result(result)
+        if time.monotonic() - self._lastFlushTime >= self.FLUSH_SECONDS:
+            self._file.flush()
+            self._lastFlushTime = time.monotonic()
+
+    def close(self):
+        """
+        Ends the file and closes it
+        """
+        self._write_footer()
+        self._file.close()
+
+    def _write_header(self):
+        pass
+
+    def _write_result(self, result):
+        raise NotImplementedError
+
+    def _write_footer(self):
+        pass
+
+class JsonLinesSink(ResultSink):
+    """
+    Writes every result as a line of JSON holding CaseResult.to_dict()
+    """
+
+    def _write_result(self, result):
+        self._file.write(json.dumps(result.to_dict()))
+        self._file.write('\n')
+
+class JUnitSink(ResultSink):
+    """
+    Writes results as the testcases of a single JUnit XML testsuite, so that
+    CI servers can show them. Each solution is a class of testcases, named
+    <writer>.problem<number>.<language>, and each case is a testcase. The
+    file is only complete XML once the sink is closed. Regressions are not
+    failures, so their message is written as the output of their testcase
+    """
+    SUITE_NAME = 'PyCFramework'
+
+    def _write_header(self):
+        self._file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self._file.write('<testsuites>\n<testsuite name={}>\n'.format(
+            quoteattr(self.SUITE_NAME)))
+
+    def _write_result(self, result):
+        solution = result.solution
+        className = '{}.problem{}.{}'.format(solution.solutionWriter,
+                solution.problemNumber, solution.solutionLanguage.name)
+        testName = '{} {}'.format(result.get_case_string(),
+                result.get_case_number())
+        self._file.write('<testcase classname={} name={} time="{:.6f}">'.format(
+            quoteattr(className), quoteattr(testName), result.wallTime or 0))
+
+        properties = [(key, value) for key, value in [
+                      (result.CPU_TIME_KEY, result.cpuTime),
+                      (result.PEAK_MEMORY_KEY, result.peakMemory)] if
+                      not value is None]
+        if len(properties) > 0:
+            self._file.write('<properties>{}</properties>'.format(''.join(
+                '<property name={} value={}/>'.format(quoteattr(key),
+                    quoteattr(str(value))) for key, value in properties)))
+
+        if result.skipped():
+            self._file.write('<skipped message={}/>'.format(
+                quoteattr(result.message)))
+        elif result.failed():
+            # The diff of the output, if there is one, details the failure
+            details = result.message if result.diff is None else '\n'.join(
+                    result.diff)
+            self._file.write('<failure type={} message={}>{}</failure>'.format(
+                quoteattr(result.status), quoteattr(result.message),
+                escape(details)))
+        elif result.regressed():
+            self._file.write('<system-out>{}</system-out>'.format(
+                escape(result.message)))
+        self._file.write('</testcase>\n')
+
+    def _write_footer(self):
+        self._file.write('</testsuite>\n</testsuites>\n')
+
+class ResultSinks:
+    """
+    Creates the result sinks of a test run. The "results_file" definition
+    names the file results are written to when no path is given
+    """
+    RESULTS_FILE_KEY = 'results_file'
+    DEFAULT_RESULTS_FILE = 'output/results.jsonl'
+
+    @classmethod
+    def get_default_path(cls) -> str:
+        """
+        Gets the path of the default results file from the definitions file
+        """
+        resultsFile = Definitions.get_value(cls.RESULTS_FILE_KEY)
+        return PathMapper.get_mapped_path(resultsFile if not resultsFile is
+                None else cls.DEFAULT_RESULTS_FILE)
+
+    @classmethod
+    def open_sinks(cls, jsonLinesPath: str=None, junitPath: str=None) -> list:
+        """
+        Opens a sink for every path given
+
+        :param jsonLinesPath: The path of the JSON Lines file, or None
+        :param junitPath: The path of the JUnit XML file, or None
+        :return: The list of opened ResultSinks
+        """
+        sinks = []
+        if not jsonLinesPath is None:
+            sinks.append(JsonLinesSink(jsonLinesPath))
+        if not junitPath is None:
+            sinks.append(JUnitSink(junitPath))
+        return sinks
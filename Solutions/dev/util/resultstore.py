@@ -0,0 +1,66 @@
+################################################################################
+# Filename: util/resultstore.py
+# Date:     16 October 2026
+#
+# Contains the ResultStore class, which remembers the verdicts of previous
+# test runs so that unchanged solution/case pairs need not be run again
+################################################################################
+from util import fileops
+from util.comparator import Comparators
+from util.jsonstore import JsonStore
+from util.result import CaseResult, Status
+import json
+
+class ResultStore(JsonStore):
+    """
+    A persistent store of verdicts keyed by the contents of the solution, the
+    contents of the case, the configuration of the solution's language and
+    the limits and comparator the pair is judged with.
+    Since the writer is not part of the key, byte-identical solutions share
+    their verdicts.
+    """
+    STORE_FILE_KEY = 'result_store_file'
+    DEFAULT_STORE_FILE = '.cache/results.json'
+    STATUS_KEY = 'status'
+    MESSAGE_KEY = 'message'
+    CACHED_SUFFIX = ' (cached)'
+
+    @staticmethod
+    def get_key(solution, case) -> str:
+        """
+        Gets the key under which the result of solution on case is stored
+        """
+        return fileops.get_string_hash(json.dumps([solution.get_source_hash(),
+            case.get_content_hash(),
+            solution.solutionLanguage.get_config_hash(),
+            solution.get_limits().get_hash(),
+            Comparators.get_config(case.problemNumber)]))
+
+    def get_cached_result(self, solution, case):
+        """
+        Gets a cached CaseResult for running solution on case if the pair was
+        previously run and passed, otherwise None
+        """
+        with self._lock:
+            storedResult = self._entries.get(self.get_key(solution, case))
+
+        if storedResult is None or not storedResult[self.STATUS_KEY] == Status.PASS:
+            return None
+
+        return CaseResult(solution, case, storedResult[self.STATUS_KEY],
+                storedResult[self.MESSAGE_KEY] + self.CACHED_SUFFIX, cached=True)
+
+    def record_result(self, result):
+        """
+        Records the verdict of a CaseResult. Compile results, results for cases
+        without output, cached results and skipped results are ignored
+        """
+        if result is None or result.case is None or result.cached or \
+                result.skipped():
+            return
+
+        with self._lock:
+            self._entries[self.get_key(result.solution, result.case)] = {
+                    self.STATUS_KEY  : result.status,
+                    self.MESSAGE_KEY : result.message
+                    }
@@ -0,0 +1,142 @@
+################################################################################
+# Filename: util/scheduler.py
+# Date:     16 October 2026
+#
+# Contains functions for running many independent jobs (such as solution/case
+# pairs) concurrently while still reporting their results in a stable order
+################################################################################
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import heapq
+
+def run_jobs(jobs: list, jobFunction, jobCount: int, resultCallback,
+        cancelFunction=None):
+    """
+    Runs jobFunction on every job, using at most jobCount workers. The
+    resultCallback is invoked from the calling thread as each job finishes,
+    so results may arrive out of order. If resultCallback returns True the run
+    stops: jobs that have not started are never run, and the results of jobs
+    still running are discarded.
+
+    Threads are used rather than processes since the work of every job is
+    waiting on a child process, during which the GIL is released.
+
+    :param jobs: The list of jobs to pass to jobFunction
+    :param jobFunction: The function to run for each job
+    :param jobCount: The maximum number of jobs to run at once
+    :param resultCallback: Called as resultCallback(jobIndex, result)
+    :param cancelFunction: Called when the run stops to cut short the jobs
+                           still running, or None to let them finish
+    :return: Whether the run was stopped by resultCallback
+    """
+    if jobCount is None or jobCount <= 1:
+        for jobIndex, job in enumerate(jobs):
+            if resultCallback(jobIndex, jobFunction(job)):
+                return True
+        return False
+
+    with ThreadPoolExecutor(max_workers=jobCount) as executor:
+        futures = {executor.submit(jobFunction, job) : jobIndex
+                   for jobIndex, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            if resultCallback(futures[future], future.result()):
+                executor.shutdown(wait=False, cancel_futures=True)
+                if not cancelFunction is None:
+                    cancelFunction()
+                return True
+    return False
+
+def run_jobs_async(jobs: list, coroutineFunction, jobCount: int,
+        resultCallback):
+    """
+    Runs coroutineFunction on every job from a single asyncio event loop,
+    keeping at most jobCount jobs in flight. The resultCallback is invoked
+    from the calling thread as each job finishes. If resultCallback returns
+    True the run stops and every job still in flight is cancelled.
+
+    :param jobs: The list of jobs to pass to coroutineFunction
+    :param coroutineFunction: The coroutine function to await for each job
+    :param jobCount: The maximum number of jobs to have in flight at once
+    :param resultCallback: Called as resultCallback(jobIndex, result)
+    :return: Whether the run was stopped by resultCallback
+    """
+    async def run_all_jobs():
+        semaphore = asyncio.Semaphore(max(jobCount or 1, 1))
+
+        async def run_job(jobIndex, job):
+            async with semaphore:
+                return jobIndex, await coroutineFunction(job)
+
+        tasks = [asyncio.ensure_future(run_job(jobIndex, job)) for 
+                 jobIndex, job in enumerate(jobs)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                if resultCallback(*(await task)):
+                    return True
+            return False
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    return asyncio.run(run_all_jobs())
+
+def get_longest_first_order(durations: list) -> list:
+    """
+    Orders jobs longest first, so that when they are run by a pool of workers
+    no long job starts late and leaves the other workers idle while it
+    finishes. Jobs of equal duration keep their order
+
+    :param durations: The predicted duration of each job
+    :return: The list of job indices, longest first
+    """
+    return sorted(range(len(durations)), key=durations.__getitem__,
+            reverse=True)
+
+def get_makespan(durations: list, workerCount: int) -> float:
+    """
+    Predicts the time taken to run jobs of the given durations in order, each
+    job starting on the first worker to become free
+
+    :param durations: The duration of each job, in the order they are started
+    :param workerCount: The number of workers running the jobs
+    """
+    workers = [0] * max(1, min(workerCount, len(durations)))
+    for duration in durations:
+        heapq.heapreplace(workers, workers[0] + duration)
+    return max(workers)
+
+def get_makespan_lower_bound(durations: list, workerCount: int) -> float:
+    """
+    Returns the least time in which any order of jobs of the given durations
+    could be run: that of the longest job, or of the total work evenly split
+    """
+    return max(sum(durations) / max(1, workerCount), max(durations,
+        default=0))
+
+class OrderedEmitter:
+    """
+    Accepts results in any order and emits them in index order as soon as
+    every result before them has been emitted
+    """
+
+    def __init__(self, emitFunction):
+        self._emitFunction = emitFunction
+        self._nextIndex = 0
+        self._pending = {}
+
+    def add(self, index: int, result):
+        """
+        Adds the result with the given index, emitting every result that is
+        now ready
+
+        :param index: The position of the result in the emitted sequence
+        :param result: The result to eventually pass to the emit function
+        """
+        self._pending[index] = result
+        while self._nextIndex in self._pending:
+            self._emitFunction(self._pending.pop(self._nextIndex))
+            self._nextIndex += 1
+
+    def get_pending_count(self) -> int:
+        return len(self._pending)
@@ -8,7 +8,12 @@
 from util import fileops
 from util.definitions import Definitions
 from util.variables import Variables
-from util.language import Languages
+from util.language import Languages, ExecutionResult
+from util.limits import Limits
+from util.harness.harnesses import Harnesses
+from util.harness.base import HarnessUnsupportedError
+from util.process import InputFile
+import asyncio
 
 class Solution:
     NAMING_DEFINITION_KEY = 'solution_naming'
@@ -19,24 +24,124 @@ class Solution:
         self.problemNumber = problemNumber
         self.solutionWriter = solutionWriter
         self.solutionLanguage = solutionLanguage
+        self._sourceHash = None
+        self._limits = None
 
     def __str__(self):
         return "Problem {} written in {}".format(str(self.problemNumber), 
                 self.solutionLanguage.name)
 
-    def get_output(self, inputContents: str, outputToStderr: bool=False) -> str:
+    def get_output(self, inputContents: str, outputToStderr: bool=False,
+            useHarness: bool=False) -> str:
         """
         Runs the solution file given by self._path by delegating to its languages execute.
-        Returns output printed to stdout
+        Returns output printed to stdout. If useHarness is set, the solution is
+        run in its language's harness when it supports one.
+        """
+        return self.run(inputContents, outputToStderr, useHarness).output
+
+    async def get_output_async(self, inputContents: str, 
+            outputToStderr: bool=False, useHarness: bool=False) -> str:
+        """
+        Runs the solution file on the running asyncio event loop by delegating
+        to its languages execute. Returns output printed to stdout
+        """
+        return (await self.run_async(inputContents, outputToStderr, 
+            useHarness)).output
+
+    def run(self, inputContents: str, outputToStderr: bool=False,
+            useHarness: bool=False, limits: Limits=None,
+            comparator=None) -> ExecutionResult:
+        """
+        Runs the solution like get_output, but returns an ExecutionResult
+        holding the output along with the time and memory the run used. The
+        solution's own limits are used unless others are given, which
+        harnesses do not support. Given a Comparator, the output is checked
+        with it and the run stopped as soon as the output is wrong.
         """
         # If the solution was never given a language, output is blank
         if self.solutionLanguage is None:
-            return ''
+            return ExecutionResult('')
+
+        if useHarness and limits is None:
+            harnessResult = self._run_in_harness(inputContents, 
+                    outputToStderr, comparator)
+            if not harnessResult is None:
+                return harnessResult
+
+        return self.solutionLanguage.run_code(self._path, inputContents,
+                verbose=outputToStderr, 
+                limits=self.get_limits() if limits is None else limits,
+                comparator=comparator)
+
+    async def run_async(self, inputContents: str, outputToStderr: bool=False,
+            useHarness: bool=False, comparator=None) -> ExecutionResult:
+        """
+        Runs the solution like get_output_async, but returns an
+        ExecutionResult holding the output along with the time and memory the
+        run used
+        """
+        if self.solutionLanguage is None:
+            return ExecutionResult('')
+
+        if useHarness:
+            # Harnesses block, so they are run on the loop's thread pool
+            harnessResult = await asyncio.get_running_loop().run_in_executor(
+                    None, self._run_in_harness, inputContents,
+                    outputToStderr, comparator)
+            if not harnessResult is None:
+                return harnessResult
 
-        return self.solutionLanguage.execute_code(self._path, inputContents,
-                verbose=outputToStderr)
+        return await self.solutionLanguage.run_code_async(self._path,
+                inputContents, verbose=outputToStderr,
+                limits=self.get_limits(), comparator=comparator)
+
+    def _run_in_harness(self, inputContents: str, outputToStderr: bool,
+            comparator=None):
+        """
+        Runs the solution in its harness and returns its ExecutionResult, or
+        None if the solution cannot be run in a harness. Harnesses are sent
+        their input through a pipe, so InputFiles are not run in them
+        """
+        if isinstance(inputContents, InputFile):
+            return None
+
+        harness = Harnesses.get_harness(self, verbose=outputToStderr)
+        if harness is None:
+            return None
+
+        try:
+            result = harness.run(inputContents)
+        except HarnessUnsupportedError:
+            Harnesses.mark_unsupported(self)
+            return None
+
+        if not comparator is None:
+            # Harnesses return the output with its trailing newline removed
+            comparator.feed((result.output + '\n').encode('utf-8'))
+            result.matched = comparator.finish()
+            result.output = comparator.get_output()
+            result.expectedOutput = comparator.get_expected_output()
+        return result
                 
 
+    def get_limits(self) -> Limits:
+        """
+        Returns the Limits the solution is run within, read once per solution
+        """
+        if self._limits is None:
+            self._limits = Limits.get_limits(self.problemNumber,
+                    self.solutionLanguage)
+        return self._limits
+
+    def get_source_hash(self) -> str:
+        """
+        Returns the sha256 of the solution file, computed once per solution
+        """
+        if self._sourceHash is None:
+            self._sourceHash = fileops.get_file_hash(self._path)
+        return self._sourceHash
+
     def compile(self, verbose=False):
         self.solutionLanguage.compile_code(self._path, verbose=verbose)
 
@@ -0,0 +1,143 @@
+################################################################################
+# Filename: util/stats.py
+# Date:     16 October 2026
+#
+# Contains the statistics used to summarize the timings of solutions and to
+# tell real changes in them from measurement noise
+################################################################################
+import math
+import random
+import statistics
+
+# Samples at most this large are tested with the exact distribution of U
+# rather than its normal approximation
+MAX_EXACT_SAMPLE_PRODUCT = 400
+
+DEFAULT_RESAMPLE_COUNT = 1000
+DEFAULT_CONFIDENCE = 0.95
+
+def percentile(values: list, fraction: float) -> float:
+    """
+    Finds the value below which the given fraction of values lie,
+    interpolating linearly between the closest values
+
+    :param fraction: The fraction, between 0 and 1
+    """
+    sortedValues = sorted(values)
+    position = fraction * (len(sortedValues) - 1)
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sortedValues) - 1)
+    return sortedValues[lower] + (sortedValues[upper] - sortedValues[lower]) \
+            * (position - lower)
+
+def standard_deviation(values: list) -> float:
+    """
+    Returns the sample standard deviation of values, or 0 for a single value
+    """
+    if len(values) < 2:
+        return 0.0
+    return statistics.stdev(values)
+
+def bootstrap_confidence_interval(values: list,
+        statistic=statistics.median, confidence: float=DEFAULT_CONFIDENCE,
+        resampleCount: int=DEFAULT_RESAMPLE_COUNT, seed=None) -> tuple:
+    """
+    Estimates a confidence interval of a statistic of the distribution values
+    were drawn from, by the percentile bootstrap: the statistic is found for
+    many resamples of values, drawn with replacement, and the interval holds
+    the central confidence fraction of them
+
+    :param statistic: The function of a list of values to estimate
+    :param seed: The seed of the resampling, so intervals can be reproduced
+    :return: (low, high)
+    """
+    generator = random.Random(seed)
+    estimates = [statistic(generator.choices(values, k=len(values))) for _ in
+                 range(resampleCount)]
+    tail = (1 - confidence) / 2
+    return (percentile(estimates, tail), percentile(estimates, 1 - tail))
+
+def mann_whitney_u(samples: list, otherSamples: list) -> float:
+    """
+    Counts the pairs of a sample and an other sample in which the sample is
+    larger, with ties counting half
+
+    :return: The Mann-Whitney U statistic of samples
+    """
+    # Ranking both samples together finds U in O((n + m) log(n + m))
+    combined = sorted([(value, 0) for value in samples] +
+                      [(value, 1) for value in otherSamples])
+    rankSum = 0
+    index = 0
+    while index < len(combined):
+        tieEnd = index
+        while tieEnd < len(combined) and combined[tieEnd][0] == \
+                combined[index][0]:
+            tieEnd += 1
+        averageRank = (index + 1 + tieEnd) / 2
+        rankSum += averageRank * sum(1 for _, group in combined[index:tieEnd]
+                                     if group == 0)
+        index = tieEnd
+
+    return rankSum - len(samples) * (len(samples) + 1) / 2
+
+def _get_exact_u_counts(n: int, m: int) -> list:
+    """
+    Counts the orderings of n and m distinct values giving each U, where U
+    counts the pairs in which one of the n values is the larger
+
+    :return: The list of counts, indexed by U
+    """
+    # counts[j] holds the counts for i of the n values and j of the m values,
+    # built up one value at a time
+    counts = [[1] for _ in range(m + 1)]
+    for i in range(1, n + 1):
+        nextCounts = [[1]]
+        for j in range(1, m + 1):
+            # The largest value is either one of the i, above all j others,
+            # or one of the j
+            withLargest = [0] * j + counts[j]
+            withoutLargest = nextCounts[j - 1]
+            length = max(len(withLargest), len(withoutLargest))
+            nextCounts.append([
+                (withLargest[u] if u < len(withLargest) else 0) +
+                (withoutLargest[u] if u < len(withoutLargest) else 0)
+                for u in range(length)])
+        counts = nextCounts
+    return counts[m]
+
+def mann_whitney_p_value(samples: list, otherSamples: list) -> float:
+    """
+    Tests whether samples tend to be larger than otherSamples with a
+    one-sided Mann-Whitney U test, which assumes nothing of the distribution
+    of the samples. Small samples without ties use the exact distribution of
+    U and others its normal approximation
+
+    :return: The probability of a U at least as large as that of samples if
+             both were drawn from the same distribution
+    """
+    n = len(samples)
+    m = len(otherSamples)
+    if n == 0 or m == 0:
+        return 1.0
+
+    u = mann_whitney_u(samples, otherSamples)
+    combined = samples + otherSamples
+    hasTies = len(set(combined)) < len(combined)
+    if n * m <= MAX_EXACT_SAMPLE_PRODUCT and not hasTies:
+        counts = _get_exact_u_counts(n, m)
+        return sum(counts[int(u):]) / sum(counts)
+
+    # The variance of U shrinks with every group of tied values
+    total = n + m
+    tieCounts = {}
+    for value in combined:
+        tieCounts[value] = tieCounts.get(value, 0) + 1
+    tieCorrection = sum(count ** 3 - count for count in tieCounts.values()) / \
+            (total * (total - 1))
+    variance = n * m / 12 * (total + 1 - tieCorrection)
+    if variance <= 0:
+        return 1.0
+
+    z = (u - n * m / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
@@ -0,0 +1,289 @@
+################################################################################
+# Filename: util/subparsers/bench.py
+# Date:     16 October 2026
+#
+# Contains logic for the subparser that is invoked when calling
+# $ ./runner.py bench
+################################################################################
+from util import case as CaseManager
+from util import fileops
+from util.language import ExecutionError
+from util.subparsers.test import _get_filtered_solutions, _get_comparator
+from util.result import CaseResult
+from util.stats import percentile, standard_deviation, \
+        bootstrap_confidence_interval, DEFAULT_CONFIDENCE
+from util.process import IOMode
+from util.zygote import Zygotes
+from util.perror import PyCException
+import json
+import socket
+import statistics
+import time
+
+SUBPARSER_KEYWORD = "bench"
+
+DEFAULT_RUN_COUNT = 10
+DEFAULT_WARMUP_COUNT = 2
+# Bootstrap resampling is seeded so that the same timings always give the
+# same confidence intervals
+BOOTSTRAP_SEED = 0
+
+CPU_TIME_KEY = CaseResult.CPU_TIME_KEY
+WALL_TIME_KEY = CaseResult.WALL_TIME_KEY
+ERROR_KEY = 'error'
+
+def operate(args):
+    """
+    Takes the passed in args and delegates to the proper functionality. This is
+    set as the executable function when the `bench` subparser is used
+
+    Arguments:
+    args: Namespace - The arguments passed via CLI
+    """
+    if args.runs < 1:
+        raise PyCException('Error: --runs must be at least 1')
+    if args.warmup < 0:
+        raise PyCException('Error: --warmup must not be negative')
+    if not 0 < args.confidence < 1:
+        raise PyCException('Error: --confidence must be between 0 and 1')
+
+    IOMode.set_mode(args.io_mode)
+    Zygotes.set_enabled(args.zygote)
+    bench(args.writers, args.language, args.problems, args.runs, args.warmup,
+            confidence=args.confidence, jsonPath=args.json,
+            verbose=args.verbose)
+
+def add_to_subparser_object(subparserObject, parentParser):
+    """
+    Adds the bench subparser to a given subparsers object and delegates bench
+    functionality to the operate() function
+
+    Arguments:
+    subparserObject - The ArgumentParser given by parser.add_subparsers() to add
+                      the bench subparser to
+    parentParser    - The parser to be included as a parent to the subparser,
+                      useful for global flags
+    """
+    benchParser = subparserObject.add_parser(SUBPARSER_KEYWORD,
+            parents=[parentParser])
+    benchParser.add_argument('writers', nargs='*')
+    benchParser.add_argument('--runs', type=int, default=DEFAULT_RUN_COUNT,
+            help='The number of measured runs of every solution/case pair')
+    benchParser.add_argument('--warmup', type=int,
+            default=DEFAULT_WARMUP_COUNT,
+            help='The number of unmeasured runs before the measured ones')
+    benchParser.add_argument('--confidence', type=float,
+            default=DEFAULT_CONFIDENCE,
+            help='The confidence of the bootstrap intervals of the median')
+    benchParser.add_argument('--json', metavar='PATH',
+            help='Also write every measurement summary to a JSON file')
+    benchParser.add_argument('--io-mode', choices=IOMode.ALL,
+            default=IOMode.PIPE,
+            help='Pipe input and output through the runner, or pass them as '
+            'in-memory files')
+    benchParser.add_argument('--zygote', action='store_true',
+            help='Start cases from a preloaded zygote process instead of '
+            'the runner')
+    benchParser.set_defaults(func=operate)
+
+def _summarize(values: list, confidence: float) -> dict:
+    """
+    Summarizes the measurements of a solution/case pair
+
+    Arguments:
+    values: list      - The measurements of every run
+    confidence: float - The confidence of the interval of the median
+    """
+    confidenceLow, confidenceHigh = bootstrap_confidence_interval(values,
+            confidence=confidence, seed=BOOTSTRAP_SEED)
+    return {
+            'min'            : min(values),
+            'median'         : statistics.median(values),
+            'p95'            : percentile(values, 0.95),
+            'stddev'         : standard_deviation(values),
+            'medianCiLow'    : confidenceLow,
+            'medianCiHigh'   : confidenceHigh
+           }
+
+def _bench_solution_against_case(solution, case, runCount: int,
+        warmupCount: int, confidence: float, verbose: bool=False) -> dict:
+    """
+    Runs an already compiled solution against a case warmupCount times and
+    then runCount times more, measuring the later runs. Benchmarking stops at
+    the first run that fails or gives the wrong output
+
+    Arguments:
+    solution          - The solution to benchmark
+    case              - The case to run the solution against
+    runCount: int     - The number of measured runs
+    warmupCount: int  - The number of unmeasured runs before them
+    confidence: float - The confidence of the intervals of the medians
+    verbose: bool     - Whether to show the output of the solution
+
+    Return:
+    The record of the pair, holding the summaries of its CPU and wall times
+    or the reason it could not be measured
+    """
+    result = CaseResult(solution, case, None, None)
+    record = {
+            CaseResult.WRITER_KEY      : solution.solutionWriter,
+            CaseResult.PROBLEM_KEY     : int(solution.problemNumber),
+            CaseResult.LANGUAGE_KEY    : solution.solutionLanguage.name,
+            CaseResult.CASE_TYPE_KEY   : result.get_case_string(),
+            CaseResult.CASE_NUMBER_KEY : result.get_case_number()
+             }
+
+    executionResults = []
+    for runIndex in range(warmupCount + runCount):
+        try:
+            executionResult = solution.run(case.get_process_input(),
+                    outputToStderr=verbose, comparator=_get_comparator(case))
+        except ExecutionError as e:
+            record[ERROR_KEY] = e.message
+            return record
+        if executionResult.matched is False:
+            record[ERROR_KEY] = 'Incorrect Solution'
+            return record
+        if runIndex >= warmupCount:
+            executionResults.append(executionResult)
+
+    record[CPU_TIME_KEY] = _summarize([executionResult.cpuTime for
+        executionResult in executionResults], confidence)
+    record[WALL_TIME_KEY] = _summarize([executionResult.wallTime for
+        executionResult in executionResults], confidence)
+    return record
+
+def bench(writerNames: list, languageNames: list, problemStrings: list,
+        runCount: int=DEFAULT_RUN_COUNT, warmupCount: int=DEFAULT_WARMUP_COUNT,
+        confidence: float=DEFAULT_CONFIDENCE, jsonPath: str=None,
+        verbose: bool=False) -> list:
+    """
+    Benchmarks the solutions given by the same filters as test against every
+    case of their problem, one run at a time so that runs do not compete for
+    the machine, and prints the summary of each pair's CPU and wall times
+
+    Arguments:
+    writerNames: list    - The list of writer names to benchmark solutions for
+    languageNames: list  - The list of language names to benchmark solutions
+                           for
+    problemStrings: list - The list of problem strings to benchmark solutions
+                           for
+    runCount: int        - The number of measured runs of every pair
+    warmupCount: int     - The number of unmeasured runs before them
+    confidence: float    - The confidence of the intervals of the medians
+    jsonPath: str        - The file to write the records of every pair to, or
+                           None
+    verbose: bool        - Whether to show the output of compilers and
+                           solutions
+
+    Return:
+    The list of records of every pair
+    """
+    solutions = _get_filtered_solutions(writerNames, languageNames,
+            problemStrings)
+    cases = CaseManager.get_all_cases()
+    startedAt = time.time()
+
+    records = []
+    runTime = 0
+    _print_bench_header()
+    try:
+        for solution in solutions:
+            solutionCases = cases.get(int(solution.problemNumber), [])
+            if len(solutionCases) == 0:
+                continue
+
+            try:
+                solution.compile(verbose=verbose)
+            except ExecutionError:
+                print('{} {} {}: Compile Error'.format(
+                    solution.solutionWriter, solution.problemNumber,
+                    solution.solutionLanguage.name))
+                continue
+
+            for case in solutionCases:
+                pairStartTime = time.monotonic()
+                record = _bench_solution_against_case(solution, case,
+                        runCount, warmupCount, confidence, verbose)
+                if not ERROR_KEY in record:
+                    runTime += time.monotonic() - pairStartTime
+                _print_bench_row(record)
+                records.append(record)
+    finally:
+        Zygotes.close_all()
+
+    _print_bench_throughput(records, runCount + warmupCount, runTime)
+
+    if not jsonPath is None:
+        _write_bench_json(jsonPath, records, runCount, warmupCount,
+                confidence, startedAt)
+    return records
+
+def _write_bench_json(jsonPath: str, records: list, runCount: int,
+        warmupCount: int, confidence: float, startedAt: float):
+    """
+    Writes the records of a benchmark, and the settings it was run with, to
+    a JSON file
+    """
+    parentDir = fileops.get_parent_dir(jsonPath)
+    if len(parentDir) > 0:
+        fileops.make(parentDir, fileops.FileType.DIRECTORY)
+    fileops.write_file(jsonPath, json.dumps({
+        'startedAt'  : time.strftime('%Y-%m-%dT%H:%M:%S',
+                                     time.localtime(startedAt)),
+        'hostname'   : socket.gethostname(),
+        'runs'       : runCount,
+        'warmups'    : warmupCount,
+        'confidence' : confidence,
+        'results'    : records
+        }, indent=2))
+
+def _print_bench_throughput(records: list, runsPerPair: int, runTime: float):
+    """
+    Prints how many runs of the pairs that were measured in full were made
+    per second, which shows the cost of starting every case
+
+    Arguments:
+    records: list     - The records of every pair
+    runsPerPair: int  - The number of warmup and measured runs of each pair
+    runTime: float    - The seconds spent running those pairs
+    """
+    runCount = sum(runsPerPair for record in records if not ERROR_KEY in
+            record)
+    if runCount == 0 or runTime <= 0:
+        return
+    print('Ran {} cases in {:.2f}s ({:.1f} cases/s)'.format(runCount, runTime,
+        runCount / runTime))
+
+def _print_bench_header():
+    formattingStr = ("{0: <10}\t{1: <8}\t{2: <10}\t{3: <10}\t{4: <6}\t{5: <8}\t"
+            "{6: <8}\t{7: <8}\t{8: <8}\t{9: <17}\t{10: <8}\t{11}")
+    print(formattingStr.format("Writer", "Problem", "Language", "CaseType",
+        "Case", "Measure", "Min(s)", "Med(s)", "P95(s)", "MedCI(s)", "SD(s)",
+        "Error"))
+
+def _print_bench_row(record: dict):
+    """
+    Prints the summaries of the CPU and wall times of a pair, or the reason
+    it could not be measured
+
+    Arguments:
+    record: dict - The record given by _bench_solution_against_case
+    """
+    formattingStr = ("{0: <10}\t{1: <8}\t{2: <10}\t{3: <10}\t{4: <6}\t{5: <8}\t"
+            "{6: <8}\t{7: <8}\t{8: <8}\t{9: <17}\t{10: <8}\t{11}")
+    identity = [record[CaseResult.WRITER_KEY], record[CaseResult.PROBLEM_KEY],
+            record[CaseResult.LANGUAGE_KEY], record[CaseResult.CASE_TYPE_KEY],
+            record[CaseResult.CASE_NUMBER_KEY]]
+    if ERROR_KEY in record:
+        print(formattingStr.format(*(identity + ['-'] * 6 +
+            [record[ERROR_KEY]])))
+        return
+
+    for measure, key in [('CPU', CPU_TIME_KEY), ('Wall', WALL_TIME_KEY)]:
+        summary = record[key]
+        print(formattingStr.format(*(identity + [measure] + [
+            '{:.4f}'.format(summary[name]) for name in ['min', 'median',
+                'p95']] + ['{:.4f}-{:.4f}'.format(summary['medianCiLow'],
+                    summary['medianCiHigh']),
+                '{:.4f}'.format(summary['stddev']), ''])))
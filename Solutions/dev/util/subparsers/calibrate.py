@@ -0,0 +1,362 @@
+################################################################################
+# Filename: util/subparsers/calibrate.py
+# Date:     16 October 2026
+#
+# Contains logic for the subparser that is invoked when calling
+# $ ./runner.py calibrate
+################################################################################
+from util import case as CaseManager
+from util.case import KnownCase
+from util.comparator import Comparators
+from util.definitions import Definitions
+from util.language import ExecutionError, Languages
+from util.limits import Limits
+from util.scheduler import run_jobs
+from util.subparsers.test import _get_filtered_solutions
+from util.perror import PyCException
+import math
+
+SUBPARSER_KEYWORD = "calibrate"
+
+TIME_MULTIPLIER_KEY = 'calibration_time_multiplier'
+MEMORY_MULTIPLIER_KEY = 'calibration_memory_multiplier'
+COMPLETE_THRESHOLD_KEY = 'complete_threshold'
+
+DEFAULT_RUN_COUNT = 3
+DEFAULT_TIME_MULTIPLIER = 3
+DEFAULT_MEMORY_MULTIPLIER = 2
+
+# Proposed limits are rounded up to these units
+CPU_SECONDS_UNIT = 0.1
+MEMORY_BYTES_UNIT = 1024 * 1024
+
+# Memory is measured as resident size but limited as address space, which is
+# larger, so small proposals are raised to this
+MINIMUM_MEMORY_BYTES = 64 * MEMORY_BYTES_UNIT
+# A memory limit that rejects an accepted solution is doubled, at most this
+# many times, before memory is left unlimited
+MAX_MEMORY_DOUBLINGS = 6
+
+def operate(args):
+    """
+    Takes the passed in args and delegates to the proper functionality. This is
+    set as the executable function when the `calibrate` subparser is used
+
+    Arguments:
+    args: Namespace - The arguments passed via CLI
+    """
+    if args.runs < 1:
+        raise PyCException('Error: --runs must be at least 1')
+    if args.jobs < 1:
+        raise PyCException('Error: --jobs must be at least 1')
+
+    calibrate(args.language, args.problems, args.runs,
+            timeMultiplier=args.time_multiplier,
+            memoryMultiplier=args.memory_multiplier, jobCount=args.jobs,
+            writeLimits=not args.dry_run, verbose=args.verbose)
+
+def add_to_subparser_object(subparserObject, parentParser):
+    """
+    Adds the calibrate subparser to a given subparsers object and delegates
+    calibrate functionality to the operate() function
+
+    Arguments:
+    subparserObject - The ArgumentParser given by parser.add_subparsers() to add
+                      the calibrate subparser to
+    parentParser    - The parser to be included as a parent to the subparser,
+                      useful for global flags
+    """
+    calibrateParser = subparserObject.add_parser(SUBPARSER_KEYWORD,
+            parents=[parentParser])
+    calibrateParser.add_argument('--runs', type=int, default=DEFAULT_RUN_COUNT,
+            help='The number of times to run every solution against each case')
+    calibrateParser.add_argument('--time-multiplier', type=float,
+            help='The multiple of the fastest solution\'s CPU time to allow')
+    calibrateParser.add_argument('--memory-multiplier', type=float,
+            help='The multiple of the largest solution\'s memory to allow')
+    calibrateParser.add_argument('--jobs', type=int, default=1,
+            help='The number of solutions to run at once')
+    calibrateParser.add_argument('--dry-run', action='store_true',
+            help='Print the proposed limits without saving them')
+    calibrateParser.set_defaults(func=operate)
+
+class SolutionMeasurement:
+    """
+    The worst CPU time, wall time and peak memory of a single solution over
+    every run against every case of its problem. A solution is accepted if
+    it produced the correct output every time
+    """
+
+    def __init__(self, solution):
+        self.solution = solution
+        self.accepted = True
+        self.cpuTime = 0
+        self.wallTime = 0
+        self.peakMemory = 0
+
+    def add(self, executionResult):
+        """
+        Keeps the worst of the current measurements and those of the
+        ExecutionResult
+        """
+        self.cpuTime = max(self.cpuTime, executionResult.cpuTime or 0)
+        self.wallTime = max(self.wallTime, executionResult.wallTime or 0)
+        self.peakMemory = max(self.peakMemory, executionResult.peakMemory or 0)
+
+def _get_calibration_limits(solution, memoryBytes: int=None) -> Limits:
+    """
+    Gets the limits solutions are measured within, which keep the wall time
+    and output limits of the solution so that runaway solutions still stop,
+    but drop the limits being calibrated, except for a memory limit being
+    checked
+    """
+    limits = solution.get_limits()
+    return Limits(wallSeconds=limits.wallSeconds,
+            outputBytes=limits.outputBytes, memoryBytes=memoryBytes)
+
+def _measure_solution(solution, cases: list, runCount: int,
+        verbose: bool=False, memoryBytes: int=None):
+    """
+    Runs a solution runCount times against every case and returns its
+    SolutionMeasurement. Measuring stops at the first failure
+
+    Arguments:
+    solution         - The solution to measure
+    cases: list      - The known cases of the solution's problem
+    runCount: int    - The number of times to run the solution against each
+                       case
+    verbose: bool    - Whether to show the output of compilers and solutions
+    memoryBytes: int - The memory limit to run the solution within, or None
+    """
+    measurement = SolutionMeasurement(solution)
+    try:
+        solution.compile(verbose=verbose)
+    except ExecutionError:
+        measurement.accepted = False
+        return measurement
+
+    limits = _get_calibration_limits(solution, memoryBytes)
+    for _ in range(runCount):
+        for case in cases:
+            try:
+                executionResult = solution.run(case.get_process_input(),
+                        outputToStderr=verbose, limits=limits,
+                        comparator=Comparators.get_comparator(
+                            case.problemNumber, case.outputContents))
+            except ExecutionError:
+                measurement.accepted = False
+                return measurement
+
+            if not executionResult.matched:
+                measurement.accepted = False
+                return measurement
+            measurement.add(executionResult)
+
+    return measurement
+
+def _round_up(value: float, unit: float):
+    """
+    Rounds value up to a whole number of units, and to at least one unit
+    """
+    return max(1, math.ceil(value / unit - 1e-9)) * unit
+
+def _get_proposed_limits(measurements: list, limitMemory: bool,
+        timeMultiplier: float, memoryMultiplier: float) -> dict:
+    """
+    Proposes the limits of a single language of a problem as multiples of
+    the CPU time of the fastest accepted solution and of the memory of the
+    largest one
+
+    Arguments:
+    measurements: list      - The SolutionMeasurements of the accepted
+                              solutions written in the language
+    limitMemory: bool       - Whether to propose a memory limit
+    timeMultiplier: float   - The multiple of the least CPU time to allow
+    memoryMultiplier: float - The multiple of the most memory to allow
+
+    Return:
+    A limits block
+    """
+    proposedLimits = {Limits.CPU_SECONDS_KEY : round(_round_up(timeMultiplier *
+        min(measurement.cpuTime for measurement in measurements),
+        CPU_SECONDS_UNIT), 1)}
+    if limitMemory:
+        proposedLimits[Limits.MEMORY_BYTES_KEY] = int(max(MINIMUM_MEMORY_BYTES,
+            _round_up(memoryMultiplier * max(measurement.peakMemory for
+                measurement in measurements), MEMORY_BYTES_UNIT)))
+
+    return proposedLimits
+
+def _is_memory_limited(language) -> bool:
+    """
+    Whether calibration limits the memory of the language. Languages that
+    leave their memory unlimited in languages.json, such as those running in
+    a JVM, keep it that way
+    """
+    return language is None or language.limits is None or \
+            not (Limits.MEMORY_BYTES_KEY in language.limits and
+                    language.limits[Limits.MEMORY_BYTES_KEY] is None)
+
+def _get_verified_memory_limit(measurements: list, cases: list,
+        memoryBytes: int, jobCount: int=1, verbose: bool=False) -> int:
+    """
+    Runs the accepted solutions against every case within the memory limit,
+    doubling it until all of them are still accepted. The limit is on
+    address space, which is not measured and may be far larger than the
+    resident size the limit was proposed from
+
+    Arguments:
+    measurements: list - The SolutionMeasurements of the accepted solutions
+    cases: list        - The known cases of their problem
+    memoryBytes: int   - The proposed memory limit
+    jobCount: int      - The number of solutions to run at once
+    verbose: bool      - Whether to show the output of compilers and
+                         solutions
+
+    Return:
+    The least memory limit tried that accepts every solution, or None if
+    none did
+    """
+    for _ in range(MAX_MEMORY_DOUBLINGS + 1):
+        # The run stops at the first solution the limit rejects
+        rejected = run_jobs([measurement.solution for measurement in
+            measurements], lambda solution: _measure_solution(solution, cases,
+                1, verbose, memoryBytes), jobCount,
+            lambda jobIndex, verification: not verification.accepted)
+        if not rejected:
+            return memoryBytes
+        memoryBytes *= 2
+
+    return None
+
+def _get_definition_or_default(key: str, default):
+    """
+    Gets the value of the definition given by key, or default if it is unset
+    """
+    value = Definitions.get_value(key)
+    return default if value is None else value
+
+def calibrate(languageNames: list, problemStrings: list, runCount: int,
+        timeMultiplier: float=None, memoryMultiplier: float=None,
+        jobCount: int=1, writeLimits: bool=True, verbose: bool=False):
+    """
+    Measures every writer's solutions against the known cases of their
+    problem and proposes CPU time and memory limits for each language of
+    every problem with enough accepted solutions, saving them to the problem
+    limits file unless writeLimits is False. Proposed memory limits are
+    raised until every accepted solution runs within them
+
+    Arguments:
+    languageNames: list     - The list of languages to calibrate
+    problemStrings: list    - The list of problem strings to calibrate
+    runCount: int           - The number of times to run each solution
+                              against each case
+    timeMultiplier: float   - The multiple of the least CPU time to allow.
+                              Read from definitions.json if None
+    memoryMultiplier: float - The multiple of the most memory to allow.
+                              Read from definitions.json if None
+    jobCount: int           - The number of solutions to measure at once
+    writeLimits: bool       - Whether to save the proposed limits
+    """
+    if timeMultiplier is None:
+        timeMultiplier = _get_definition_or_default(TIME_MULTIPLIER_KEY,
+                DEFAULT_TIME_MULTIPLIER)
+    if memoryMultiplier is None:
+        memoryMultiplier = _get_definition_or_default(MEMORY_MULTIPLIER_KEY,
+                DEFAULT_MEMORY_MULTIPLIER)
+    completeThreshold = _get_definition_or_default(COMPLETE_THRESHOLD_KEY, 1)
+
+    cases = CaseManager.get_all_cases()
+    knownCases = {problemNumber : [case for case in problemCases if
+                  isinstance(case, KnownCase)] for problemNumber, problemCases
+                  in cases.items()}
+    solutions = [solution for solution in _get_filtered_solutions(None,
+                 languageNames, problemStrings) if len(knownCases.get(
+                     int(solution.problemNumber), [])) > 0]
+
+    measurements = [None] * len(solutions)
+    def store_measurement(jobIndex, measurement):
+        measurements[jobIndex] = measurement
+    run_jobs(solutions, lambda solution: _measure_solution(solution,
+        knownCases[int(solution.problemNumber)], runCount, verbose),
+        jobCount, store_measurement)
+
+    # {problem number : {language name : [accepted SolutionMeasurement]}}
+    acceptedMeasurements = {}
+    for measurement in measurements:
+        if not measurement.accepted:
+            continue
+        solution = measurement.solution
+        acceptedMeasurements.setdefault(int(solution.problemNumber),
+                {}).setdefault(solution.solutionLanguage.name,
+                        []).append(measurement)
+
+    _print_calibration_header()
+    for problemNumber in sorted(set(int(solution.problemNumber) for solution
+            in solutions)):
+        languageMeasurements = acceptedMeasurements.get(problemNumber, {})
+        writerCount = len(set(measurement.solution.solutionWriter for
+            languageList in languageMeasurements.values() for measurement
+            in languageList))
+        if writerCount < completeThreshold:
+            print('Problem {}: {} of {} writers have accepted solutions, '
+                  'skipping'.format(problemNumber, writerCount,
+                      completeThreshold))
+            continue
+
+        for languageName, languageList in sorted(languageMeasurements.items()):
+            language = Languages.get_language_by_name(languageName)
+            proposedLimits = _get_proposed_limits(languageList,
+                    _is_memory_limited(language), timeMultiplier,
+                    memoryMultiplier)
+            if Limits.MEMORY_BYTES_KEY in proposedLimits:
+                memoryBytes = _get_verified_memory_limit(languageList,
+                        knownCases[problemNumber],
+                        proposedLimits[Limits.MEMORY_BYTES_KEY], jobCount,
+                        verbose)
+                if memoryBytes is None:
+                    print('Warning: Accepted {} solutions of problem {} fail '
+                          'within every memory limit tried, so memory is '
+                          'left unchanged'.format(languageName, problemNumber))
+                    del proposedLimits[Limits.MEMORY_BYTES_KEY]
+                else:
+                    proposedLimits[Limits.MEMORY_BYTES_KEY] = memoryBytes
+            _print_calibration_row(problemNumber, languageName, languageList,
+                    proposedLimits)
+            if writeLimits:
+                Limits.set_problem_language_limits(problemNumber, languageName,
+                        proposedLimits)
+
+def _print_calibration_header():
+    formattingStr = ("{0: <10}\t{1: <10}\t{2: <10}\t{3: <10}\t{4: <10}\t"
+            "{5: <10}\t{6: <10}\t{7}")
+    print(formattingStr.format("Problem", "Language", "Accepted", "MinCPU(s)",
+        "MaxCPU(s)", "MaxMem(MB)", "CPULimit", "MemLimit(MB)"))
+
+def _print_calibration_row(problemNumber, languageName: str,
+        measurements: list, proposedLimits: dict):
+    """
+    Prints the measurements and proposed limits of a language of a problem,
+    and warns about accepted solutions the proposed limits would reject
+
+    Arguments:
+    problemNumber        - The number of the calibrated problem
+    languageName: str    - The name of the calibrated language
+    measurements: list   - The SolutionMeasurements of the accepted solutions
+    proposedLimits: dict - The proposed limits block
+    """
+    formattingStr = ("{0: <10}\t{1: <10}\t{2: <10}\t{3: <10.3f}\t{4: <10.3f}\t"
+            "{5: <10.1f}\t{6: <10}\t{7}")
+    memoryLimit = proposedLimits.get(Limits.MEMORY_BYTES_KEY)
+    print(formattingStr.format(problemNumber, languageName, len(measurements),
+        min(measurement.cpuTime for measurement in measurements),
+        max(measurement.cpuTime for measurement in measurements),
+        max(measurement.peakMemory for measurement in measurements) /
+            MEMORY_BYTES_UNIT,
+        proposedLimits[Limits.CPU_SECONDS_KEY],
+        '-' if memoryLimit is None else memoryLimit // MEMORY_BYTES_UNIT))
+
+    for measurement in measurements:
+        if measurement.cpuTime >= proposedLimits[Limits.CPU_SECONDS_KEY]:
+            print('Warning: {}\'s accepted solution would exceed the CPU '
+                  'limit'.format(measurement.solution.solutionWriter))
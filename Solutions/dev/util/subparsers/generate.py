@@ -0,0 +1,278 @@
+################################################################################
+# Filename: util/subparsers/generate.py
+# Date:     16 October 2026
+#
+# Contains logic for the subparser that is invoked when calling
+# $ ./runner.py generate
+################################################################################
+from util import bulkgen, fileops
+from util.case import CaseFileWriter, get_case_file_path, _parse_input_json
+from util.definitions import Definitions
+from util.generator import Generator, Generators, get_program_language, \
+        compile_program
+from util.language import ExecutionError
+from util.pathmapper import PathMapper
+from util.subparsers.test import _get_unique_problem_numbers_from_list
+from util.perror import PyCException
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+import json
+import os
+import tempfile
+
+SUBPARSER_KEYWORD = "generate"
+
+STATE_FILE_KEY = 'generator_state_file'
+DEFAULT_STATE_FILE = '.cache/generators.json'
+
+# At most this many cases per worker process are made but not yet written,
+# so that fast workers cannot queue up every case in the parent
+PENDING_CASES_PER_PROCESS = 2
+
+DEFAULT_BENCHMARK_SIZES = [10 ** 5, 10 ** 6, 10 ** 7]
+
+def operate(args):
+    """
+    Takes the passed in args and delegates to the proper functionality. This is
+    set as the executable function when the `generate` subparser is used
+
+    Arguments:
+    args: Namespace - The arguments passed via CLI
+    """
+    if not args.jobs is None and args.jobs < 1:
+        raise PyCException('Error: --jobs must be at least 1')
+
+    if not args.benchmark is None:
+        benchmark(args.benchmark or DEFAULT_BENCHMARK_SIZES)
+        return
+
+    generate(args.problems, jobCount=args.jobs, force=args.force,
+            verbose=args.verbose)
+
+def add_to_subparser_object(subparserObject, parentParser):
+    """
+    Adds the generate subparser to a given subparsers object and delegates
+    generate functionality to the operate() function
+
+    Arguments:
+    subparserObject - The ArgumentParser given by parser.add_subparsers() to add
+                      the generate subparser to
+    parentParser    - The parser to be included as a parent to the subparser,
+                      useful for global flags
+    """
+    generateParser = subparserObject.add_parser(SUBPARSER_KEYWORD,
+            parents=[parentParser])
+    generateParser.add_argument('--jobs', type=int,
+            help='The number of generators to run at once, one per CPU by '
+                 'default')
+    generateParser.add_argument('--force', action='store_true',
+            help='Generate cases even if their generators have not changed')
+    generateParser.add_argument('--benchmark', nargs='*', type=int,
+            metavar='SIZE', help='Time the library generators on inputs of '
+                 'about SIZE elements, 10^5, 10^6 and 10^7 by default, '
+                 'instead of generating cases')
+    generateParser.set_defaults(func=operate)
+
+def _get_state_path() -> str:
+    """
+    Gets the path of the file holding the fingerprints of the generators of
+    every case file made, from the definitions file
+    """
+    stateFile = Definitions.get_value(STATE_FILE_KEY)
+    return PathMapper.get_mapped_path(stateFile if not stateFile is None else
+            DEFAULT_STATE_FILE)
+
+def _load_state(path: str) -> dict:
+    if not fileops.exists(path, fileops.FileType.FILE):
+        return {}
+    return fileops.get_json_dict(path)
+
+def _save_state(path: str, state: dict):
+    parentDir = fileops.get_parent_dir(path)
+    if len(parentDir) > 0:
+        fileops.make(parentDir, fileops.FileType.DIRECTORY)
+    fileops.write_json_dict(path, state)
+
+def _group_by_case_type(blocks: list) -> dict:
+    """
+    Groups a problem's generator blocks by the case type, and so the case
+    file, of the cases they make
+
+    :return: {case type : [GeneratorBlock]}, in the order of the blocks
+    """
+    groups = {}
+    for block in blocks:
+        groups.setdefault(block.caseType, []).append(block)
+    return groups
+
+def _get_fingerprint(blocks: list) -> str:
+    """
+    Gets the hash of everything the cases made by blocks depend on
+    """
+    return fileops.get_string_hash(json.dumps([block.get_fingerprint() for
+        block in blocks], sort_keys=True))
+
+def _get_jobs(blocks: list) -> list:
+    """
+    Gets the job of every case made by blocks, in the order of their cases
+
+    :return: [(generator path, reference path, seed, params, library
+              generator name)]
+    """
+    return [(block.generatorPath, block.referencePath, seed, block.params,
+        block.libraryName) for block in blocks for seed in block.seeds]
+
+def _generate_case(job: tuple) -> tuple:
+    """
+    Makes a single case, running its generator and, if there is one, its
+    reference solution. Exceptions do not survive the trip back from worker
+    processes, so failures are returned as messages instead
+
+    :return: (input JSON, output or None, error message or None)
+    """
+    generatorPath, referencePath, seed, params, libraryName = job
+    try:
+        if libraryName is None:
+            inputJson = Generator(generatorPath).generate(seed, params)
+        else:
+            inputJson = bulkgen.generate(libraryName, seed, params)
+        if referencePath is None:
+            return (inputJson, None, None)
+        output = get_program_language(referencePath).execute_code(
+                referencePath, _parse_input_json(inputJson))
+        return (inputJson, output, None)
+    except PyCException as e:
+        return (None, None, e.message.rstrip('\n'))
+    except ExecutionError as e:
+        return (None, None, 'Error: {} failed with seed {}: {}'.format(
+            referencePath, seed, e.message))
+
+def _compile_programs(blocks: list, verbose: bool=False):
+    """
+    Compiles the generators and reference solutions of blocks, once each
+    """
+    compiledPaths = set()
+    for block in blocks:
+        for path in [block.generatorPath, block.referencePath]:
+            if path is None or path in compiledPaths:
+                continue
+            compile_program(path, verbose=verbose)
+            compiledPaths.add(path)
+
+def _generate_cases(jobs: list, pool, pendingCount: int):
+    """
+    Makes the cases of jobs on the pool, yielding them in order while keeping
+    at most pendingCount of them submitted but not yet yielded
+    """
+    jobIterator = iter(jobs)
+    pendingResults = deque(pool.apply_async(_generate_case, (job,)) for job
+            in islice(jobIterator, pendingCount))
+    while len(pendingResults) > 0:
+        yield pendingResults.popleft().get()
+        for job in islice(jobIterator, 1):
+            pendingResults.append(pool.apply_async(_generate_case, (job,)))
+
+def _write_case_file(path: str, jobs: list, pool, jobCount: int=1) -> int:
+    """
+    Makes the cases of jobs and writes them, as they are made, to the case
+    file at path. The previous case file is kept if any case fails
+
+    :param pool: The Pool to make cases on, or None to make them in this
+                 process
+    :param jobCount: The number of processes of the pool
+    :return: The number of cases written
+    """
+    results = map(_generate_case, jobs) if pool is None else \
+            _generate_cases(jobs, pool, jobCount * PENDING_CASES_PER_PROCESS)
+    writer = CaseFileWriter(path)
+    try:
+        for caseNumber, (inputJson, output, error) in enumerate(results, 1):
+            if not error is None:
+                raise PyCException(error)
+            writer.add(caseNumber, inputJson, output)
+    except BaseException:
+        writer.discard()
+        raise
+    writer.close()
+    return len(jobs)
+
+def generate(problemStrings: list, jobCount: int=None, force: bool=False,
+        verbose: bool=False):
+    """
+    Makes the case files of every problem with generators in the generators
+    file. Cases are made on a pool of jobCount processes and streamed into
+    their case file in order, one case file per problem and case type. Case
+    files are only made again if the source, seeds or parameters of their
+    generators or reference solutions changed since they were last made
+
+    Arguments:
+    problemStrings: list - The problem strings to generate cases for, or all
+                           problems if None
+    jobCount: int        - The number of processes to generate cases on, or
+                           None for one per CPU
+    force: bool          - Whether to make case files that are up to date
+    verbose: bool        - Whether to show the output of compilers
+    """
+    problemGenerators = Generators.get_problem_generators()
+    if not problemStrings is None:
+        problemNumbers = _get_unique_problem_numbers_from_list(problemStrings)
+        problemGenerators = {problemNumber : blocks for problemNumber, blocks
+                in problemGenerators.items() if problemNumber in
+                problemNumbers}
+    if len(problemGenerators) == 0:
+        print('No generators are configured')
+        return
+
+    statePath = _get_state_path()
+    state = _load_state(statePath)
+    jobCount = jobCount or os.cpu_count() or 1
+    pool = None
+    try:
+        for problemNumber in sorted(problemGenerators):
+            for caseType, blocks in _group_by_case_type(
+                    problemGenerators[problemNumber]).items():
+                path = get_case_file_path(problemNumber, caseType)
+                stateKey = json.dumps([problemNumber, caseType])
+                fingerprint = _get_fingerprint(blocks)
+                if not force and state.get(stateKey) == fingerprint and \
+                        fileops.exists(path, fileops.FileType.FILE):
+                    print('Problem {} {}: Up to date'.format(problemNumber,
+                        caseType))
+                    continue
+
+                _compile_programs(blocks, verbose=verbose)
+                if pool is None and jobCount > 1:
+                    pool = Pool(jobCount, initializer=PathMapper.set_root_path,
+                            initargs=(PathMapper._rootPath,))
+                caseCount = _write_case_file(path, _get_jobs(blocks), pool,
+                        jobCount)
+                state[stateKey] = fingerprint
+                _save_state(statePath, state)
+                print('Problem {} {}: Generated {} cases'.format(problemNumber,
+                    caseType, caseCount))
+    finally:
+        if not pool is None:
+            pool.terminate()
+
+def benchmark(sizes: list):
+    """
+    Prints how fast each library generator builds inputs of each size and
+    writes them into a case file, next to a Python loop building an array and
+    passing it through a JSON string, as generator programs do
+
+    Arguments:
+    sizes: list - The numbers of elements of the inputs to build
+    """
+    if any(size < 1 for size in sizes):
+        raise PyCException('Error: Benchmark sizes must be at least 1')
+
+    formattingStr = "{0: <14}\t{1: <10}\t{2: <10}\t{3: <10}\t{4: <14}"
+    print(formattingStr.format("Generator", "Size", "Build (s)", "Write (s)",
+        "Elements/s"))
+    with tempfile.TemporaryDirectory() as directory:
+        for name, size, buildTime, writeTime in bulkgen.benchmark(sizes,
+                fileops.join_path(directory, 'benchmark.json')):
+            print(formattingStr.format(name, size, '{:.4f}'.format(buildTime),
+                '{:.4f}'.format(writeTime), '{:.0f}'.format(size /
+                    max(buildTime + writeTime, 1e-9))))
@@ -0,0 +1,145 @@
+################################################################################
+# Filename: util/subparsers/history.py
+# Date:     16 October 2026
+#
+# Contains logic for the subparser that is invoked when calling
+# $ ./runner.py history
+################################################################################
+from util.history import ResultHistory
+from util.subparsers.test import _get_unique_problem_numbers_from_list
+from util.perror import PyCException
+import time
+
+SUBPARSER_KEYWORD = "history"
+
+DEFAULT_RUN_COUNT = 5
+DEFAULT_SLOWEST_COUNT = 5
+HASH_LENGTH = 8
+
+def operate(args):
+    """
+    Takes the passed in args and delegates to the proper functionality. This is
+    set as the executable function when the `history` subparser is used
+
+    Arguments:
+    args: Namespace - The arguments passed via CLI
+    """
+    if args.runs < 1:
+        raise PyCException('Error: --runs must be at least 1')
+    if args.slowest < 0:
+        raise PyCException('Error: --slowest must not be negative')
+
+    history(args.writers, args.language, args.problems, args.runs,
+            args.slowest)
+
+def add_to_subparser_object(subparserObject, parentParser):
+    """
+    Adds the history subparser to a given subparsers object and delegates
+    history functionality to the operate() function
+
+    Arguments:
+    subparserObject - The ArgumentParser given by parser.add_subparsers() to add
+                      the history subparser to
+    parentParser    - The parser to be included as a parent to the subparser,
+                      useful for global flags
+    """
+    historyParser = subparserObject.add_parser(SUBPARSER_KEYWORD,
+            parents=[parentParser])
+    historyParser.add_argument('writers', nargs='*')
+    historyParser.add_argument('--runs', type=int, default=DEFAULT_RUN_COUNT,
+            help='The number of recent runs to show the timings of')
+    historyParser.add_argument('--slowest', type=int,
+            default=DEFAULT_SLOWEST_COUNT,
+            help='The number of slowest cases to show for each problem')
+    historyParser.set_defaults(func=operate)
+
+def _format_change(value: float, previousValue: float) -> str:
+    """
+    Formats the change from previousValue to value as a percentage, or '-' if
+    there is nothing to compare with
+    """
+    if previousValue is None or value is None or previousValue == 0:
+        return '-'
+    return '{:+.1f}%'.format(100 * (value - previousValue) / previousValue)
+
+def history(writerNames: list, languageNames: list, problemStrings: list,
+        runCount: int, slowestCount: int, path: str=None):
+    """
+    Prints the timings of every solution over its most recent runs and the
+    slowest cases of each problem, as recorded by previous test runs
+
+    Arguments:
+    writerNames: list    - The writers to show the history of, or all if None
+    languageNames: list  - The languages to show the history of, or all if
+                           None
+    problemStrings: list - The problem strings to show the history of, or
+                           all if None
+    runCount: int        - The number of recent runs of each solution to show
+    slowestCount: int    - The number of slowest cases to show per problem
+    path: str            - The path of the history database, or None for the
+                           definitions-defined database
+    """
+    problemNumbers = (None if problemStrings is None else
+                      _get_unique_problem_numbers_from_list(problemStrings))
+    resultHistory = ResultHistory.open(path)
+    try:
+        trends = resultHistory.get_solution_trends(runCount, writerNames,
+                languageNames, problemNumbers)
+        slowestCases = resultHistory.get_slowest_cases(slowestCount,
+                writerNames, languageNames, problemNumbers)
+    finally:
+        resultHistory.close()
+
+    if len(trends) == 0:
+        print('No test runs have been recorded')
+        return
+
+    _print_solution_trends(trends)
+    if len(slowestCases) > 0:
+        print()
+        _print_slowest_cases(slowestCases)
+
+def _print_solution_trends(trends: list):
+    """
+    Prints the timings of every solution in each of its recent runs, with
+    the change in total CPU time since the solution's previous run
+
+    Arguments:
+    trends: list - The rows given by ResultHistory.get_solution_trends
+    """
+    formattingStr = ("{0: <10}\t{1: <8}\t{2: <10}\t{3: <6}\t{4: <16}\t"
+            "{5: <8}\t{6: <6}\t{7: <6}\t{8: <10}\t{9: <10}\t{10}")
+    print(formattingStr.format("Writer", "Problem", "Language", "Run", "Date",
+        "Hash", "Cases", "Failed", "CPU(s)", "MaxCPU(s)", "Change"))
+
+    previousSolution = None
+    previousCpuTime = None
+    for writer, problem, language, runId, startedAt, solutionHash, \
+            executionCount, failureCount, cpuTime, maxCpuTime, _ in trends:
+        if not (writer, problem, language) == previousSolution:
+            previousCpuTime = None
+        print(formattingStr.format(writer, problem, language, runId,
+            time.strftime('%Y-%m-%d %H:%M', time.localtime(startedAt)),
+            solutionHash[:HASH_LENGTH], executionCount, failureCount,
+            '-' if cpuTime is None else '{:.3f}'.format(cpuTime),
+            '-' if maxCpuTime is None else '{:.3f}'.format(maxCpuTime),
+            _format_change(cpuTime, previousCpuTime)))
+        previousSolution = (writer, problem, language)
+        previousCpuTime = cpuTime
+
+def _print_slowest_cases(slowestCases: list):
+    """
+    Prints the slowest cases of each problem
+
+    Arguments:
+    slowestCases: list - The rows given by ResultHistory.get_slowest_cases
+    """
+    formattingStr = ("{0: <8}\t{1: <10}\t{2: <6}\t{3: <10}\t{4: <10}\t"
+            "{5: <10}\t{6}")
+    print(formattingStr.format("Problem", "CaseType", "Case", "Executions",
+        "AvgCPU(s)", "MaxCPU(s)", "AvgWall(s)"))
+    for problem, caseType, caseNumber, executionCount, averageCpuTime, \
+            maxCpuTime, averageWallTime in slowestCases:
+        print(formattingStr.format(problem, caseType, caseNumber,
+            executionCount, '{:.3f}'.format(averageCpuTime),
+            '{:.3f}'.format(maxCpuTime), '{:.3f}'.format(averageWallTime)))
@@ -0,0 +1,230 @@
+################################################################################
+# Filename: util/subparsers/matrix.py
+# Date:     16 October 2026
+#
+# Contains logic for the subparser that is invoked when calling
+# $ ./runner.py matrix
+################################################################################
+from util import case as CaseManager
+from util.history import ResultHistory
+from util.language import ExecutionError
+from util.subparsers.test import _get_filtered_solutions, \
+        _get_unique_problem_numbers_from_list
+from util.subparsers.bench import _bench_solution_against_case, ERROR_KEY, \
+        CPU_TIME_KEY
+from util.stats import DEFAULT_CONFIDENCE
+from util.perror import PyCException
+import statistics
+
+SUBPARSER_KEYWORD = "matrix"
+
+DEFAULT_CASE_COUNT = 3
+DEFAULT_RUN_COUNT = 5
+WARMUP_COUNT = 1
+
+def operate(args):
+    """
+    Takes the passed in args and delegates to the proper functionality. This is
+    set as the executable function when the `matrix` subparser is used
+
+    Arguments:
+    args: Namespace - The arguments passed via CLI
+    """
+    if args.cases < 1:
+        raise PyCException('Error: --cases must be at least 1')
+    if args.runs < 1:
+        raise PyCException('Error: --runs must be at least 1')
+
+    matrix(args.writers, args.language, args.problems, args.cases, args.runs,
+            recorded=args.recorded, verbose=args.verbose)
+
+def add_to_subparser_object(subparserObject, parentParser):
+    """
+    Adds the matrix subparser to a given subparsers object and delegates
+    matrix functionality to the operate() function
+
+    Arguments:
+    subparserObject - The ArgumentParser given by parser.add_subparsers() to add
+                      the matrix subparser to
+    parentParser    - The parser to be included as a parent to the subparser,
+                      useful for global flags
+    """
+    matrixParser = subparserObject.add_parser(SUBPARSER_KEYWORD,
+            parents=[parentParser])
+    matrixParser.add_argument('writers', nargs='*')
+    matrixParser.add_argument('--cases', type=int, default=DEFAULT_CASE_COUNT,
+            help='The number of heaviest cases of each problem to time')
+    matrixParser.add_argument('--runs', type=int, default=DEFAULT_RUN_COUNT,
+            help='The number of measured runs of every solution/case pair')
+    matrixParser.add_argument('--recorded', action='store_true',
+            help='Use the timings of the last recorded test runs instead of '
+                 'running the solutions')
+    matrixParser.set_defaults(func=operate)
+
+def _get_heaviest_cases(cases: list, caseCount: int) -> list:
+    """
+    Returns the caseCount cases with the largest inputs, largest first
+    """
+    return sorted(cases, key=lambda case: case.get_input_size(),
+            reverse=True)[:caseCount]
+
+def _measure_solution(solution, cases: list, runCount: int,
+        verbose: bool=False) -> float:
+    """
+    Compiles a solution and runs it against cases, returning the sum of its
+    median CPU time on each, or None if it did not run all of them correctly
+
+    Arguments:
+    solution      - The solution to measure
+    cases: list   - The cases to run the solution against
+    runCount: int - The number of measured runs against every case
+    verbose: bool - Whether to show the output of compilers and solutions
+    """
+    try:
+        solution.compile(verbose=verbose)
+    except ExecutionError:
+        return None
+
+    cpuTime = 0
+    for case in cases:
+        record = _bench_solution_against_case(solution, case, runCount,
+                WARMUP_COUNT, DEFAULT_CONFIDENCE, verbose)
+        if ERROR_KEY in record:
+            return None
+        cpuTime += record[CPU_TIME_KEY]['median']
+    return cpuTime
+
+def _get_recorded_time(samples: dict, solution, cases: list) -> float:
+    """
+    Returns the sum of the recorded median CPU time of a solution on each of
+    cases, or None if it has no correct recorded execution of one of them
+
+    Arguments:
+    samples: dict - The samples given by ResultHistory.get_latest_cpu_samples
+    solution      - The solution to get the time of
+    cases: list   - The cases to sum the times on
+    """
+    cpuTime = 0
+    for case in cases:
+        caseSamples = samples.get(ResultHistory.get_sample_key(solution,
+            case))
+        if caseSamples is None:
+            return None
+        cpuTime += statistics.median(caseSamples)
+    return cpuTime
+
+def _get_language_medians(solutionTimes: dict) -> dict:
+    """
+    Finds the median time of the solutions in each language of a problem
+
+    Arguments:
+    solutionTimes: dict - {(writer, language) : time}, where solutions with
+                          no time have None
+
+    Return:
+    {language : median time}, holding only the languages with timed solutions
+    """
+    languageTimes = {}
+    for (_, language), time in solutionTimes.items():
+        if not time is None:
+            languageTimes.setdefault(language, []).append(time)
+    return {language : statistics.median(times) for language, times in
+            languageTimes.items()}
+
+def matrix(writerNames: list, languageNames: list, problemStrings: list,
+        caseCount: int=DEFAULT_CASE_COUNT, runCount: int=DEFAULT_RUN_COUNT,
+        recorded: bool=False, verbose: bool=False) -> dict:
+    """
+    Times every solution given by the same filters as test on the heaviest
+    cases of its problem and prints, for each problem, a matrix of the CPU
+    time of every writer's solution in every language. Times are shown with
+    their ratio to the median time of the fastest language, so that both
+    languages and outlying solutions within a language stand out
+
+    Arguments:
+    writerNames: list    - The list of writer names to time solutions for
+    languageNames: list  - The list of language names to time solutions for
+    problemStrings: list - The list of problem strings to time solutions for
+    caseCount: int       - The number of heaviest cases of each problem to
+                           time solutions on
+    runCount: int        - The number of measured runs of every pair
+    recorded: bool       - Whether to use the timings of the last recorded
+                           test run of each solution instead of running it
+    verbose: bool        - Whether to show the output of compilers and
+                           solutions
+
+    Return:
+    {problem number : {(writer, language) : CPU time}}
+    """
+    solutions = _get_filtered_solutions(writerNames, languageNames,
+            problemStrings)
+    cases = CaseManager.get_all_cases()
+
+    samples = None
+    if recorded:
+        resultHistory = ResultHistory.open()
+        try:
+            samples = resultHistory.get_latest_cpu_samples(writerNames,
+                    languageNames, None if problemStrings is None else
+                    _get_unique_problem_numbers_from_list(problemStrings))
+        finally:
+            resultHistory.close()
+
+    problemTimes = {}
+    for solution in solutions:
+        problemNumber = int(solution.problemNumber)
+        heaviestCases = _get_heaviest_cases(cases.get(problemNumber, []),
+                caseCount)
+        if len(heaviestCases) == 0:
+            continue
+
+        if recorded:
+            cpuTime = _get_recorded_time(samples, solution, heaviestCases)
+        else:
+            cpuTime = _measure_solution(solution, heaviestCases, runCount,
+                    verbose)
+        problemTimes.setdefault(problemNumber, {})[(solution.solutionWriter,
+            solution.solutionLanguage.name)] = cpuTime
+
+    if len(problemTimes) == 0:
+        print('No solutions with cases were found')
+    for problemNumber in sorted(problemTimes):
+        _print_problem_matrix(problemNumber, problemTimes[problemNumber])
+    return problemTimes
+
+def _format_time(time: float, fastestTime: float) -> str:
+    """
+    Formats a time with its ratio to fastestTime, or '-' for no time
+    """
+    if time is None:
+        return '-'
+    if fastestTime == 0:
+        return '{:.3f}'.format(time)
+    return '{:.3f} x{:.2f}'.format(time, time / fastestTime)
+
+def _print_problem_matrix(problemNumber: int, solutionTimes: dict):
+    """
+    Prints the matrix of the CPU times of a problem's solutions, with a row
+    for every writer and a column for every language, followed by the median
+    time of each language
+
+    Arguments:
+    problemNumber: int  - The number of the problem
+    solutionTimes: dict - {(writer, language) : time}
+    """
+    languageMedians = _get_language_medians(solutionTimes)
+    fastestTime = min(languageMedians.values()) if len(languageMedians) > 0 \
+            else 0
+    languages = sorted(set(language for _, language in solutionTimes))
+    writers = sorted(set(writer for writer, _ in solutionTimes))
+
+    formattingStr = '\t'.join(['{: <10}'] + ['{: <16}'] * len(languages))
+    print('Problem {} CPU(s)'.format(problemNumber))
+    print(formattingStr.format('Writer', *languages))
+    for writer in writers:
+        print(formattingStr.format(writer, *[_format_time(solutionTimes.get(
+            (writer, language)), fastestTime) if (writer, language) in
+            solutionTimes else '' for language in languages]))
+    print(formattingStr.format('Median', *[_format_time(languageMedians.get(
+        language), fastestTime) for language in languages]))
+    print()
@@ -10,10 +10,14 @@ from util.pathmapper import PathMapper
 from util import fileops, case
 from util.fileops import FileType
 from util.definitions import Definitions
+from util.language import Languages
+from util.limits import Limits
+from util.process import InputFile
 
 SUBPARSER_KEYWORD = "package"
 COMPRESSION_KEYWORD = 'compression'
 CONFIGURATION_FILE = "packages.json"
+LIMITS_FILE = "limits.json"
 
 TYPES_KEY = 'types'
 config = {}
@@ -101,7 +105,10 @@ def package_case(caseName: str, caseDir: str, cases: list, namingScheme:str, inc
         inputFilePath = fileops.join_path(inputPath, namingScheme.format(**inputNamingDict))
         outputFilePath = fileops.join_path(outputPath, namingScheme.format(**outputNamingDict))
 
-        fileops.write_file(inputFilePath, case.inputContents)
+        if isinstance(case.inputContents, InputFile):
+            fileops.copy_file(case.inputContents.path, inputFilePath)
+        else:
+            fileops.write_file(inputFilePath, case.inputContents)
         fileops.write_file(outputFilePath, case.outputContents)
         incrementor += 1
 
@@ -162,6 +169,21 @@ def _get_compression_from_layout_dict(layoutDict: dict):
     else:
         return None
 
+def package_limits(problemPath: str, problemNumber):
+    """
+    Writes the limits of every language for the problem into the problem's
+    package directory, so that judges use the same limits as the runner
+
+    Arguments:
+    problemPath: str - The package directory of the problem
+    problemNumber    - The number of the problem to write the limits of
+    """
+    limitsDict = {languageName : Limits.get_limits(problemNumber,
+        Languages.get_language_by_name(languageName)).to_dict() for
+        languageName in Languages.get_all_language_names()}
+    fileops.write_json_dict(fileops.join_path(problemPath, LIMITS_FILE),
+            limitsDict)
+
 def package_into_path(path: str, layoutDict: dict):
     """
     Follows the users provided configuration file to package all cases into
@@ -178,6 +200,7 @@ def package_into_path(path: str, layoutDict: dict):
                 **dict(problem=problemNumber))
         problemPath = fileops.join_path(path, problemDirName)
         fileops.make(problemPath, FileType.DIRECTORY)
+        package_limits(problemPath, problemNumber)
 
         # Go through each type in the config file and package it
         for packageTypeName, packageType in layoutDict[TYPES_KEY].items():
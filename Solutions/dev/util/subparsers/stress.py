@@ -0,0 +1,235 @@
+################################################################################
+# Filename: util/subparsers/stress.py
+# Date:     16 October 2026
+#
+# Contains logic for the subparser that is invoked when calling
+# $ ./runner.py stress
+################################################################################
+from util import fileops
+from util.case import Case, get_case_file_path, _parse_input_json
+from util.comparator import Comparators
+from util.generator import Generator
+from util.language import ExecutionError
+from util.scheduler import run_jobs
+from util.subparsers.test import _get_filtered_solutions
+from util.perror import PyCException
+import random
+import time
+
+SUBPARSER_KEYWORD = "stress"
+
+DEFAULT_ITERATION_COUNT = 100
+DEFAULT_CASE_TYPE = 'stress'
+SEED_BITS = 32
+
+# Disagreeing outputs are shown up to this many characters
+OUTPUT_PREVIEW_LENGTH = 60
+
+def operate(args):
+    """
+    Takes the passed in args and delegates to the proper functionality. This is
+    set as the executable function when the `stress` subparser is used
+
+    Arguments:
+    args: Namespace - The arguments passed via CLI
+    """
+    if args.iterations < 1:
+        raise PyCException('Error: --iterations must be at least 1')
+    if not args.time_budget is None and args.time_budget <= 0:
+        raise PyCException('Error: --time-budget must be positive')
+    if not args.jobs is None and args.jobs < 1:
+        raise PyCException('Error: --jobs must be at least 1')
+
+    disagreementCount = stress(args.problem, args.generator, args.writers,
+            args.language, seed=args.seed, iterationCount=args.iterations,
+            timeBudget=args.time_budget, jobCount=args.jobs,
+            caseTypeName=args.case_type, verbose=args.verbose)
+    return 1 if disagreementCount > 0 else 0
+
+def add_to_subparser_object(subparserObject, parentParser):
+    """
+    Adds the stress subparser to a given subparsers object and delegates
+    stress functionality to the operate() function
+
+    Arguments:
+    subparserObject - The ArgumentParser given by parser.add_subparsers() to add
+                      the stress subparser to
+    parentParser    - The parser to be included as a parent to the subparser,
+                      useful for global flags
+    """
+    stressParser = subparserObject.add_parser(SUBPARSER_KEYWORD,
+            parents=[parentParser])
+    stressParser.add_argument('problem', type=int,
+            help='The problem whose solutions are compared')
+    stressParser.add_argument('generator',
+            help='The program that prints a case input given a seed, as '
+                 'for the generate command')
+    stressParser.add_argument('writers', nargs='*')
+    stressParser.add_argument('--seed', type=int,
+            help='The seed of the first input, random if not given')
+    stressParser.add_argument('--iterations', type=int,
+            default=DEFAULT_ITERATION_COUNT,
+            help='The number of inputs to generate')
+    stressParser.add_argument('--time-budget', type=float, metavar='SECONDS',
+            help='Stop generating inputs after this many seconds')
+    stressParser.add_argument('--jobs', type=int,
+            help='The number of solutions to run at once, all by default')
+    stressParser.add_argument('--case-type', default=DEFAULT_CASE_TYPE,
+            help='The case type of the file disagreeing inputs are saved to')
+    stressParser.set_defaults(func=operate)
+
+class Outcome:
+    """
+    What a solution did with an input: either the output it printed or the
+    error it failed with
+    """
+
+    def __init__(self, output: str=None, error: str=None):
+        self.output = output
+        self.error = error
+
+    def matches(self, other, problemNumber: int) -> bool:
+        if not self.error is None or not other.error is None:
+            return self.error == other.error
+        return Comparators.outputs_match(problemNumber, self.output,
+                other.output)
+
+    def __str__(self):
+        if not self.error is None:
+            return self.error
+        preview = self.output.replace('\n', '\\n')
+        if len(preview) > OUTPUT_PREVIEW_LENGTH:
+            preview = preview[:OUTPUT_PREVIEW_LENGTH] + '...'
+        return preview
+
+def _run_solution(solution, inputContents: str, verbose: bool=False):
+    """
+    Runs an already compiled solution on an input
+
+    :return: The Outcome of the run
+    """
+    try:
+        return Outcome(output=solution.run(inputContents,
+            outputToStderr=verbose).output)
+    except ExecutionError as e:
+        return Outcome(error=e.message)
+
+def _group_outcomes(outcomes: list, problemNumber: int) -> list:
+    """
+    Groups the indices of outcomes that match each other, comparing every
+    outcome with the first of each group found so far
+
+    :return: [[index]], with groups in the order of their first outcome
+    """
+    groups = []
+    for index, outcome in enumerate(outcomes):
+        for group in groups:
+            if outcomes[group[0]].matches(outcome, problemNumber):
+                group.append(index)
+                break
+        else:
+            groups.append([index])
+    return groups
+
+def _save_case(path: str, inputJson) -> int:
+    """
+    Adds an input, without an output, as the next case of the case file at
+    path, creating the file if it does not exist
+
+    :return: The number of the new case
+    """
+    caseFile = fileops.get_json_dict(path) if fileops.exists(path,
+            fileops.FileType.FILE) else {Case.CASES_JSON_KEY : {}}
+    cases = caseFile[Case.CASES_JSON_KEY]
+    caseNumber = max([int(number) for number in cases] + [0]) + 1
+    cases[str(caseNumber)] = {Case.CASES_INPUT_KEY : inputJson}
+    fileops.write_json_dict(path, caseFile)
+    return caseNumber
+
+def stress(problemNumber: int, generatorPath: str, writerNames: list,
+        languageNames: list, seed: int=None,
+        iterationCount: int=DEFAULT_ITERATION_COUNT, timeBudget: float=None,
+        jobCount: int=None, caseTypeName: str=DEFAULT_CASE_TYPE,
+        verbose: bool=False) -> int:
+    """
+    Runs every solution of a problem, given by the same filters as test, on
+    inputs made by a generator and saves each input on which the solutions
+    do not all agree as a new case. The n-th input is generated with seed + n,
+    so a run can be reproduced from its seed
+
+    Arguments:
+    problemNumber: int  - The problem whose solutions are compared
+    generatorPath: str  - The path of the generator program
+    writerNames: list   - The list of writer names to compare solutions of
+    languageNames: list - The list of language names to compare solutions of
+    seed: int           - The seed of the first input, or None for a random
+                          seed
+    iterationCount: int - The most inputs to generate
+    timeBudget: float   - The seconds after which no more inputs are
+                          generated, or None
+    jobCount: int       - The number of solutions to run at once, or None to
+                          run all of them at once
+    caseTypeName: str   - The case type of the case file inputs are saved to
+    verbose: bool       - Whether to show the output of compilers and
+                          solutions
+
+    Return:
+    The number of inputs the solutions disagreed on
+    """
+    solutions = _get_filtered_solutions(writerNames, languageNames,
+            [str(problemNumber)])
+    generator = Generator(generatorPath)
+    generator.compile(verbose=verbose)
+
+    compiledSolutions = []
+    for solution in solutions:
+        try:
+            solution.compile(verbose=verbose)
+            compiledSolutions.append(solution)
+        except ExecutionError:
+            print('{} {}: Compile Error'.format(solution.solutionWriter,
+                solution.solutionLanguage.name))
+    if len(compiledSolutions) < 2:
+        raise PyCException('Error: Problem {} needs at least two solutions to '
+                'compare'.format(problemNumber))
+
+    if seed is None:
+        seed = random.getrandbits(SEED_BITS)
+    print('Comparing {} solutions with seed {}'.format(len(compiledSolutions),
+        seed))
+
+    caseFilePath = get_case_file_path(problemNumber, caseTypeName)
+    startTime = time.monotonic()
+    disagreementCount = 0
+    iteration = 0
+    while iteration < iterationCount and (timeBudget is None or
+            time.monotonic() - startTime < timeBudget):
+        iterationSeed = seed + iteration
+        iteration += 1
+        inputJson = generator.generate(iterationSeed, verbose=verbose)
+        inputContents = _parse_input_json(inputJson)
+
+        outcomes = [None] * len(compiledSolutions)
+        def set_outcome(index, outcome):
+            outcomes[index] = outcome
+        run_jobs(compiledSolutions, lambda solution: _run_solution(solution,
+            inputContents, verbose), jobCount or len(compiledSolutions),
+            set_outcome)
+
+        groups = _group_outcomes(outcomes, problemNumber)
+        if len(groups) == 1:
+            continue
+
+        disagreementCount += 1
+        caseNumber = _save_case(caseFilePath, inputJson)
+        print('Seed {}: Solutions disagree, saved as {} case {}'.format(
+            iterationSeed, caseTypeName, caseNumber))
+        for group in groups:
+            print('\t{}: {}'.format(', '.join('{} {}'.format(
+                compiledSolutions[index].solutionWriter,
+                compiledSolutions[index].solutionLanguage.name) for index in
+                group), outcomes[group[0]]))
+
+    print('{} of {} inputs were disagreed on in {:.1f}s'.format(
+        disagreementCount, iteration, time.monotonic() - startTime))
+    return disagreementCount
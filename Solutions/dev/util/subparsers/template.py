@@ -21,6 +21,7 @@ from util.fileops import join_path, get_json_dict, write_file, make, FileType
 from util.case import get_all_cases
 from util.definitions import Definitions
 from util.language import Languages
+from util.process import InputFile
 from util.templating.jsonstubber.java_stubber import JavaJSONStubber
 from util.templating.jsonstubber.cpp_stubber import CppJSONStubber
 from util.templating.jsonstubber.python_stubber import PythonJSONStubber
@@ -96,9 +97,11 @@ def generate_template_for_case_collection(cases: list, language: list,
                         problem))
 
     # A list of input groups such that input_groups[0] is a list of all the
-    # first inputs
+    # first inputs. The raw inputs of sidecar files say nothing of their types
     input_groups = []
     for case in cases:
+        if isinstance(case.inputContents, InputFile):
+            continue
         for i, input in enumerate(json.loads(case.inputContents)):
             if len(input_groups) <= i:
                 input_groups.append([])
@@ -8,15 +8,49 @@
 ################################################################################
 from util.writer import Writer, Writers
 from util import case as CaseManager
-from util.language import ExecutionError
+from util.language import ExecutionError, ExecutionEngine
+from util.compilecache import CompileCache
+from util.resultstore import ResultStore
+from util.durationstore import DurationStore
+from util.resultsink import ResultSinks
+from util.history import ResultHistory
+from util.harness.harnesses import Harnesses
 from util.case import KnownCase
-import difflib
+from util.comparator import Comparators
+from util.diff import DiffMode, get_diff
+from util.process import IOMode, kill_running_processes
+from util.zygote import Zygotes
+from util.result import CaseResult, Status, TimingSummary
+from util.scheduler import run_jobs, run_jobs_async, OrderedEmitter, \
+        get_longest_first_order, get_makespan, get_makespan_lower_bound
+from util.stats import mann_whitney_p_value
+from util.perror import PyCException
+import asyncio
+import statistics
+import time
 
 SUBPARSER_KEYWORD = "test"
 SHOW_PASSING_KEYWORD = "showpass"
 
 headerPrinted = False
 
+RESULT_FORMATTING_STR = ("{0: <10}\t{1: <10}\t{2: <10}\t{3: <10}\t{4: <10}\t"
+        "{5: <10}\t{6: <8}\t{7: <8}\t{8: <8}\t{9}")
+BYTES_PER_MEGABYTE = 1024 * 1024
+
+RUN_STOPPED_MESSAGE = 'Not Run (Run Stopped)'
+SOLUTION_FAILED_MESSAGE = 'Not Run (Solution Failed)'
+
+# Cases are run this many times when compared with a baseline, unless told
+# otherwise
+DEFAULT_COMPARISON_REPEAT_COUNT = 5
+# Slowdowns smaller than this fraction of the baseline, or than
+# MINIMUM_REGRESSION_SECONDS, are taken to be noise
+DEFAULT_NOISE_THRESHOLD = 0.1
+MINIMUM_REGRESSION_SECONDS = 0.01
+SIGNIFICANCE_LEVEL = 0.05
+REGRESSION_EXIT_CODE = 1
+
 def operate(args):
     """
     Takes the passed in args and delegates to the proper functionality. This is
@@ -26,8 +60,36 @@ def operate(args):
     args: Namespace - The arguments pased via CLI
     """
     writerList = args.writers
-    test(writerList, args.language, args.problems, args.verbose, args.showpass,
-            args.diff)
+    if args.jobs < 1:
+        raise PyCException('Error: --jobs must be at least 1')
+    if not args.repeat is None and args.repeat < 1:
+        raise PyCException('Error: --repeat must be at least 1')
+    if args.harness and args.io_mode == IOMode.FILE:
+        raise PyCException('Error: Harnesses read their input from a pipe, '
+                'so --harness cannot be used with --io-mode file')
+    repeatCount = args.repeat
+    if repeatCount is None:
+        repeatCount = (1 if args.compare_baseline is None else
+                       DEFAULT_COMPARISON_REPEAT_COUNT)
+    CompileCache.set_enabled(not args.no_compile_cache)
+    IOMode.set_mode(args.io_mode)
+    Zygotes.set_enabled(args.zygote)
+    jsonLinesPath = args.jsonl
+    if args.file and jsonLinesPath is None:
+        jsonLinesPath = ResultSinks.get_default_path()
+    regressionCount = test(writerList, args.language, args.problems,
+            args.verbose, args.showpass,
+            args.diff_mode if args.diff else None, jobCount=args.jobs,
+            engine=args.engine,
+            incremental=args.incremental, useHarness=args.harness,
+            printSummary=args.summary, failFast=args.fail_fast,
+            stopSolutionOnFail=args.stop_solution_on_fail,
+            jsonLinesPath=jsonLinesPath, junitPath=args.junit,
+            recordHistory=not args.no_history, repeatCount=repeatCount,
+            baselineRunId=args.compare_baseline,
+            noiseThreshold=args.noise_threshold)
+    if regressionCount > 0:
+        return REGRESSION_EXIT_CODE
 
 def add_to_subparser_object(subparserObject, parentParser):
     """
@@ -43,7 +105,52 @@ def add_to_subparser_object(subparserObject, parentParser):
     testParser = subparserObject.add_parser(SUBPARSER_KEYWORD, parents=[parentParser])
     testParser.add_argument('writers', nargs='*')
     testParser.add_argument('--showpass', action='store_true')
-    testParser.add_argument('--diff', action='store_true')
+    testParser.add_argument('--diff', action='store_true',
+            help='Print a diff of failing output')
+    testParser.add_argument('--diff-mode', choices=DiffMode.ALL,
+            default=DiffMode.FULL,
+            help='Whether --diff prints every difference or only the first')
+    testParser.add_argument('--jobs', type=int, default=1,
+            help='The number of solution/case pairs to run at once')
+    testParser.add_argument('--engine', choices=ExecutionEngine.ALL,
+            default=ExecutionEngine.BLOCKING,
+            help='Run solutions with blocking subprocesses or asyncio')
+    testParser.add_argument('--io-mode', choices=IOMode.ALL,
+            default=IOMode.PIPE,
+            help='Pipe input and output through the runner, or pass them as '
+            'in-memory files')
+    testParser.add_argument('--no-compile-cache', action='store_true',
+            help='Always recompile solutions instead of reusing artifacts')
+    testParser.add_argument('--incremental', action='store_true',
+            help='Only run solution/case pairs that changed or did not pass')
+    testParser.add_argument('--harness', action='store_true',
+            help='Run templated solutions in a long-lived language harness')
+    testParser.add_argument('--zygote', action='store_true',
+            help='Start cases from a preloaded zygote process instead of '
+            'the runner')
+    testParser.add_argument('--summary', action='store_true',
+            help='Print the min/median/max time and memory of each problem')
+    testParser.add_argument('--fail-fast', action='store_true',
+            help='Stop the whole run at the first failure')
+    testParser.add_argument('--stop-solution-on-fail', action='store_true',
+            help='Skip the remaining cases of a solution once it fails one')
+    testParser.add_argument('--jsonl', metavar='PATH',
+            help='Stream the result of every case to a JSON Lines file. '
+            'The global --file flag streams them to the results file')
+    testParser.add_argument('--junit', metavar='PATH',
+            help='Stream the result of every case to a JUnit XML file')
+    testParser.add_argument('--no-history', action='store_true',
+            help='Do not record the run in the history database')
+    testParser.add_argument('--repeat', type=int,
+            help='The number of times to run each passing case, keeping the '
+            'median time')
+    testParser.add_argument('--compare-baseline', type=int, metavar='RUN',
+            help='Mark cases significantly slower than in the given run of '
+            '`history` as regressions')
+    testParser.add_argument('--noise-threshold', type=float,
+            default=DEFAULT_NOISE_THRESHOLD,
+            help='The fraction of the baseline time by which a case must be '
+            'slower to be a regression')
     testParser.set_defaults(func=operate)
 
 def _get_loaded_writers(writerNames: list = None) -> list:
@@ -126,76 +233,593 @@ def _get_filtered_solutions(writerNames: list, languageNames: list,
 
     return solutionsToTest
 
-def _test_solution_against_cases(solution, cases:list, outputToStderr: bool,
-        printPassingCases: bool, printDiff: bool):
+class TestOptions:
     """
-    Tests a single solution against a list of cases and outputs results
-    to stdout. 
+    The options shared by every solution/case pair of a single test run
+    """
+
+    def __init__(self, outputToStderr: bool=False, 
+            printPassingCases: bool=False, diffMode: str=None,
+            useHarness: bool=False, timingSummary=None,
+            failFast: bool=False, stopSolutionOnFail: bool=False,
+            resultSinks: list=None, repeatCount: int=1,
+            baselineSamples: dict=None,
+            noiseThreshold: float=DEFAULT_NOISE_THRESHOLD):
+        self.outputToStderr = outputToStderr
+        self.printPassingCases = printPassingCases
+        # The DiffMode of the diffs of failing cases, or None for no diffs
+        self.diffMode = diffMode
+        self.useHarness = useHarness
+        # The TimingSummary every result is added to, or None
+        self.timingSummary = timingSummary
+        # Whether the first failure stops the run, or only its solution
+        self.failFast = failFast
+        self.stopSolutionOnFail = stopSolutionOnFail
+        # The ResultSinks, and the ResultHistory, every result is streamed to
+        # as it completes
+        self.resultSinks = [] if resultSinks is None else resultSinks
+        # The number of times each passing case is run
+        self.repeatCount = repeatCount
+        # The CPU times of the baseline run, keyed like those given by
+        # ResultHistory.get_run_cpu_samples, or None for no baseline
+        self.baselineSamples = baselineSamples
+        self.noiseThreshold = noiseThreshold
+        self.regressionCount = 0
+
+    def get_skip_message(self, result):
+        """
+        Returns the message of the cases skipped because of the result, or
+        None if the result does not stop any cases from being run
+        """
+        if result is None or not result.failed():
+            return None
+        if self.failFast:
+            return RUN_STOPPED_MESSAGE
+        if self.stopSolutionOnFail:
+            return SOLUTION_FAILED_MESSAGE
+        return None
+
+def _compile_solution(solution, options):
+    """
+    Compiles a single solution, returning a failing result if compilation
+    failed and None otherwise
 
     Arguments:
-    solution    - The solution to test
-    cases: list - The list of cases to test the solution against
+    solution - The solution to compile
+    options  - The TestOptions of the run
     """
-    # First, print the header
-    # Writer    Problem   Language  CaseType    Case#   Status  Message
-    formattingStr = "{0: <10}\t{1: <10}\t{2: <10}\t{3: <10}\t{4: <10}\t{5: <10}\t{6}"
+    try:
+        solution.compile(verbose=options.outputToStderr)
+    except ExecutionError as e:
+        return CaseResult(solution, None, Status.FAIL, 'Compile Error')
 
-    # Compile first
+    return None
+
+def _test_solution_against_case(solution, case, options):
+    """
+    Runs a single, already compiled solution against a single case and returns
+    the result. None is returned for cases with no known output.
+
+    Arguments:
+    solution - The solution to test
+    case     - The case to test the solution against
+    options  - The TestOptions of the run
+    """
+    if (options.outputToStderr):
+        print("Testing problem {} case {}".format(solution.problemNumber,
+            case.caseNumber))
+
+    executionResults = []
     try:
-        solution.compile(verbose=outputToStderr)
+        result = None
+        while _needs_run(result, executionResults, options):
+            executionResults.append(solution.run(case.get_process_input(),
+                    outputToStderr=options.outputToStderr,
+                    useHarness=options.useHarness,
+                    comparator=_get_comparator(case)))
+            result = _get_case_result(solution, case, executionResults[-1])
     except ExecutionError as e:
-        _print_header_if_not_printed()
-        print(formattingStr.format(solution.solutionWriter, 
-            solution.problemNumber, solution.solutionLanguage.name, "COMPILE",
-            "COMPILE", 'FAIL', 'Compile Error'))
-        return
+        return _get_failed_result(solution, case, e)
+
+    return _set_diff(_compare_with_baseline(_set_samples(result,
+        executionResults), options), options)
+
+async def _test_solution_against_case_async(solution, case, options):
+    """
+    Runs a single, already compiled solution against a single case on the
+    running asyncio event loop and returns the result. None is returned for
+    cases with no known output.
+
+    Arguments:
+    solution - The solution to test
+    case     - The case to test the solution against
+    options  - The TestOptions of the run
+    """
+    if (options.outputToStderr):
+        print("Testing problem {} case {}".format(solution.problemNumber,
+            case.caseNumber))
+
+    executionResults = []
+    try:
+        result = None
+        while _needs_run(result, executionResults, options):
+            executionResults.append(await solution.run_async(
+                    case.get_process_input(),
+                    outputToStderr=options.outputToStderr,
+                    useHarness=options.useHarness,
+                    comparator=_get_comparator(case)))
+            result = _get_case_result(solution, case, executionResults[-1])
+    except ExecutionError as e:
+        return _get_failed_result(solution, case, e)
+
+    # Diffs may take a while, so they are found off the event loop
+    return await asyncio.get_running_loop().run_in_executor(None, _set_diff,
+            _compare_with_baseline(_set_samples(result, executionResults),
+                options), options)
+
+def _needs_run(result, executionResults: list, options) -> bool:
+    """
+    Returns whether a case should be run again. Cases are run once, and then
+    until they have been run options.repeatCount times while they pass
+
+    Arguments:
+    result                 - The CaseResult of the last run, or None
+    executionResults: list - The ExecutionResults of the runs so far
+    options                - The TestOptions of the run
+    """
+    if len(executionResults) == 0:
+        return True
+    return not result is None and result.passed() and \
+            len(executionResults) < options.repeatCount
+
+def _set_samples(result, executionResults: list):
+    """
+    Keeps the measurements of every run of a passing case that was run more
+    than once in its result, and returns the result
+    """
+    if not result is None and result.passed() and len(executionResults) > 1:
+        result.set_samples(executionResults)
+    return result
+
+def _compare_with_baseline(result, options):
+    """
+    Marks a passing result as a regression if its CPU time is slower than
+    that of the baseline run by more than the noise threshold, and the
+    slowdown is significant by a one-sided Mann-Whitney U test over the
+    repeated runs of both
 
+    Arguments:
+    result  - The CaseResult to compare, or None
+    options - The TestOptions of the run
+
+    Return:
+    The result
+    """
+    if options.baselineSamples is None or result is None or \
+            not result.passed() or result.cached:
+        return result
+
+    baselineSamples = options.baselineSamples.get(
+            ResultHistory.get_sample_key(result.solution, result.case))
+    samples = result.get_cpu_samples()
+    if baselineSamples is None or len(samples) == 0:
+        return result
+
+    baselineMedian = statistics.median(baselineSamples)
+    median = statistics.median(samples)
+    if median - baselineMedian <= max(options.noiseThreshold * baselineMedian,
+            MINIMUM_REGRESSION_SECONDS):
+        return result
+
+    pValue = mann_whitney_p_value(samples, baselineSamples)
+    if pValue < SIGNIFICANCE_LEVEL:
+        result.status = Status.REGRESSION
+        result.message = 'Regression: CPU {:.3f}s -> {:.3f}s (p={:.3g})'.format(
+                baselineMedian, median, pValue)
+    return result
+
+def _get_comparator(case):
+    """
+    Returns the comparator of the case's problem for the output of the case,
+    or None if the case has no known output
+    """
+    if not isinstance(case, KnownCase):
+        return None
+    return Comparators.get_comparator(case.problemNumber, case.outputContents)
+
+def _get_failed_result(solution, case, executionError):
+    """
+    Returns the result of a solution whose run against a case failed
+
+    Arguments:
+    solution       - The solution that was run
+    case           - The case the solution was run against
+    executionError - The ExecutionError raised by the run
+    """
+    status = (Status.FAIL if executionError.verdict is None else 
+              executionError.verdict)
+    return CaseResult(solution, case, status,
+            executionError.message).set_measurements(executionError.result)
+
+def _get_skipped_result(solution, case, message: str):
+    """
+    Returns the result of a case that was not run. None is returned for cases
+    with no known output, which are never reported.
+
+    Arguments:
+    solution     - The solution that was not run
+    case         - The case the solution was not run against
+    message: str - The reason the case was not run
+    """
+    if not isinstance(case, KnownCase):
+        return None
+    return CaseResult(solution, case, Status.SKIP, message)
+
+def _report_skipped_results(solution, cases: list, message: str, options):
+    """
+    Reports every case of a list as not run
+
+    Arguments:
+    solution     - The solution that was not run
+    cases: list  - The cases the solution was not run against
+    message: str - The reason the cases were not run
+    options      - The TestOptions of the run
+    """
     for case in cases:
-        if (outputToStderr):
-            print("Testing problem {} case {}".format(solution.problemNumber,
-                case.caseNumber))
-
-        solutionOutput = ""
-        try:
-            solutionOutput = solution.get_output(case.inputContents,
-                    outputToStderr=outputToStderr)
-
-        except ExecutionError as e:
-            _print_header_if_not_printed()
-            print(formattingStr.format(solution.solutionWriter,
-                solution.problemNumber, solution.solutionLanguage.name, 
-                case.get_case_string(), case.caseNumber, 'FAIL',
-                e.message))
-            continue
+        _report_result(_get_skipped_result(solution, case, message), options)
 
-        if not isinstance(case, KnownCase):
-            continue
+def _get_case_result(solution, case, executionResult):
+    """
+    Compares the output of a solution with the output of the case and returns
+    the result. None is returned for cases with no known output.
+
+    Arguments:
+    solution        - The solution that produced the output
+    case            - The case the solution was run against
+    executionResult - The ExecutionResult of running the solution
+    """
+    if not isinstance(case, KnownCase):
+        return None
+
+    solutionOutput = executionResult.output
+    if executionResult.matched is None:
+        matched = solutionOutput == case.outputContents
+    else:
+        matched = executionResult.matched
+
+    if matched:
+        result = CaseResult(solution, case, Status.PASS, 'Correct Solution',
+                output=solutionOutput)
+    else:
+        result = CaseResult(solution, case, Status.FAIL, 'Incorrect Solution',
+                output=solutionOutput,
+                expectedOutput=executionResult.expectedOutput)
 
-        resultsStr = "PASS" if solutionOutput == case.outputContents else "FAIL"
-        commentStr = "Correct Solution" if resultsStr == "PASS" else "Incorrect Solution"
-        if resultsStr == "PASS" and not printPassingCases:
-            if outputToStderr:
-                print(">Passed")
+    return result.set_measurements(executionResult)
+
+def _set_diff(result, options):
+    """
+    Diffs the output of a failing result with the output of its case, if the
+    run prints diffs, so that diffs are found by the worker that ran the case
+    rather than while printing results
+
+    Arguments:
+    result  - The CaseResult to diff, or None
+    options - The TestOptions of the run
+
+    Return:
+    The result
+    """
+    if options.diffMode is None or result is None or not result.failed() or \
+            result.output is None:
+        return result
+
+    result.diff = get_diff(result.output, result.get_expected_output(),
+            options.diffMode, fromfile="User Solution",
+            tofile="Correct Solution")
+    return result
+
+def _format_measurement(value, scale: float=1, precision: int=3) -> str:
+    """
+    Formats a measurement for the results table, or '-' if it was not taken
+
+    Arguments:
+    value           - The measurement, or None
+    scale: float    - The unit to express the measurement in
+    precision: int  - The number of decimal places to print
+    """
+    if value is None:
+        return '-'
+    return '{:.{}f}'.format(value / scale, precision)
+
+def _sink_result(result, options):
+    """
+    Streams a single result to every result sink of the run
+
+    Arguments:
+    result  - The CaseResult to stream. None results are ignored
+    options - The TestOptions of the run
+    """
+    if result is None:
+        return
+
+    for resultSink in options.resultSinks:
+        resultSink.add(result)
+
+def _report_result(result, options):
+    """
+    Streams a single result to the result sinks and prints it
+
+    Arguments:
+    result  - The CaseResult to report. None results are ignored
+    options - The TestOptions of the run
+    """
+    _sink_result(result, options)
+    _print_result(result, options)
+
+def _print_result(result, options):
+    """
+    Adds a single result to the timing summary, if there is one, counts it
+    if it is a regression and prints it as a row of the results table
+
+    Arguments:
+    result  - The CaseResult to print. None results are ignored
+    options - The TestOptions of the run
+    """
+    # Writer  Problem  Language  CaseType  Case#  Status  CPU  Wall  Mem  Message
+    formattingStr = RESULT_FORMATTING_STR
+
+    if result is None:
+        return
+
+    if not options.timingSummary is None:
+        options.timingSummary.add(result)
+    if result.regressed():
+        options.regressionCount += 1
+
+    solution = result.solution
+    if result.passed() and not options.printPassingCases:
+        if options.outputToStderr:
+            print(">Passed")
+        return
+
+    if options.outputToStderr and not result.output is None:
+        print("User Output: {}".format(result.output))
+        print("Correct Output: {}".format(result.get_expected_output()))
+
+    _print_header_if_not_printed()
+    print(formattingStr.format(solution.solutionWriter,
+        solution.problemNumber, solution.solutionLanguage.name,
+        result.get_case_string(), result.get_case_number(), result.status,
+        _format_measurement(result.cpuTime),
+        _format_measurement(result.wallTime),
+        _format_measurement(result.peakMemory, BYTES_PER_MEGABYTE, 1),
+        result.message))
+
+    if not result.diff is None:
+        for line in result.diff:
+            print(line)
+
+def _get_cached_results(solution, cases: list, resultStore) -> dict:
+    """
+    Gets the results of the cases that the solution passed in a previous run
+    and that have not changed since
+
+    Arguments:
+    solution    - The solution to get cached results for
+    cases: list - The list of cases the solution is being tested against
+    resultStore - The ResultStore holding previous results, or None
+
+    Return:
+    {case index : CaseResult}
+    """
+    if resultStore is None:
+        return {}
+
+    cachedResults = {}
+    for caseIndex, case in enumerate(cases):
+        cachedResult = resultStore.get_cached_result(solution, case)
+        if not cachedResult is None:
+            cachedResults[caseIndex] = cachedResult
+
+    return cachedResults
+
+def _test_solution_against_cases(solution, cases:list, options,
+        resultStore=None, durationStore=None) -> bool:
+    """
+    Tests a single solution against a list of cases and outputs results
+    to stdout. 
+
+    Arguments:
+    solution      - The solution to test
+    cases: list   - The list of cases to test the solution against
+    options       - The TestOptions of the run
+    resultStore   - The ResultStore to reuse and record results in, or None
+    durationStore - The DurationStore to record durations in, or None
+
+    Return:
+    Whether a failure stopped the whole run
+    """
+    cachedResults = _get_cached_results(solution, cases, resultStore)
+
+    # Compile first, unless every case can be reused
+    if len(cachedResults) < len(cases):
+        compileResult = _compile_solution(solution, options)
+        if not compileResult is None:
+            _report_result(compileResult, options)
+            return options.failFast
+
+    for caseIndex, case in enumerate(cases):
+        if caseIndex in cachedResults:
+            result = cachedResults[caseIndex]
+        else:
+            result = _test_solution_against_case(solution, case, options)
+            if not resultStore is None:
+                resultStore.record_result(result)
+            if not durationStore is None:
+                durationStore.record_result(result)
+
+        _report_result(result, options)
+
+        skipMessage = options.get_skip_message(result)
+        if not skipMessage is None:
+            _report_skipped_results(solution, cases[caseIndex + 1:],
+                    skipMessage, options)
+            return skipMessage == RUN_STOPPED_MESSAGE
+
+    return False
+
+def _test_solutions_in_parallel(solutions: list, cases: dict, jobCount: int,
+        engine: str, options, resultStore=None, durationStore=None):
+    """
+    Tests every solution against its cases using a pool of jobCount workers.
+    Results are printed as soon as they, and every result before them, are
+    available, so the output matches the order of a sequential run.
+
+    Given a DurationStore, the pairs predicted to take longest are run first
+    and the predicted and actual time taken to run every pair is printed.
+
+    Arguments:
+    solutions: list - The list of solutions to test
+    cases: dict     - The cases to test against, keyed by problem number
+    jobCount: int   - The number of solution/case pairs to run at once
+    engine: str     - The ExecutionEngine used to run the solutions
+    options         - The TestOptions of the run
+    resultStore     - The ResultStore to reuse and record results in, or None
+    durationStore   - The DurationStore to predict and record durations
+                      with, or None
+    """
+    solutionCases = [cases.get(int(solution.problemNumber), []) for 
+                     solution in solutions]
+    cachedResults = [_get_cached_results(solution, solutionCases[index],
+                     resultStore) for index, solution in enumerate(solutions)]
+
+    # Compile every solution that has cases to run before running any cases
+    compileResults = [None] * len(solutions)
+    compileIndices = [index for index in range(len(solutions)) if
+                      len(cachedResults[index]) < len(solutionCases[index])]
+    def store_compile_result(jobIndex, compileResult):
+        compileResults[compileIndices[jobIndex]] = compileResult
+        return options.failFast and not compileResult is None
+    stopped = run_jobs([solutions[index] for index in compileIndices], 
+            lambda solution: _compile_solution(solution, options),
+            jobCount, store_compile_result)
+
+    # Results are streamed to the sinks as soon as they complete, but only
+    # printed once every result before them has been
+    emitter = OrderedEmitter(lambda result: _print_result(result, options))
+    def add_result(position, result):
+        _sink_result(result, options)
+        emitter.add(position, result)
+
+    # Each job is a (solution index, case) pair that is printed at position
+    # jobPositions[jobIndex]. Compile failures occupy a single position
+    jobs = []
+    jobPositions = []
+    position = 0
+    for solutionIndex, solution in enumerate(solutions):
+        if not compileResults[solutionIndex] is None:
+            add_result(position, compileResults[solutionIndex])
+            position += 1
             continue
-        if outputToStderr:
-            print("User Output: {}".format(solutionOutput))
-            print("Correct Output: {}".format(case.outputContents))
-
-        _print_header_if_not_printed()
-        print(formattingStr.format(solution.solutionWriter,
-            solution.problemNumber, solution.solutionLanguage.name,
-            case.get_case_string(), case.caseNumber, resultsStr, commentStr))
-        
-        if printDiff:
-            userLines = solutionOutput.splitlines()
-            solutionLines = case.outputContents.splitlines()
-            for line in difflib.unified_diff(userLines, solutionLines, 
-                    lineterm="", fromfile="User Solution", tofile="Correct Solution"):
-                print(line)
 
+        for caseIndex, case in enumerate(solutionCases[solutionIndex]):
+            if caseIndex in cachedResults[solutionIndex]:
+                add_result(position, cachedResults[solutionIndex][caseIndex])
+            else:
+                jobs.append((solutionIndex, case))
+                jobPositions.append(position)
+            position += 1
+
+    predictedDurations = None
+    if not durationStore is None and len(jobs) > 0:
+        predictedDurations = durationStore.predict_durations([(solutions[
+            solutionIndex], case) for solutionIndex, case in jobs])
+        jobOrder = get_longest_first_order(predictedDurations)
+        jobs = [jobs[jobIndex] for jobIndex in jobOrder]
+        jobPositions = [jobPositions[jobIndex] for jobIndex in jobOrder]
+        predictedDurations = [predictedDurations[jobIndex] for jobIndex in
+                              jobOrder]
+
+    # The indices of the solutions whose remaining cases are skipped, and
+    # the indices of the jobs whose results have been emitted
+    failedSolutions = set()
+    finishedJobs = set()
+
+    def test_job(job):
+        solutionIndex, case = job
+        if solutionIndex in failedSolutions:
+            return _get_skipped_result(solutions[solutionIndex], case,
+                    SOLUTION_FAILED_MESSAGE)
+        return _test_solution_against_case(solutions[solutionIndex], case,
+                options)
+
+    async def test_job_async(job):
+        solutionIndex, case = job
+        if solutionIndex in failedSolutions:
+            return _get_skipped_result(solutions[solutionIndex], case,
+                    SOLUTION_FAILED_MESSAGE)
+        return await _test_solution_against_case_async(
+                solutions[solutionIndex], case, options)
+
+    def emit_job_result(jobIndex, result):
+        if not resultStore is None:
+            resultStore.record_result(result)
+        if not durationStore is None:
+            durationStore.record_result(result)
+        finishedJobs.add(jobIndex)
+        add_result(jobPositions[jobIndex], result)
+
+        skipMessage = options.get_skip_message(result)
+        if skipMessage == SOLUTION_FAILED_MESSAGE:
+            failedSolutions.add(jobs[jobIndex][0])
+        return skipMessage == RUN_STOPPED_MESSAGE
+
+    startTime = time.monotonic()
+    if not stopped and engine == ExecutionEngine.ASYNC:
+        stopped = run_jobs_async(jobs, test_job_async, jobCount,
+                emit_job_result)
+    elif not stopped:
+        stopped = run_jobs(jobs, test_job, jobCount, emit_job_result,
+                cancelFunction=kill_running_processes)
+    makespan = time.monotonic() - startTime
+
+    # Jobs that never finished were cancelled when a failure stopped the run
+    for jobIndex, (solutionIndex, case) in enumerate(jobs):
+        if not jobIndex in finishedJobs:
+            add_result(jobPositions[jobIndex], _get_skipped_result(
+                solutions[solutionIndex], case, RUN_STOPPED_MESSAGE))
+
+    if not predictedDurations is None and not stopped:
+        _print_makespan(get_makespan(predictedDurations, jobCount),
+                get_makespan_lower_bound(predictedDurations, jobCount),
+                makespan)
+
+def _print_makespan(predictedMakespan: float, lowerBound: float,
+        actualMakespan: float):
+    """
+    Prints the time that running every solution/case pair was predicted to
+    take and the time it took
+
+    Arguments:
+    predictedMakespan: float - The predicted time of the run, in seconds
+    lowerBound: float        - The least time any order of the pairs could
+                               have been predicted to take
+    actualMakespan: float    - The time the run took
+    """
+    print()
+    print("Makespan: {:.3f}s predicted (lower bound {:.3f}s), {:.3f}s "
+          "actual".format(predictedMakespan, lowerBound, actualMakespan))
 
 def test(writerNames: list, languageNames: list, problemStrings: list, 
-        outputToStderr: bool, printPassingCases: bool, printDiff: bool):
+        outputToStderr: bool, printPassingCases: bool, diffMode: str,
+        jobCount: int=1, engine: str=ExecutionEngine.BLOCKING,
+        incremental: bool=False, useHarness: bool=False,
+        printSummary: bool=False, failFast: bool=False,
+        stopSolutionOnFail: bool=False, jsonLinesPath: str=None,
+        junitPath: str=None, recordHistory: bool=True, repeatCount: int=1,
+        baselineRunId: int=None,
+        noiseThreshold: float=DEFAULT_NOISE_THRESHOLD) -> int:
     """
     Tests solutions based on the arguments provided and outputs results to
     stdout. If all arguments are none, all solutions are tested
@@ -204,23 +828,151 @@ def test(writerNames: list, languageNames: list, problemStrings: list,
     writerNames: list    - The list of writer names to test solutions for
     languageNames: list  - The list of language names to test solutions for
     problemStrings: list - The list of problem strings to test solutions for
+    diffMode: str        - The DiffMode of the diffs printed for failing
+                           cases, or None to print none
+    jobCount: int        - The number of solution/case pairs to run at once
+    engine: str          - The ExecutionEngine used to run the solutions
+    incremental: bool    - Whether to reuse passing results of unchanged
+                           solution/case pairs from previous runs
+    useHarness: bool     - Whether to run solutions in their language's
+                           harness when they support one
+    printSummary: bool   - Whether to print the min/median/max time and
+                           memory of each problem after testing
+    failFast: bool       - Whether to stop the whole run at the first
+                           failure, reporting every case left as not run
+    stopSolutionOnFail: bool - Whether to skip the remaining cases of a
+                           solution once it fails one
+    jsonLinesPath: str   - The JSON Lines file to stream results to, or None
+    junitPath: str       - The JUnit XML file to stream results to, or None
+    recordHistory: bool  - Whether to record the run in the history database
+    repeatCount: int     - The number of times to run each passing case
+    baselineRunId: int   - The id of the recorded run to compare timings
+                           with, or None
+    noiseThreshold: float - The fraction of the baseline time by which a
+                           case must be slower to be a regression
+
+    Return:
+    The number of cases that regressed against the baseline
     """
     solutionsToTest = _get_filtered_solutions(writerNames, languageNames, 
             problemStrings)
+    baselineSamples = (None if baselineRunId is None else
+                       _load_baseline_samples(baselineRunId))
+    resultSinks = ResultSinks.open_sinks(jsonLinesPath, junitPath)
+    if recordHistory:
+        resultHistory = ResultHistory.open()
+        resultHistory.start_run(jobCount=jobCount, engine=engine)
+        resultSinks.append(resultHistory)
+    options = TestOptions(outputToStderr=outputToStderr, 
+            printPassingCases=printPassingCases, diffMode=diffMode,
+            useHarness=useHarness,
+            timingSummary=(TimingSummary() if printSummary else None),
+            failFast=failFast, stopSolutionOnFail=stopSolutionOnFail,
+            resultSinks=resultSinks, repeatCount=repeatCount,
+            baselineSamples=baselineSamples, noiseThreshold=noiseThreshold)
 
     # load all the cases
     cases = CaseManager.get_all_cases()
 
+    resultStore = ResultStore.load() if incremental else None
+    durationStore = DurationStore.load()
+    try:
+        if jobCount > 1 or engine == ExecutionEngine.ASYNC:
+            _test_solutions_in_parallel(solutionsToTest, cases, jobCount, 
+                    engine, options, resultStore=resultStore,
+                    durationStore=durationStore)
+        else:
+            # Now test all of the solutions
+            stopped = False
+            for solution in solutionsToTest:
+                solutionCases = cases.get(int(solution.problemNumber), [])
+                if stopped:
+                    _report_skipped_results(solution, solutionCases,
+                            RUN_STOPPED_MESSAGE, options)
+                else:
+                    stopped = _test_solution_against_cases(solution,
+                            solutionCases, options, resultStore=resultStore,
+                            durationStore=durationStore)
+    finally:
+        Harnesses.close_all()
+        Zygotes.close_all()
+        if not resultStore is None:
+            resultStore.save()
+        durationStore.save()
+        for resultSink in options.resultSinks:
+            resultSink.close()
+
+    if not options.timingSummary is None:
+        _print_timing_summary(options.timingSummary)
+
+    if not baselineRunId is None:
+        print()
+        print('{} cases regressed against run {}'.format(
+            options.regressionCount, baselineRunId))
+    return options.regressionCount
+
+def _load_baseline_samples(baselineRunId: int) -> dict:
+    """
+    Loads the CPU times of a recorded run to compare a test run with,
+    warning if the run measured its cases too few times for slowdowns to be
+    significant
+
+    Arguments:
+    baselineRunId: int - The id of the recorded run
 
-    # Now test all of the solutions
-    for solution in solutionsToTest:
-        _test_solution_against_cases(solution, cases[int(solution.problemNumber)],
-                outputToStderr, printPassingCases, printDiff)
+    Return:
+    The samples given by ResultHistory.get_run_cpu_samples
+    """
+    resultHistory = ResultHistory.open()
+    try:
+        if not resultHistory.has_run(baselineRunId):
+            raise PyCException('Error: {} is not a recorded test run'.format(
+                baselineRunId))
+        baselineSamples = resultHistory.get_run_cpu_samples(baselineRunId)
+    finally:
+        resultHistory.close()
+
+    if max((len(samples) for samples in baselineSamples.values()),
+            default=0) < 2:
+        print('Warning: run {} measured each case once, so few slowdowns can '
+              'be significant. Record baselines with --repeat'.format(
+                  baselineRunId))
+    return baselineSamples
+
+def _print_timing_summary(timingSummary):
+    """
+    Prints the min, median and max of the slowest case of every solution of
+    each problem
+
+    Arguments:
+    timingSummary - The TimingSummary of the run
+    """
+    formattingStr = "{0: <10}\t{1: <10}\t{2: <10}\t{3: <10}\t{4: <10}\t{5}"
+    measurementNames = {
+            'cpuTime'    : ('CPU(s)', 1, 3),
+            'wallTime'   : ('Wall(s)', 1, 3),
+            'peakMemory' : ('Mem(MB)', BYTES_PER_MEGABYTE, 1)
+            }
+
+    print()
+    print(formattingStr.format("Problem", "Measure", "Min", "Median", "Max",
+        "Solutions"))
+    for problemNumber, problemSummary in sorted(
+            timingSummary.get_summary().items(), key=lambda item: int(item[0])):
+        for measurement in TimingSummary.MEASUREMENTS:
+            if not measurement in problemSummary:
+                continue
+            name, scale, precision = measurementNames[measurement]
+            minimum, median, maximum, count = problemSummary[measurement]
+            print(formattingStr.format(problemNumber, name,
+                _format_measurement(minimum, scale, precision),
+                _format_measurement(median, scale, precision),
+                _format_measurement(maximum, scale, precision), count))
 
 def _print_header_if_not_printed():
     global headerPrinted
     if not headerPrinted:
-        formattingStr = "{0: <10}\t{1: <10}\t{2: <10}\t{3: <10}\t{4: <10}\t{5: <10}\t{6}"
-        print(formattingStr.format("Writer", "Problem", "Language", "CaseType", "Case", "Status", "Message"))
+        print(RESULT_FORMATTING_STR.format("Writer", "Problem", "Language",
+            "CaseType", "Case", "Status", "CPU(s)", "Wall(s)", "Mem(MB)",
+            "Message"))
         headerPrinted = True
-
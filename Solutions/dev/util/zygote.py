@@ -0,0 +1,333 @@
+################################################################################
+# Filename: util/zygote.py
+# Date:     16 October 2026
+#
+# Contains the Zygote class, which runs cases as children forked by a small,
+# long-lived helper process instead of by the runner, and the Zygotes class,
+# which keeps the zygote of every worker thread
+################################################################################
+from util import fileops
+from util.process import InputFile, ProcessResult, materialize_input, \
+        open_output_file, read_output_file, track_process, forget_process, \
+        CHUNK_SIZE
+import json
+import os
+import resource
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+class ZygoteSpawnError(OSError):
+    """
+    Raised when a zygote could not start a case, leaving the zygote itself
+    ready for the next one
+    """
+    pass
+
+class _ZygoteChild:
+    """
+    A case started by a zygote, which kill_running_processes may kill. Only
+    the zygote knows when it has reaped the case, after which its pid may
+    belong to another process, so the zygote is asked to kill it instead
+    """
+
+    def __init__(self, zygote):
+        self._zygote = zygote
+        self._lock = threading.Lock()
+        self._exited = False
+
+    def kill(self):
+        with self._lock:
+            if not self._exited:
+                self._zygote._send_kill()
+
+    def set_exited(self):
+        with self._lock:
+            self._exited = True
+
+class Zygote:
+    """
+    Manages a zygote process, which speaks over one end of a Unix socket
+    pair. Every request is a line of JSON, sent with the descriptors of the
+    standard input, output and error of the case:
+
+    request:  {"kind" : "python" or "native", "argv" : [...],
+               "rlimits" : [[resource, soft limit, hard limit], ...]}
+    response: "STARTED <pid>" or "ERROR <message>", then
+              "EXITED <wait status> <cpu seconds> <peak bytes>"
+
+    Until the case has exited, the runner may send "KILL" lines, on which the
+    zygote kills the case. A KILL that crosses EXITED is ignored.
+
+    Python cases are run by a child forked from the zygote's interpreter,
+    which has already loaded the modules the script imports. Native cases
+    are spawned from the zygote with posix_spawn: the zygote applies the
+    limits of its first native case to itself, for its children to inherit,
+    and limits the CPU time of each child once it is spawned. Native cases
+    with other limits, or limits the zygote cannot apply to itself, are
+    forked. The case writes its output into an in-memory file, which is
+    compared once it exits, as in IOMode.FILE.
+
+    CPU time and peak memory are those of the child alone, so Python cases do
+    not pay for starting the interpreter but do count the pages they share
+    with the zygote. A zygote that fails is restarted for the next case.
+    """
+    KIND_PYTHON = 'python'
+    KIND_NATIVE = 'native'
+
+    KILL_MESSAGE = b'KILL\n'
+
+    SERVER_SCRIPT = fileops.join_path(fileops.get_parent_dir(
+        os.path.abspath(__file__)), 'zygote_server.py')
+    STARTUP_TIMEOUT_SECONDS = 20
+
+    def __init__(self, interpreter: str):
+        self._interpreter = interpreter
+        self._process = None
+        self._connection = None
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+
+    def _start(self):
+        connection, zygoteConnection = socket.socketpair()
+        try:
+            self._process = subprocess.Popen([self._interpreter,
+                self.SERVER_SCRIPT, str(zygoteConnection.fileno())],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                pass_fds=[zygoteConnection.fileno()])
+        except BaseException:
+            connection.close()
+            raise
+        finally:
+            zygoteConnection.close()
+        self._connection = connection
+        self._buffer = bytearray()
+
+        if not self._read_line(time.monotonic() +
+                self.STARTUP_TIMEOUT_SECONDS) == 'READY':
+            self._stop()
+            raise OSError('The zygote of {} did not start'.format(
+                self._interpreter))
+
+    def _stop(self):
+        if not self._connection is None:
+            self._connection.close()
+            self._connection = None
+        if not self._process is None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+
+    def close(self):
+        with self._lock:
+            self._stop()
+
+    def _read_line(self, deadline: float=None) -> str:
+        """
+        Reads a line sent by the zygote, or returns None once deadline passes
+
+        :raises OSError: If the zygote exited
+        """
+        while not b'\n' in self._buffer:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if not remaining is None and remaining <= 0:
+                return None
+            self._connection.settimeout(remaining)
+            try:
+                data = self._connection.recv(CHUNK_SIZE)
+            except socket.timeout:
+                return None
+            if len(data) == 0:
+                raise OSError('The zygote of {} exited'.format(
+                    self._interpreter))
+            self._buffer.extend(data)
+
+        line, _, self._buffer = self._buffer.partition(b'\n')
+        return line.decode('utf-8')
+
+    def _send_request(self, request: dict, stdinFd: int, stdoutFd: int,
+            stderrFd: int):
+        if self._process is None or not self._process.poll() is None:
+            self._stop()
+            self._start()
+        socket.send_fds(self._connection, [(json.dumps(request) +
+            '\n').encode('utf-8')], [stdinFd, stdoutFd, stderrFd])
+
+    def _send_kill(self):
+        """
+        Asks the zygote to kill the case it is running. Called from any
+        thread while the case runs, so it only ever writes to the socket
+        """
+        try:
+            self._connection.sendall(self.KILL_MESSAGE)
+        except (OSError, AttributeError):
+            # The zygote has exited or been stopped, and its case with it
+            pass
+
+    def _run_case(self, request: dict, inputContents: InputFile,
+            outputFd: int, stderr, timeout: float) -> tuple:
+        """
+        Has the zygote start the case of the request and waits for it to
+        exit, killing it after timeout seconds
+
+        :return: (wait status, cpu seconds, peak bytes, wall seconds,
+                  whether it timed out)
+        """
+        stdinFd = os.open(inputContents.path, os.O_RDONLY)
+        stderrFd = (os.open(os.devnull, os.O_WRONLY) if
+                stderr == subprocess.DEVNULL else sys.stderr.fileno())
+        try:
+            self._send_request(request, stdinFd, outputFd, stderrFd)
+        finally:
+            os.close(stdinFd)
+            if stderr == subprocess.DEVNULL:
+                os.close(stderrFd)
+
+        status, _, message = self._read_line().partition(' ')
+        if not status == 'STARTED':
+            raise ZygoteSpawnError(message)
+        startTime = time.monotonic()
+        child = _ZygoteChild(self)
+        track_process(child)
+        try:
+            line = self._read_line(None if timeout is None else
+                    startTime + timeout)
+            timedOut = line is None
+            if timedOut:
+                child.kill()
+                line = self._read_line()
+        finally:
+            child.set_exited()
+            forget_process(child)
+        wallTime = time.monotonic() - startTime
+
+        _, waitStatus, cpuTime, peakMemory = line.split(' ')
+        return (int(waitStatus), float(cpuTime), int(peakMemory), wallTime,
+                timedOut)
+
+    def run(self, kind: str, argv: list, inputContents, timeout: float=None,
+            stderr=subprocess.DEVNULL, rlimits: list=None,
+            outputLimit: int=None, comparator=None) -> ProcessResult:
+        """
+        Runs a case in a child of the zygote like run_process, feeding it
+        inputContents, bytes or an InputFile
+
+        :param kind: KIND_PYTHON to run the script argv[0] in the forked
+                     interpreter, or KIND_NATIVE to run the program argv[0]
+        :param rlimits: The rlimits to apply in the child, as given by
+                        Limits.get_rlimits
+        :raises OSError: If the zygote could not run the case
+        """
+        if not isinstance(inputContents, InputFile):
+            inputContents = materialize_input(inputContents)
+        rlimits = list(rlimits or [])
+        if not outputLimit is None:
+            _, hard = resource.getrlimit(resource.RLIMIT_FSIZE)
+            rlimits.append((resource.RLIMIT_FSIZE, (outputLimit + 1 if hard ==
+                resource.RLIM_INFINITY else min(outputLimit + 1, hard), hard)))
+        request = {'kind' : kind, 'argv' : argv, 'rlimits' : [[rlimit, soft,
+            hard] for rlimit, (soft, hard) in rlimits]}
+
+        outputFd = open_output_file()
+        try:
+            with self._lock:
+                try:
+                    waitStatus, cpuTime, peakMemory, wallTime, timedOut = \
+                            self._run_case(request, inputContents, outputFd,
+                                    stderr, timeout)
+                except ZygoteSpawnError:
+                    raise
+                except BaseException:
+                    # The zygote is in an unknown state, so it is restarted
+                    self._stop()
+                    raise
+
+            output = bytearray()
+            outputExceeded = read_output_file(outputFd, output, comparator,
+                    outputLimit)
+        finally:
+            os.close(outputFd)
+
+        return ProcessResult(os.waitstatus_to_exitcode(waitStatus),
+                bytes(output), cpuTime, wallTime, peakMemory,
+                timedOut=timedOut, outputExceeded=outputExceeded)
+
+class Zygotes:
+    """
+    Keeps a zygote per worker thread and interpreter, started on demand, for
+    the languages whose "launcher" in languages.json is "python" or "native".
+    Python zygotes are started with the language's interpreter, while native
+    programs are spawned from a zygote of the runner's own interpreter, one
+    per set of limits so that each zygote can spawn its cases with the
+    limits it applied to itself. Zygotes are only used once enabled, with
+    --zygote
+    """
+    _enabled = False
+    _zygotes = {} # {(thread id, interpreter, limits) : Zygote}
+    _lock = threading.Lock()
+
+    @classmethod
+    def set_enabled(cls, enabled: bool):
+        cls._enabled = enabled
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    def supports(cls, launcher: str, runCommand: list) -> bool:
+        """
+        Whether a run command can be run by a zygote of the launcher. Python
+        scripts are only run when the script is the first argument, as
+        interpreter options cannot be applied to a running interpreter
+        """
+        if launcher == Zygote.KIND_NATIVE:
+            return True
+        return launcher == Zygote.KIND_PYTHON and len(runCommand) > 1 and \
+                not runCommand[1].startswith('-')
+
+    @classmethod
+    def get_zygote(cls, interpreter: str, limits: tuple=None) -> Zygote:
+        """
+        Gets the zygote of the calling thread for the interpreter and, for
+        native zygotes, the limits of their cases
+        """
+        key = (threading.get_ident(), interpreter, limits)
+        with cls._lock:
+            if not key in cls._zygotes:
+                cls._zygotes[key] = Zygote(interpreter)
+            return cls._zygotes[key]
+
+    @classmethod
+    def run_process(cls, launcher: str, runCommand: list, inputContents,
+            timeout: float=None, stderr=subprocess.DEVNULL,
+            rlimits: list=None, outputLimit: int=None,
+            comparator=None) -> ProcessResult:
+        """
+        Runs the command in the calling thread's zygote of the launcher, like
+        run_process
+        """
+        if launcher == Zygote.KIND_PYTHON:
+            zygote = cls.get_zygote(runCommand[0])
+            argv = runCommand[1:]
+        else:
+            zygote = cls.get_zygote(sys.executable, (tuple(rlimits or []),
+                outputLimit))
+            argv = runCommand
+        return zygote.run(launcher, argv, inputContents, timeout,
+                stderr=stderr, rlimits=rlimits, outputLimit=outputLimit,
+                comparator=comparator)
+
+    @classmethod
+    def close_all(cls):
+        """
+        Stops every running zygote
+        """
+        with cls._lock:
+            zygotes = list(cls._zygotes.values())
+            cls._zygotes = {}
+
+        for zygote in zygotes:
+            zygote.close()
@@ -0,0 +1,356 @@
+################################################################################
+# Filename: util/zygote_server.py
+# Date:     16 October 2026
+#
+# The zygote, a small process which forks a fresh child for every case it is
+# sent over a Unix socket. Python scripts are run in the forked child by the
+# already started interpreter, with the modules they import loaded beforehand,
+# and native programs are spawned from the zygote rather than from the much
+# larger runner. Run as
+# $ python3 zygote_server.py <socket descriptor>
+#
+# This file is executed by the solution's interpreter, so it must not import
+# anything from util
+################################################################################
+import ast
+import atexit
+import importlib.util
+import json
+import os
+import resource
+import runpy
+import select
+import signal
+import socket
+import sys
+import threading
+import traceback
+
+KIND_PYTHON = 'python'
+KIND_NATIVE = 'native'
+
+MAX_REQUEST_BYTES = 1 << 16
+KILL_MESSAGE = b'KILL\n'
+
+# How often the peak memory of a child is sampled, and how often a child is
+# polled for its exit where its exit cannot be waited for
+MEMORY_POLL_SECONDS = 0.01
+EXIT_POLL_SECONDS = 0.001
+STATUS_PATH_FORMAT = '/proc/{}/status'
+PEAK_MEMORY_FIELD = b'VmHWM:'
+
+# The modules the zygote tried to load, whether or not they could be
+_preloadedModules = set()
+# The rlimits the zygote applied to itself, which the native programs it
+# spawns inherit, or None before the first native case
+_ownRlimits = None
+
+def write_line(connection, line: str):
+    connection.sendall((line + '\n').encode('utf-8'))
+
+def read_request(connection):
+    """
+    Reads a single request and the descriptors sent with it, the standard
+    input, output and error of the case, returning None once the runner
+    closes the socket. KILL lines sent as the last case exited are skipped
+    """
+    data = b''
+    fds = []
+    while len(data) == 0 or not data.endswith(b'\n'):
+        more, moreFds, _, _ = socket.recv_fds(connection, MAX_REQUEST_BYTES, 3)
+        for fd in moreFds:
+            os.set_inheritable(fd, False)
+        fds.extend(moreFds)
+        if len(more) == 0:
+            for fd in fds:
+                os.close(fd)
+            return None
+        data += more
+        while data.startswith(KILL_MESSAGE):
+            data = data[len(KILL_MESSAGE):]
+    return (json.loads(data.decode('utf-8')), fds)
+
+def get_imported_modules(path: str) -> list:
+    """
+    Gets the top-level modules imported by the script at path, leaving out
+    the ones the script's own directory would provide
+    """
+    try:
+        with open(path, 'rb') as scriptFile:
+            tree = ast.parse(scriptFile.read(), path)
+    except (OSError, SyntaxError, ValueError):
+        return []
+
+    directory = os.path.dirname(os.path.abspath(path))
+    moduleNames = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            moduleNames.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and \
+                not node.module is None:
+            moduleNames.append(node.module)
+
+    return [moduleName for moduleName in moduleNames if not
+            os.path.exists(os.path.join(directory, moduleName.split('.')[0]
+                + '.py')) and not os.path.isdir(os.path.join(directory,
+                    moduleName.split('.')[0]))]
+
+def preload_modules(path: str):
+    """
+    Imports the modules the script at path imports, where possible, so that
+    every child forked to run it starts with them loaded
+    """
+    for moduleName in get_imported_modules(path):
+        if moduleName in _preloadedModules:
+            continue
+        _preloadedModules.add(moduleName)
+        try:
+            if not importlib.util.find_spec(moduleName) is None:
+                importlib.import_module(moduleName)
+        except BaseException:
+            pass
+    sys.stdout.flush()
+
+def get_exit_code(e: SystemExit) -> int:
+    """
+    Gets the exit code of a script that raised SystemExit, the way the
+    interpreter does
+    """
+    if e.code is None:
+        return 0
+    if isinstance(e.code, int):
+        return e.code
+    sys.stderr.write(str(e.code) + '\n')
+    return 1
+
+def run_script(argv: list) -> int:
+    """
+    Runs the script at argv[0] as __main__ in this forked child
+
+    :return: The exit code of the script
+    """
+    sys.argv = list(argv)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(argv[0])))
+    try:
+        runpy.run_path(argv[0], run_name='__main__')
+        exitCode = 0
+    except SystemExit as e:
+        exitCode = get_exit_code(e)
+    except BaseException:
+        traceback.print_exc()
+        exitCode = 1
+
+    # As the interpreter does when it finalizes, non-daemon threads are
+    # joined before the exit functions run and the streams are flushed
+    try:
+        threading._shutdown()
+    except BaseException:
+        traceback.print_exc()
+        exitCode = exitCode or 1
+    atexit._run_exitfuncs()
+    try:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    except BaseException:
+        # The interpreter exits with 120 when its streams cannot be flushed
+        exitCode = exitCode or 120
+    return exitCode
+
+def run_child(request: dict, fds: list, connection):
+    """
+    Becomes the case in the forked child, never returning
+    """
+    exitCode = 1
+    try:
+        for targetFd, fd in enumerate(fds):
+            os.dup2(fd, targetFd)
+        for fd in fds:
+            os.close(fd)
+        connection.close()
+        for rlimit, soft, hard in request['rlimits']:
+            resource.setrlimit(rlimit, (soft, hard))
+
+        if request['kind'] == KIND_NATIVE:
+            exitCode = 127
+            os.execvp(request['argv'][0], request['argv'])
+        exitCode = run_script(request['argv'])
+    except BaseException:
+        traceback.print_exc()
+    os._exit(exitCode & 0xff)
+
+def get_address_space() -> int:
+    """
+    Gets the size of the address space of the zygote, or None if it is not
+    known
+    """
+    try:
+        with open('/proc/self/statm') as statmFile:
+            return int(statmFile.read().split()[0]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        return None
+
+def can_spawn(request: dict) -> bool:
+    """
+    Whether the native program of the request can be spawned without forking
+    the zygote. Every limit but the CPU time, which counts from the start of
+    the child, is inherited from the zygote, so the zygote applies the limits
+    of its first native case to itself and spawns every case with the same
+    limits. Address space limits are only applied when the zygote itself
+    fits in them with room to spare
+    """
+    global _ownRlimits
+    if not hasattr(os, 'posix_spawnp') or not hasattr(resource, 'prlimit'):
+        return False
+
+    rlimits = [rlimit for rlimit in request['rlimits'] if not rlimit[0] ==
+            resource.RLIMIT_CPU]
+    if _ownRlimits is None:
+        addressSpace = get_address_space()
+        for rlimit, soft, _ in rlimits:
+            if rlimit == resource.RLIMIT_AS and (addressSpace is None or
+                    soft < 2 * addressSpace):
+                return False
+        try:
+            for rlimit, soft, hard in rlimits:
+                resource.setrlimit(rlimit, (soft, hard))
+        except (OSError, ValueError):
+            return False
+        _ownRlimits = rlimits
+
+    return rlimits == _ownRlimits
+
+def spawn_child(request: dict, fds: list) -> int:
+    """
+    Spawns a native program without forking the zygote, then limits its CPU
+    time
+
+    :return: The pid of the child
+    """
+    pid = os.posix_spawnp(request['argv'][0], request['argv'], os.environ,
+            file_actions=[(os.POSIX_SPAWN_DUP2, fd, targetFd) for targetFd,
+                fd in enumerate(fds)])
+    for rlimit, soft, hard in request['rlimits']:
+        if rlimit == resource.RLIMIT_CPU:
+            try:
+                resource.prlimit(pid, rlimit, (soft, hard))
+            except ProcessLookupError:
+                pass
+    return pid
+
+def get_peak_memory(rusage) -> int:
+    # ru_maxrss is in kilobytes, except on macOS where it is in bytes
+    return rusage.ru_maxrss if sys.platform == 'darwin' else \
+            rusage.ru_maxrss * 1024
+
+def sample_peak_memory(pid: int, peakMemory: int) -> int:
+    """
+    Gets the greater of peakMemory and the high-water mark of the memory of
+    the unreaped child, or peakMemory if it cannot be read
+    """
+    try:
+        with open(STATUS_PATH_FORMAT.format(pid), 'rb') as statusFile:
+            for line in statusFile:
+                if line.startswith(PEAK_MEMORY_FIELD):
+                    return max(peakMemory, int(line.split()[1]) * 1024)
+    except (OSError, ValueError, IndexError):
+        pass
+    return peakMemory
+
+def open_pidfd(pid: int):
+    if not hasattr(os, 'pidfd_open'):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except OSError:
+        return None
+
+def wait_for_child(pid: int, connection) -> tuple:
+    """
+    Waits for the child to exit, killing it if the runner sends KILL or
+    closes the socket. Only the zygote reaps its children, so a child it
+    kills has not been reaped and its pid is still its own.
+
+    As in util/process.py, a child's ru_maxrss includes the peak memory of
+    the zygote, so the peak of a child smaller than that is the high-water
+    mark sampled every MEMORY_POLL_SECONDS while it runs
+
+    :return: (wait status, cpu seconds, peak bytes), or None if the runner
+             closed the socket
+    """
+    inheritedPeak = get_peak_memory(resource.getrusage(resource.RUSAGE_SELF))
+    sampledPeak = sample_peak_memory(pid, 0) if os.path.isfile(
+            STATUS_PATH_FORMAT.format('self')) else None
+    pidfd = open_pidfd(pid)
+    runnerClosed = False
+    try:
+        while True:
+            readable, _, _ = select.select([connection] + ([] if pidfd is None
+                else [pidfd]), [], [], EXIT_POLL_SECONDS if pidfd is None else
+                MEMORY_POLL_SECONDS)
+            if connection in readable:
+                runnerClosed = runnerClosed or len(connection.recv(
+                    MAX_REQUEST_BYTES)) == 0
+                os.kill(pid, signal.SIGKILL)
+            if runnerClosed:
+                os.wait4(pid, 0)
+                return None
+
+            if not sampledPeak is None:
+                sampledPeak = sample_peak_memory(pid, sampledPeak)
+            waitedPid, status, rusage = os.wait4(pid, os.WNOHANG)
+            if waitedPid == pid:
+                break
+    finally:
+        if not pidfd is None:
+            os.close(pidfd)
+
+    peakMemory = get_peak_memory(rusage)
+    if not sampledPeak is None and peakMemory <= inheritedPeak:
+        peakMemory = sampledPeak
+    return (status, rusage.ru_utime + rusage.ru_stime, peakMemory)
+
+def handle_request(request: dict, fds: list, connection):
+    """
+    Starts the case of the request, reports its pid, waits for it and reports
+    how it exited
+    """
+    if request['kind'] == KIND_PYTHON:
+        preload_modules(request['argv'][0])
+
+    try:
+        if request['kind'] == KIND_NATIVE and can_spawn(request):
+            pid = spawn_child(request, fds)
+        else:
+            pid = os.fork()
+            if pid == 0:
+                run_child(request, fds, connection)
+    except OSError as e:
+        write_line(connection, 'ERROR {}'.format(e))
+        return
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+    write_line(connection, 'STARTED {}'.format(pid))
+    exited = wait_for_child(pid, connection)
+    if not exited is None:
+        write_line(connection, 'EXITED {} {} {}'.format(*exited))
+
+def main(arguments):
+    # Solutions are looked up from their own directory, never from util
+    sys.path.pop(0)
+    connection = socket.socket(fileno=int(arguments[0]))
+    connection.set_inheritable(False)
+    write_line(connection, 'READY')
+
+    while True:
+        try:
+            request = read_request(connection)
+        except OSError:
+            return 0
+        if request is None:
+            return 0
+        handle_request(request[0], request[1], connection)
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))